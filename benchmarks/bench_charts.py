@@ -0,0 +1,87 @@
+# Benchmark dos modos de renderização do gráfico de linhas (portfolio.figures.line_figure)
+#
+# Para séries de 10 mil, 100 mil e 1 milhão de pontos compara:
+#   - svg/json:     Scatter (SVG) com listas JSON, como o plotly serializa listas Python
+#   - svg/binário:  Scatter (SVG) com typed arrays em base64
+#   - webgl/binário: Scattergl com typed arrays em base64 (modo "auto" acima de WEBGL_POINTS)
+# e mede o tempo de construção da figura, o tempo de serialização (o mesmo
+# plotly.io.to_json usado por st.plotly_chart) e o tamanho do spec enviado ao navegador.
+# O tempo de desenho no navegador não é medido aqui (não há navegador no AppTest).
+#
+# Uso:
+#   python benchmarks/bench_charts.py
+#   python benchmarks/bench_charts.py --sizes 10000 100000
+import argparse
+import statistics
+import time
+
+import harness  # noqa: F401 (coloca a raiz do repositório no sys.path)
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from portfolio.figures import line_figure
+
+SIZES = [10_000, 100_000, 1_000_000]
+
+
+# Série sintética com um ponto por minuto
+def make_series(points, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "Data": pd.date_range("2022-01-01", periods=points, freq="min"),
+        "Vendas": np.cumsum(rng.normal(0, 1, points)).round(2),
+    })
+
+
+# Figura equivalente com os vetores convertidos em listas (datas em texto ISO)
+def json_list_figure(series, x, y, markers=False):
+    fig = go.Figure([
+        go.Scatter(
+            x=series[x].dt.strftime("%Y-%m-%dT%H:%M:%S").tolist(),
+            y=series[metric].tolist(),
+            name=metric,
+            mode="lines+markers" if markers else "lines",
+        )
+        for metric in y
+    ])
+    return fig
+
+
+MODES = {
+    "svg/json": lambda series: json_list_figure(series, "Data", ["Vendas"]),
+    "svg/binário": lambda series: line_figure(series, "Data", ["Vendas"], markers=False, render_mode="svg"),
+    "webgl/binário": lambda series: line_figure(series, "Data", ["Vendas"], markers=False, render_mode="webgl"),
+}
+
+
+# Função para medir um modo: tempos medianos (ms) e bytes do spec
+def measure(build, series, repeat):
+    build_ms, serialize_ms = [], []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fig = build(series)
+        built = time.perf_counter()
+        spec = pio.to_json(fig, validate=False)
+        build_ms.append((built - start) * 1000)
+        serialize_ms.append((time.perf_counter() - built) * 1000)
+    return statistics.median(build_ms), statistics.median(serialize_ms), len(spec.encode("utf-8"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dos modos de renderização de gráficos")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'Pontos':>10} {'Modo':<14} {'construção ms':>14} {'serialização ms':>16} {'KB':>10}")
+    for points in args.sizes:
+        series = make_series(points)
+        for mode, build in MODES.items():
+            build_ms, serialize_ms, size = measure(build, series, args.repeat)
+            print(f"{points:>10} {mode:<14} {build_ms:>14.1f} {serialize_ms:>16.1f} {size / 1024:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# Benchmark do fragmento do Dashboard Demo: custo de uma mudança de filtro antes e depois
+#
+# Antes do fragmento, mover "Mês Inicial"/"Mês Final" reexecutava o app.py inteiro
+# (CSS, barra lateral com imagens e badges, menu, carga dos dados e o painel). Com
+# @st.fragment, o navegador pede só o rerun do painel. O AppTest sempre executa o
+# script inteiro, então os dois custos vêm da mesma execução, medidos pela
+# instrumentação de portfolio.profiling (PORTFOLIO_PROFILE=1):
+#   - antes:  seção "rerun/app.py" (o script completo) e bytes de todos os elementos
+#   - depois: seção "fragment/Painel do Dashboard" e bytes dos elementos do painel
+#
+# Uso:
+#   python benchmarks/bench_fragments.py
+#   python benchmarks/bench_fragments.py --repeat 10
+import argparse
+import os
+import statistics
+
+os.environ["PORTFOLIO_PROFILE"] = "1"
+
+from harness import iter_nodes, new_app, payload_bytes, run_checked
+from bench_reruns import dashboard_ranges
+
+from portfolio.profiling import get_profiler
+
+# Seções do perfil comparadas
+FULL_RERUN = ("rerun", "app.py")
+FRAGMENT = ("fragment", "Painel do Dashboard")
+
+# Título que abre o painel (primeiro elemento do fragmento na área principal)
+PANEL_HEADING = "### Filtros"
+
+
+# Função para ler o tempo acumulado (s) de uma seção do perfil
+def section_seconds(key):
+    return get_profiler().stats.get(key, {}).get("seconds", 0.0)
+
+
+# Função para somar os bytes dos elementos de uma subárvore
+def subtree_bytes(node):
+    return sum(
+        child.proto.ByteSize()
+        for child in iter_nodes(node)
+        if getattr(child, "proto", None) is not None and hasattr(child.proto, "ByteSize")
+    )
+
+
+# Função para somar os bytes do painel: o bloco da área principal que contém o título
+# "Filtros" (o fragmento é renderizado dentro do seu próprio contêiner)
+def panel_bytes(at):
+    for child in at.main.children.values():
+        if any(getattr(getattr(node, "proto", None), "body", None) == PANEL_HEADING for node in iter_nodes(child)):
+            return subtree_bytes(child)
+    raise RuntimeError("Painel do Dashboard não encontrado")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Custo de uma mudança de filtro no Dashboard Demo")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    at = new_app("Dashboard Demo")
+    run_checked(at)
+
+    print(f"{'Intervalo':<10} {'script ms':>10} {'painel ms':>10} {'script B':>10} {'painel B':>10}")
+    for start, end in dashboard_ranges(at):
+        full_ms, panel_ms = [], []
+        for _ in range(args.repeat):
+            at.select_slider[0].set_value(start)
+            at.select_slider[1].set_value(end)
+            full_before, panel_before = section_seconds(FULL_RERUN), section_seconds(FRAGMENT)
+            run_checked(at)
+            full_ms.append((section_seconds(FULL_RERUN) - full_before) * 1000)
+            panel_ms.append((section_seconds(FRAGMENT) - panel_before) * 1000)
+        print(
+            f"{start + '-' + end:<10} {statistics.median(full_ms):>10.1f} {statistics.median(panel_ms):>10.1f}"
+            f" {payload_bytes(at):>10} {panel_bytes(at):>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
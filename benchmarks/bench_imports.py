@@ -0,0 +1,144 @@
+# Benchmark de inicialização: tempo de importação de cada página do app
+#
+# Para cada página, executa um processo novo com `python -X importtime` que roda no
+# AppTest o app base (streamlit + menu) e a página, incluindo um render(): assim entram
+# também as importações adiadas para dentro das funções (como o plotly dos gráficos).
+# Soma o tempo cumulativo das importações de nível superior que não aparecem num
+# processo de referência, que roda no AppTest só o app base, e mede o primeiro rerun
+# (a diferença para o da referência), onde aparece o custo de montar as primeiras
+# figuras do plotly, que o streamlit já importa no app base.
+#
+# Uso:
+#   python benchmarks/bench_imports.py                 # relatório
+#   python benchmarks/bench_imports.py --save          # grava a linha de base
+#   python benchmarks/bench_imports.py --check --tolerance 20
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+from harness import BASELINES_DIR, ROOT, PAGE_MODULES
+
+BASELINE_PATH = os.path.join(BASELINES_DIR, "imports.json")
+
+# Importações feitas pelo app.py antes de qualquer página
+PREAMBLE = "import streamlit, streamlit_option_menu, portfolio.ui, portfolio.pages"
+
+# Processo medido: roda no AppTest o preâmbulo e, se houver módulo, a página (sem os
+# pré-carregamentos em segundo plano, que importariam outras páginas)
+RUNNER = """
+import sys
+import time
+from streamlit.testing.v1 import AppTest
+script = {script!r}
+at = AppTest.from_string(script, default_timeout=300)
+start = time.perf_counter()
+at.run()
+if at.exception:
+    sys.exit(at.exception[0].message)
+print((time.perf_counter() - start) * 1000)
+"""
+
+# Métricas de cada página comparadas com a linha de base (quanto maior, pior)
+CHECKED_METRICS = ("import_ms", "render_ms")
+
+
+# Função para interpretar a saída do -X importtime: lista de (cumulativo_us, nível, módulo)
+def parse_importtime(stderr):
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        level = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        entries.append((int(cumulative), level, name.strip()))
+    return entries
+
+
+# Função para executar o app base (e a página, se houver) num processo novo; devolve
+# as importações registradas pelo -X importtime e o tempo (ms) do primeiro rerun
+def importtime_run(module=None):
+    script = PREAMBLE
+    if module is not None:
+        script += f"\nimport importlib\nimportlib.import_module({module!r}).render()"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", RUNNER.format(script=script)],
+        cwd=ROOT,
+        env={**os.environ, "PORTFOLIO_PREFETCH": "0", "PYTHONPATH": ROOT},
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Falha ao renderizar {module}: {result.stderr.strip().splitlines()[-1]}")
+    return parse_importtime(result.stderr), float(result.stdout.strip().splitlines()[-1])
+
+
+# Função para medir uma página: tempo (ms) das importações (módulo e um render()) que não
+# acontecem no processo de referência e do primeiro rerun além do da referência
+def page_costs(module, reference, reference_ms):
+    entries, wall_ms = importtime_run(module)
+    import_us = sum(cumulative for cumulative, level, name in entries if level == 0 and name not in reference)
+    return import_us / 1000, max(0.0, wall_ms - reference_ms)
+
+
+# Função para medir todas as páginas (melhor de N repetições de cada métrica)
+def run(repeat):
+    runs = [importtime_run() for _ in range(repeat)]
+    reference = {name for _, _, name in runs[0][0]}
+    reference_ms = min(wall_ms for _, wall_ms in runs)
+    results = {}
+    for page, module in PAGE_MODULES.items():
+        samples = [page_costs(module, reference, reference_ms) for _ in range(repeat)]
+        results[page] = {
+            "import_ms": round(min(import_ms for import_ms, _ in samples), 3),
+            "render_ms": round(min(render_ms for _, render_ms in samples), 1),
+        }
+    return results
+
+
+# Função para comparar os resultados com a linha de base
+def regressions(results, baseline, tolerance):
+    failed = []
+    for page, metrics in results.items():
+        reference = baseline.get(page, {})
+        for metric in CHECKED_METRICS:
+            before, after = reference.get(metric), metrics[metric]
+            if before and after > before * (1 + tolerance / 100):
+                failed.append((page, metric, before, after))
+    return failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tempo de importação e do primeiro render por página")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--save", action="store_true", help="grava os resultados como linha de base")
+    parser.add_argument("--check", action="store_true", help="falha se alguma página ficar mais lenta")
+    parser.add_argument("--tolerance", type=float, default=25.0, help="tolerância em %% para --check")
+    args = parser.parse_args()
+
+    results = run(args.repeat)
+    print(f"{'Página':<16} {'importação ms':>14} {'render ms':>10}")
+    for page, metrics in results.items():
+        print(f"{page:<16} {metrics['import_ms']:>14.1f} {metrics['render_ms']:>10.1f}")
+
+    if args.save:
+        os.makedirs(os.path.dirname(BASELINE_PATH), exist_ok=True)
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"Linha de base gravada em {BASELINE_PATH}")
+
+    if args.check:
+        with open(BASELINE_PATH, encoding="utf-8") as f:
+            baseline = json.load(f)
+        failed = regressions(results, baseline, args.tolerance)
+        for page, metric, reference, value in failed:
+            print(f"REGRESSÃO {page} [{metric}]: {reference:.1f} ms -> {value:.1f} ms")
+        if failed:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# Benchmark do modo ao vivo do Dashboard Demo (portfolio.live)
+#
+# Acrescenta lotes de linhas sintéticas e compara, a cada ponto de medição:
+#   - incremental: LiveRollups.append do lote (soma só nos períodos afetados)
+#   - recálculo:   build_cube sobre todas as linhas recebidas até ali
+# Depois segue um CSV alimentado pelo gerador do módulo (python -m portfolio.live) e
+# mede a taxa de atualização e a latência entre a chegada de um lote e a leitura das
+# agregações, consultadas a cada --refresh segundos como faz o painel.
+#
+# Uso:
+#   python benchmarks/bench_live.py
+#   python benchmarks/bench_live.py --batch 500 --batches 400 --rate 2000
+import argparse
+import os
+import statistics
+import tempfile
+import threading
+import time
+
+import harness  # noqa: F401 (coloca a raiz do repositório no sys.path)
+import numpy as np
+import pandas as pd
+
+from portfolio.cube import build_cube
+from portfolio.data import METRICAS
+from portfolio.live import LiveRollups, emit, tail_file
+
+
+# Lote sintético: rows linhas espalhadas pelos dias a partir de first_day
+def make_batch(rng, first_day, rows, days_per_batch):
+    days = first_day + np.sort(rng.integers(0, days_per_batch, rows))
+    return days, {metric: rng.integers(5, 150, rows).astype(np.float64) for metric in METRICAS}
+
+
+# Função para medir o custo de cada lote: incremental contra recálculo do cubo
+def measure_append(batch, batches, checkpoints):
+    rng = np.random.default_rng(0)
+    store = LiveRollups()
+    frames = []
+    print(f"{'Linhas':>10} {'incremental ms':>15} {'recálculo ms':>13}")
+    first_day = np.datetime64("2022-01-01", "D").astype(np.int64)
+    for i in range(1, batches + 1):
+        days, values = make_batch(rng, first_day + i, batch, 2)
+        start = time.perf_counter()
+        store.append(days, values)
+        append_ms = (time.perf_counter() - start) * 1000
+        frames.append(pd.DataFrame({"Data": days.astype("datetime64[D]").astype("datetime64[ns]"), **values}))
+        if i in checkpoints:
+            data = pd.concat(frames, ignore_index=True)
+            start = time.perf_counter()
+            build_cube(data)
+            rebuild_ms = (time.perf_counter() - start) * 1000
+            print(f"{store.rows:>10} {append_ms:>15.2f} {rebuild_ms:>13.1f}")
+
+
+# Função para medir taxa e latência seguindo um CSV alimentado pelo gerador
+def measure_feed(rate, seconds, refresh):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "ao_vivo.csv")
+        store = LiveRollups()
+        stop = threading.Event()
+        reader = threading.Thread(target=tail_file, args=(path, store, stop), daemon=True)
+        reader.start()
+        writer = threading.Thread(target=emit, args=(path, rate, 500, "2024-01-01", int(rate * seconds)), daemon=True)
+        writer.start()
+        read_ms = []
+        while writer.is_alive() or store.version > store.stats["rendered"]:
+            time.sleep(refresh)
+            start = time.perf_counter()
+            _, version = store.rollup("day")
+            read_ms.append((time.perf_counter() - start) * 1000)
+            store.rendered(version)
+        stats = store.stats
+        stop.set()
+        reader.join()
+    print(f"linhas: {stats['rows']} · {stats['rows_per_s']:.0f} linhas/s · {stats['batches_per_s']:.1f} lotes/s")
+    print(f"latência p50 {stats['latency_p50_ms']:.0f} ms · p95 {stats['latency_p95_ms']:.0f} ms")
+    print(f"leitura das agregações: mediana {statistics.median(read_ms):.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do modo ao vivo")
+    parser.add_argument("--batch", type=int, default=1000)
+    parser.add_argument("--batches", type=int, default=1000)
+    parser.add_argument("--rate", type=float, default=1000, help="linhas por segundo no feed")
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--refresh", type=float, default=0.25, help="intervalo de leitura do painel")
+    args = parser.parse_args()
+
+    checkpoints = {n for n in (1, 10, 100, args.batches // 2, args.batches) if 0 < n <= args.batches}
+    measure_append(args.batch, args.batches, checkpoints)
+    print()
+    measure_feed(args.rate, args.seconds, args.refresh)
+
+
+if __name__ == "__main__":
+    main()
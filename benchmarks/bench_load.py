@@ -0,0 +1,145 @@
+# Teste de carga local: M processos do Streamlit (workers) e N sessões simultâneas
+#
+# Sobe os workers com `streamlit run app.py` em portas consecutivas e distribui as
+# sessões entre eles em rodízio, como um proxy faria. Cada sessão abre o websocket do
+# Streamlit (/_stcore/stream), como o navegador, e pede reruns percorrendo as páginas
+# pela URL (?pagina=); a latência de um rerun vai do pedido até a mensagem de fim do
+# script. Relata p50/p95/p99 no total, por página e separando o primeiro rerun de cada
+# sessão. Com --shared os workers usam um cache em disco compartilhado novo
+# (PORTFOLIO_SHARED_CACHE), para comparar com cada worker aquecendo o próprio cache.
+#
+# Uso:
+#   python benchmarks/bench_load.py --workers 2 --sessions 8
+#   python benchmarks/bench_load.py --workers 4 --sessions 32 --reruns 10 --shared
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from urllib.parse import urlencode
+
+from harness import APP_PATH, PAGES, ROOT
+
+# Porta do primeiro worker; os demais usam as seguintes
+BASE_PORT = 8601
+
+# Tempo máximo (segundos) para um worker responder ao health check e para um rerun
+STARTUP_TIMEOUT = 60
+RERUN_TIMEOUT = 120
+
+
+# Função para subir um worker do Streamlit numa porta
+def start_worker(port, env):
+    command = [
+        sys.executable, "-m", "streamlit", "run", APP_PATH,
+        "--server.port", str(port),
+        "--server.headless", "true",
+        "--server.fileWatcherType", "none",
+        "--browser.gatherUsageStats", "false",
+    ]
+    return subprocess.Popen(command, cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+# Função para esperar o worker aceitar conexões
+def wait_ready(port):
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1) as response:
+                if response.status == 200:
+                    return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"Worker na porta {port} não respondeu em {STARTUP_TIMEOUT}s")
+
+
+# Uma sessão: pede reruns em sequência, como um usuário navegando pelo menu
+async def run_session(index, port, pages, reruns, results):
+    import websockets
+    from streamlit.proto.BackMsg_pb2 import BackMsg
+    from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+    async with websockets.connect(f"ws://127.0.0.1:{port}/_stcore/stream", subprotocols=["streamlit"], max_size=None) as ws:
+        for i in range(reruns):
+            page = pages[(index + i) % len(pages)]
+            message = BackMsg()
+            message.rerun_script.query_string = urlencode({"pagina": page})
+            start = time.perf_counter()
+            await ws.send(message.SerializeToString())
+            while True:
+                forward = ForwardMsg()
+                forward.ParseFromString(await asyncio.wait_for(ws.recv(), RERUN_TIMEOUT))
+                if forward.WhichOneof("type") == "script_finished":
+                    break
+            results.append({"page": page, "first": i == 0, "ms": (time.perf_counter() - start) * 1000})
+
+
+async def run_sessions(ports, sessions, pages, reruns):
+    results = []
+    await asyncio.gather(*(
+        run_session(i, ports[i % len(ports)], pages, reruns, results)
+        for i in range(sessions)
+    ))
+    return results
+
+
+# Função para calcular os percentis de uma lista de latências (ms)
+def percentiles(values):
+    if len(values) < 2:
+        return values * 3 if values else [float("nan")] * 3
+    cuts = statistics.quantiles(values, n=100, method="inclusive")
+    return [cuts[49], cuts[94], cuts[98]]
+
+
+def report(results, elapsed):
+    print(f"{'Grupo':<18} {'reruns':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    groups = {"total": [r["ms"] for r in results]}
+    groups["primeiro rerun"] = [r["ms"] for r in results if r["first"]]
+    groups["reruns seguintes"] = [r["ms"] for r in results if not r["first"]]
+    for page in PAGES:
+        groups[page] = [r["ms"] for r in results if r["page"] == page]
+    for name, values in groups.items():
+        if values:
+            p50, p95, p99 = percentiles(values)
+            print(f"{name:<18} {len(values):>7} {p50:>9.1f} {p95:>9.1f} {p99:>9.1f}")
+    print(f"\n{len(results)} reruns em {elapsed:.1f}s ({len(results) / elapsed:.1f} reruns/s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Teste de carga com vários workers do Streamlit")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--sessions", type=int, default=8)
+    parser.add_argument("--reruns", type=int, default=len(PAGES), help="reruns por sessão")
+    parser.add_argument("--pages", nargs="+", default=PAGES)
+    parser.add_argument("--port", type=int, default=BASE_PORT)
+    parser.add_argument("--shared", action="store_true", help="liga o cache em disco compartilhado")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ)
+        env["PORTFOLIO_SHARED_CACHE"] = os.path.join(tmp, "shared.sqlite") if args.shared else "0"
+        ports = [args.port + i for i in range(args.workers)]
+        workers = [start_worker(port, env) for port in ports]
+        try:
+            for port in ports:
+                wait_ready(port)
+            start = time.perf_counter()
+            results = asyncio.run(run_sessions(ports, args.sessions, args.pages, args.reruns))
+            elapsed = time.perf_counter() - start
+        finally:
+            for worker in workers:
+                worker.terminate()
+            for worker in workers:
+                worker.wait()
+
+    mode = "compartilhado" if args.shared else "por worker"
+    print(f"{args.workers} workers, {args.sessions} sessões, {args.reruns} reruns por sessão, cache {mode}\n")
+    report(results, elapsed)
+
+
+if __name__ == "__main__":
+    main()
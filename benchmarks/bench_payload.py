@@ -0,0 +1,33 @@
+# Benchmark de payload: bytes enviados ao navegador por rerun, por página
+#
+# Executa o app com o AppTest (sem navegador) e soma o tamanho serializado dos
+# protos de todos os elementos, que é o que o servidor envia pelo websocket a cada
+# rerun. Compara o CSS injetado inline (PORTFOLIO_INLINE_CSS=1) com a folha de
+# estilos estática referenciada por <link>.
+#
+# Uso:
+#   python benchmarks/bench_payload.py
+import os
+
+from harness import PAGES, new_app, payload_bytes, run_checked
+
+
+# Função para medir o payload de uma página com ou sem CSS inline
+def measure(page, inline):
+    if inline:
+        os.environ["PORTFOLIO_INLINE_CSS"] = "1"
+    else:
+        os.environ.pop("PORTFOLIO_INLINE_CSS", None)
+    return payload_bytes(run_checked(new_app(page)))
+
+
+def main():
+    print(f"{'Página':<16} {'inline':>10} {'estático':>10} {'economia':>10}")
+    for page in PAGES:
+        before = measure(page, inline=True)
+        after = measure(page, inline=False)
+        print(f"{page:<16} {before:>9}B {after:>9}B {before - after:>9}B")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+# Benchmark de reruns do app.py com o AppTest (headless, sem navegador)
+#
+# Cenários: cada página do menu (primeiro rerun e reruns seguintes, já com os
+# caches aquecidos) e os filtros de mês do Dashboard Demo. Para cada cenário mede
+# o tempo de parede (o menor), o pico de memória alocada (tracemalloc), o número de
+# elementos e o payload em bytes por rerun. Os tempos são comparados com a linha de
+# base na proporção de uma carga fixa de calibração, medida nas duas execuções.
+#
+# Uso:
+#   python benchmarks/bench_reruns.py                       # relatório
+#   python benchmarks/bench_reruns.py --save                # grava a linha de base
+#   python benchmarks/bench_reruns.py --check --tolerance 20
+import argparse
+import gc
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+from harness import BASELINES_DIR, PAGES, element_count, new_app, payload_bytes, run_checked, wait_prefetch
+
+BASELINE_PATH = os.path.join(BASELINES_DIR, "reruns.json")
+
+# Intervalos aplicados aos filtros "Mês Inicial" e "Mês Final" do Dashboard Demo, como
+# posições nas opções dos sliders (negativas contam do fim): o período todo, um trecho,
+# um intervalo invertido e um único mês. Os rótulos vêm da fonte em uso (com ou sem ano)
+DASHBOARD_RANGES = [(0, -1), (2, 5), (-3, 1), (6, 6)]
+
+# Métricas comparadas com a linha de base (quanto maior, pior)
+CHECKED_METRICS = ("wall_ms", "alloc_kb")
+
+# Chave da linha de base com o tempo da carga de calibração
+CALIBRATION_KEY = "_calibracao_ms"
+
+
+# Função para medir uma carga fixa de CPU (o menor de alguns rounds): a velocidade da
+# máquina varia entre execuções, e os tempos são comparados na proporção dessa carga
+def calibrate(rounds=5):
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        sum(i * i for i in range(200_000))
+        samples.append((time.perf_counter() - start) * 1000)
+    return min(samples)
+
+
+# Função para medir um rerun: tempo (ms) e pico de alocação (KB), depois que os
+# pré-carregamentos do rerun anterior terminaram e sem o lixo deixado por ele
+def timed_run(at):
+    wait_prefetch()
+    gc.collect()
+    tracemalloc.reset_peak()
+    start_memory = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    run_checked(at)
+    wall_ms = (time.perf_counter() - start) * 1000
+    alloc_kb = max(0, tracemalloc.get_traced_memory()[1] - start_memory) / 1024
+    return wall_ms, alloc_kb
+
+
+# Função para resumir as medições de um cenário
+def summarize(samples, at):
+    return {
+        "wall_ms": round(min(wall for wall, _ in samples), 2),
+        "alloc_kb": round(statistics.median(alloc for _, alloc in samples), 1),
+        "elements": element_count(at),
+        "payload_bytes": payload_bytes(at),
+    }
+
+
+# Cenários de página: primeiro rerun da sessão e reruns seguintes
+def bench_pages(repeat):
+    results = {}
+    for page in PAGES:
+        at = new_app(page)
+        results[f"{page} (primeiro rerun)"] = summarize([timed_run(at)], at)
+        results[f"{page} (rerun)"] = summarize([timed_run(at) for _ in range(repeat)], at)
+    return results
+
+
+# Função para converter DASHBOARD_RANGES nos rótulos das opções do slider do app
+def dashboard_ranges(at):
+    options = list(at.select_slider[0].options)
+
+    def label(position):
+        return options[max(-len(options), min(position, len(options) - 1))]
+
+    return [(label(start), label(end)) for start, end in DASHBOARD_RANGES]
+
+
+# Cenários dos filtros do Dashboard Demo
+def bench_dashboard(repeat):
+    results = {}
+    at = new_app("Dashboard Demo")
+    run_checked(at)
+    for start, end in dashboard_ranges(at):
+        samples = []
+        for _ in range(repeat):
+            at.select_slider[0].set_value(start)
+            at.select_slider[1].set_value(end)
+            samples.append(timed_run(at))
+        results[f"Dashboard Demo {start}-{end}"] = summarize(samples, at)
+    return results
+
+
+# Função para comparar os resultados com a linha de base; os tempos da linha de base
+# são ajustados pela razão entre as calibrações das duas execuções
+def regressions(results, baseline, tolerance, calibration):
+    failed = []
+    speed = calibration / baseline[CALIBRATION_KEY] if baseline.get(CALIBRATION_KEY) else 1.0
+    for scenario, metrics in results.items():
+        reference = baseline.get(scenario, {})
+        for metric in CHECKED_METRICS:
+            before, after = reference.get(metric), metrics[metric]
+            if before and metric == "wall_ms":
+                before = round(before * speed, 2)
+            if before and after > before * (1 + tolerance / 100):
+                failed.append((scenario, metric, before, after))
+    return failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de reruns do app com AppTest")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save", action="store_true", help="grava os resultados como linha de base")
+    parser.add_argument("--check", action="store_true", help="falha se algum cenário piorar além da tolerância")
+    parser.add_argument("--tolerance", type=float, default=25.0, help="tolerância em %% para --check")
+    parser.add_argument("--json", action="store_true", help="imprime os resultados em JSON")
+    args = parser.parse_args()
+
+    # Calibração antes e depois dos cenários, para acompanhar a variação durante a execução
+    calibration = calibrate()
+    tracemalloc.start()
+    results = {**bench_pages(args.repeat), **bench_dashboard(args.repeat)}
+    tracemalloc.stop()
+    calibration = round((calibration + calibrate()) / 2, 2)
+
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+    else:
+        print(f"{'Cenário':<34} {'ms':>9} {'KB alocados':>12} {'elementos':>10} {'bytes':>8}")
+        for scenario, m in results.items():
+            print(f"{scenario:<34} {m['wall_ms']:>9.1f} {m['alloc_kb']:>12.1f} {m['elements']:>10} {m['payload_bytes']:>8}")
+
+    if args.save:
+        os.makedirs(BASELINES_DIR, exist_ok=True)
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump({CALIBRATION_KEY: calibration, **results}, f, ensure_ascii=False, indent=2)
+        print(f"Linha de base gravada em {BASELINE_PATH}")
+
+    if args.check:
+        with open(BASELINE_PATH, encoding="utf-8") as f:
+            baseline = json.load(f)
+        failed = regressions(results, baseline, args.tolerance, calibration)
+        for scenario, metric, before, after in failed:
+            print(f"REGRESSÃO {scenario} [{metric}]: {before} -> {after}")
+        if failed:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
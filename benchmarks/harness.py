@@ -0,0 +1,67 @@
+# Utilitários comuns dos benchmarks executados com o AppTest (sem navegador)
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(ROOT, "app.py")
+BASELINES_DIR = os.path.join(ROOT, "benchmarks", "baselines")
+
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from portfolio.pages import PAGES as PAGE_MODULES  # noqa: E402
+
+PAGES = list(PAGE_MODULES)
+
+
+# Função para criar um AppTest com a página selecionada pela URL (?pagina=)
+def new_app(page, timeout=60):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+    at.query_params["pagina"] = page
+    return at
+
+
+# Função para executar um rerun e falhar se o script levantar exceção
+def run_checked(at):
+    at.run()
+    if at.exception:
+        raise RuntimeError(f"Falha no rerun: {at.exception[0].message}")
+    return at
+
+
+# Função para esperar os pré-carregamentos em segundo plano terminarem, como no
+# intervalo entre duas interações do usuário; sem isso o rerun medido disputa a CPU
+# com o aquecimento agendado pelo rerun anterior
+def wait_prefetch(timeout=30):
+    from portfolio.prefetch import enabled, get_prefetcher
+
+    if not enabled():
+        return
+    deadline = time.monotonic() + timeout
+    while get_prefetcher().stats["pending"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+# Função para percorrer todos os nós da árvore de elementos do AppTest
+def iter_nodes(node):
+    yield node
+    for child in getattr(node, "children", {}).values():
+        yield from iter_nodes(child)
+
+
+# Função para contar os elementos renderizados (sem contar blocos de layout)
+def element_count(at):
+    return sum(1 for node in iter_nodes(at._tree) if not getattr(node, "children", None) and getattr(node, "proto", None) is not None)
+
+
+# Função para somar os bytes serializados dos elementos renderizados
+def payload_bytes(at):
+    total = 0
+    for node in iter_nodes(at._tree):
+        proto = getattr(node, "proto", None)
+        if proto is not None and hasattr(proto, "ByteSize"):
+            total += proto.ByteSize()
+    return total
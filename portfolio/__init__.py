@@ -0,0 +1 @@
+# Módulos de apoio do portfólio (dados, cache e páginas)
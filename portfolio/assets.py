@@ -0,0 +1,69 @@
+import glob
+import hashlib
+import os
+import re
+
+import streamlit as st
+
+from portfolio.settings import ASSETS_DIR, STATIC_DIR, STATIC_URL
+
+THEME_SOURCE = os.path.join(ASSETS_DIR, "theme.css")
+
+
+# Função para minificar CSS: remove comentários e espaços desnecessários
+def minify_css(css):
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    css = css.replace(";}", "}")
+    return css.strip()
+
+
+# Função para gravar um arquivo de forma atômica (leitores nunca veem arquivo parcial)
+def write_atomic(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+# Função para gravar um arquivo com o hash do conteúdo no nome (stem.hash.suffix);
+# versões antigas são removidas e o arquivo só é regravado quando o conteúdo muda
+def write_hashed(directory, stem, suffix, content):
+    name = f"{stem}.{hashlib.sha256(content).hexdigest()[:12]}.{suffix}"
+    path = os.path.join(directory, name)
+
+    if not os.path.exists(path):
+        write_atomic(path, content)
+        for old_path in glob.glob(os.path.join(directory, f"{glob.escape(stem)}.*.{suffix}")):
+            if old_path != path:
+                os.remove(old_path)
+    return name
+
+
+# Função para gerar a folha de estilos minificada com o hash do conteúdo no nome
+def build_stylesheet(source=THEME_SOURCE, static_dir=STATIC_DIR):
+    with open(source, encoding="utf-8") as f:
+        css = minify_css(f.read()).encode("utf-8")
+    stem = os.path.splitext(os.path.basename(source))[0]
+    return write_hashed(static_dir, stem, "min.css", css)
+
+
+# Função para obter a URL da folha de estilos (gerada uma vez por processo)
+@st.cache_resource(show_spinner=False)
+def stylesheet_url():
+    return f"{STATIC_URL}/{build_stylesheet()}"
+
+
+# Função para obter o CSS minificado, para injeção inline quando o servidor
+# estático estiver desativado
+@st.cache_resource(show_spinner=False)
+def inline_stylesheet():
+    with open(THEME_SOURCE, encoding="utf-8") as f:
+        return minify_css(f.read())
+
+
+if __name__ == "__main__":
+    print(os.path.join(STATIC_DIR, build_stylesheet()))
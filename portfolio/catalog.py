@@ -0,0 +1,71 @@
+import json
+import os
+from collections import defaultdict
+
+import streamlit as st
+
+from portfolio.settings import CACHE_MAX_ENTRIES, DATA_DIR
+
+CATALOG_PATH = os.path.join(DATA_DIR, "projetos.json")
+
+# Campos indexados do catálogo (índices invertidos valor -> ids dos projetos)
+INDEXED_FIELDS = ("categoria", "tecnologias", "ano")
+
+
+# Catálogo de projetos com índices invertidos por categoria, tecnologia e ano;
+# filtrar é uma interseção de conjuntos, sem varrer os projetos
+class ProjectCatalog:
+    def __init__(self, projects):
+        self.projects = projects
+        self.indexes = {field: defaultdict(set) for field in INDEXED_FIELDS}
+        for project_id, project in enumerate(projects):
+            for field in INDEXED_FIELDS:
+                values = project[field]
+                for value in values if isinstance(values, list) else [values]:
+                    self.indexes[field][value].add(project_id)
+        self.indexes = {
+            field: {value: frozenset(ids) for value, ids in index.items()}
+            for field, index in self.indexes.items()
+        }
+
+    def __len__(self):
+        return len(self.projects)
+
+    def __getitem__(self, project_id):
+        return self.projects[project_id]
+
+    # Valores disponíveis de um campo, para os filtros
+    def options(self, field, reverse=False):
+        return sorted(self.indexes[field], reverse=reverse)
+
+    # Ids (na ordem do catálogo) dos projetos que atendem a todos os filtros informados
+    def filter(self, **filters):
+        selected = [self.indexes[field].get(value, frozenset()) for field, value in filters.items() if value is not None]
+        if not selected:
+            return list(range(len(self.projects)))
+        selected.sort(key=len)
+        return sorted(selected[0].intersection(*selected[1:]))
+
+    # Projetos de uma página dos resultados (página começando em 1)
+    def page(self, project_ids, page, page_size):
+        start = (page - 1) * page_size
+        return [self.projects[project_id] for project_id in project_ids[start:start + page_size]]
+
+
+# Função para carregar o catálogo; a versão do arquivo (mtime) faz parte da chave do
+# cache. O catálogo só é lido, então fica num cache de recursos: as sessões usam o
+# mesmo objeto e os índices não são desserializados de novo a cada rerun
+@st.cache_resource(max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def _read_catalog(path, version):
+    with open(path, encoding="utf-8") as f:
+        return ProjectCatalog(json.load(f))
+
+
+# Função para obter a versão do catálogo (mtime do arquivo)
+def catalog_version(path=CATALOG_PATH):
+    return os.stat(path).st_mtime_ns
+
+
+# Função para carregar o catálogo de projetos com cache
+def load_catalog(path=CATALOG_PATH):
+    return _read_catalog(path, catalog_version(path))
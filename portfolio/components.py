@@ -0,0 +1,108 @@
+import functools
+from html import escape
+from string import Template
+
+# Componentes HTML das páginas: cada componente é um template compilado uma vez e o
+# HTML gerado é memoizado por conjunto de argumentos (que por isso devem ser
+# hashable: tuplas em vez de listas). O conteúdo estático das páginas é montado uma
+# única vez por processo e os reruns só reenviam a string pronta.
+
+# Entradas memoizadas por componente
+COMPONENT_CACHE_SIZE = 256
+
+BADGE = Template('<span class="badge">$text</span>')
+
+CARD = Template('<div class="highlight-container$classes"><h4>$title</h4>$body</div>')
+
+PARAGRAPH = Template('<p$style>$text</p>')
+
+SMALL = Template('<p><small>$text</small></p>')
+
+SECTION_CARD = Template('<div class="highlight-container fade-in"><h2>$title</h2>$body</div>')
+
+ITEM = Template('<li>$text</li>')
+
+PROJECT = Template(
+    '<h4>$title</h4>'
+    '<p style="margin-bottom: 10px;">$badges</p>'
+    '<p>$description</p>'
+    '<h5>Principais recursos:</h5>'
+    '<ul>$features</ul>'
+)
+
+
+def _text(value):
+    return escape(str(value), quote=False)
+
+
+def _paragraph(text, style=""):
+    return PARAGRAPH.substitute(text=_text(text), style=f' style="{style}"' if style else "")
+
+
+# Badge de uma tecnologia ou habilidade
+@functools.lru_cache(maxsize=COMPONENT_CACHE_SIZE)
+def badge(text):
+    return BADGE.substitute(text=_text(text))
+
+
+# Lista de badges
+@functools.lru_cache(maxsize=COMPONENT_CACHE_SIZE)
+def badge_list(items):
+    return "".join(badge(item) for item in items)
+
+
+# Cartão destacado: título, parágrafos e uma linha final em letra pequena
+@functools.lru_cache(maxsize=COMPONENT_CACHE_SIZE)
+def card(title, paragraphs=(), small=None, fade=False):
+    body = "".join(_paragraph(paragraph) for paragraph in paragraphs)
+    if small:
+        body += SMALL.substitute(text=_text(small))
+    return CARD.substitute(title=_text(title), body=body, classes=" fade-in" if fade else "")
+
+
+# Cartão de área de especialização: badges das tecnologias e descrição
+@functools.lru_cache(maxsize=COMPONENT_CACHE_SIZE)
+def skill_area_card(title, technologies, description):
+    body = badge_list(technologies) + _paragraph(description, "margin-top: 15px;")
+    return CARD.substitute(title=_text(title), body=body, classes="")
+
+
+# Entrada de formação acadêmica
+@functools.lru_cache(maxsize=COMPONENT_CACHE_SIZE)
+def education_card(course, institution, period):
+    return CARD.substitute(
+        title=_text(course),
+        body=_paragraph(institution) + SMALL.substitute(text=_text(period)),
+        classes="",
+    )
+
+
+# Entrada de experiência profissional
+@functools.lru_cache(maxsize=COMPONENT_CACHE_SIZE)
+def experience_card(role, company, period, description):
+    return CARD.substitute(
+        title=_text(role),
+        body=_paragraph(company) + SMALL.substitute(text=_text(period)) + _paragraph(description),
+        classes="",
+    )
+
+
+# Seção de texto corrido com título (parágrafos espaçados a partir do segundo)
+@functools.lru_cache(maxsize=COMPONENT_CACHE_SIZE)
+def text_section(title, paragraphs):
+    body = "".join(
+        _paragraph(paragraph, "font-size: 1.1rem; line-height: 1.6;" + (" margin-top: 15px;" if i else ""))
+        for i, paragraph in enumerate(paragraphs)
+    )
+    return SECTION_CARD.substitute(title=_text(title), body=body)
+
+
+# Descrição de um projeto: título, badges, descrição e recursos
+@functools.lru_cache(maxsize=COMPONENT_CACHE_SIZE)
+def project_card(title, technologies, description, features):
+    return PROJECT.substitute(
+        title=_text(title),
+        badges=badge_list(technologies),
+        description=_text(description),
+        features="".join(ITEM.substitute(text=_text(feature)) for feature in features),
+    )
@@ -0,0 +1,208 @@
+import hashlib
+import json
+import logging
+import os
+import pickle
+import sys
+from dataclasses import dataclass, fields
+
+import streamlit as st
+
+from portfolio.assets import write_atomic
+from portfolio.settings import CACHE_DIR, DATA_DIR
+
+logger = logging.getLogger(__name__)
+
+# Conteúdo editável das páginas e o pacote serializado gerado a partir dele
+CONTENT_PATH = os.path.join(DATA_DIR, "conteudo.json")
+BUNDLE_PATH = os.path.join(CACHE_DIR, "conteudo.pkl")
+
+# Par rótulo/valor (informações pessoais, estatísticas da página inicial)
+@dataclass(frozen=True, slots=True)
+class Item:
+    rotulo: str
+    valor: str
+
+
+# Indicador de desempenho (gauge) da página inicial
+@dataclass(frozen=True, slots=True)
+class Gauge:
+    valor: int
+    titulo: str
+
+
+@dataclass(frozen=True, slots=True)
+class Education:
+    curso: str
+    instituicao: str
+    periodo: str
+
+
+@dataclass(frozen=True, slots=True)
+class Experience:
+    cargo: str
+    empresa: str
+    periodo: str
+    descricao: str
+
+
+@dataclass(frozen=True, slots=True)
+class Skill:
+    nome: str
+    percentual: int
+
+
+@dataclass(frozen=True, slots=True)
+class SkillArea:
+    titulo: str
+    tecnologias: tuple
+    descricao: str
+
+
+@dataclass(frozen=True, slots=True)
+class Certification:
+    titulo: str
+    emissor: str
+
+
+# Seções do conteúdo: tipo de cada entrada e se a seção é uma lista
+SECTIONS = {
+    "informacoes": (Item, True),
+    "estatisticas": (Item, True),
+    "desempenho": (Gauge, False),
+    "jornada": (str, True),
+    "formacao": (Education, True),
+    "experiencias": (Experience, True),
+    "habilidades": (Skill, True),
+    "areas": (SkillArea, True),
+    "certificacoes": (Certification, True),
+    "contato": (str, True),
+}
+
+
+# Conteúdo das páginas, imutável: cada seção é uma tupla de entradas tipadas (ou uma
+# entrada) e tem a própria versão (hash), de modo que quem depende só de algumas seções
+# não é invalidado quando outra muda
+@dataclass(frozen=True, slots=True)
+class Content:
+    informacoes: tuple
+    estatisticas: tuple
+    desempenho: Gauge
+    jornada: tuple
+    formacao: tuple
+    experiencias: tuple
+    habilidades: tuple
+    areas: tuple
+    certificacoes: tuple
+    contato: tuple
+    versions: tuple
+
+    # Versão combinada de algumas seções (para chaves de cache)
+    def version(self, *sections):
+        versions = dict(self.versions)
+        return "-".join(versions[section] for section in sections)
+
+
+# Função para calcular a versão do formato do pacote a partir das seções e dos campos
+# das classes do conteúdo: mudar uma classe invalida os pacotes gerados antes, sem
+# depender de um número incrementado à mão
+def _schema_version():
+    layout = [(name, kind.__name__, many) for name, (kind, many) in SECTIONS.items()]
+    for kind in dict.fromkeys([Content, *(kind for kind, _ in SECTIONS.values() if kind is not str)]):
+        layout.append((kind.__module__, kind.__qualname__, [field.name for field in fields(kind)]))
+    return hashlib.sha256(repr(layout).encode("utf-8")).hexdigest()[:12]
+
+
+SCHEMA_VERSION = _schema_version()
+
+
+# Função para converter uma entrada do JSON no tipo da seção (listas viram tuplas)
+def _entry(kind, raw):
+    if kind is str:
+        return str(raw)
+    values = {}
+    for field in fields(kind):
+        value = raw[field.name]
+        values[field.name] = tuple(value) if isinstance(value, list) else value
+    return kind(**values)
+
+
+# Função para calcular a versão de uma seção a partir do conteúdo bruto
+def _section_version(raw):
+    encoded = json.dumps(raw, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:12]
+
+
+# Função para montar o conteúdo a partir do JSON; as seções cuja versão não mudou em
+# relação ao conteúdo anterior são reaproveitadas (os mesmos objetos)
+def build_content(raw, previous=None):
+    previous_versions = dict(previous.versions) if previous is not None else {}
+    sections, versions = {}, []
+    for name, (kind, many) in SECTIONS.items():
+        version = _section_version(raw[name])
+        if previous_versions.get(name) == version:
+            sections[name] = getattr(previous, name)
+        else:
+            sections[name] = tuple(_entry(kind, entry) for entry in raw[name]) if many else _entry(kind, raw[name])
+        versions.append((name, version))
+    return Content(**sections, versions=tuple(versions))
+
+
+# Função para obter a versão do arquivo de conteúdo (mtime)
+def content_version(path=CONTENT_PATH):
+    return os.stat(path).st_mtime_ns
+
+
+# Função para ler o pacote serializado; devolve o cabeçalho e o conteúdo, ou None se o
+# pacote não existir, estiver corrompido ou for de outro formato
+def read_bundle(bundle_path=BUNDLE_PATH):
+    try:
+        with open(bundle_path, "rb") as f:
+            bundle = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as exc:
+        # Pacote corrompido ou gerado por outra versão do código (inclusive com classes
+        # ou módulos renomeados, que levantam ImportError/AttributeError): é refeito
+        logger.warning("Pacote de conteúdo inválido (%s): %s", bundle_path, exc)
+        return None
+    if not isinstance(bundle, dict) or bundle.get("schema") != SCHEMA_VERSION:
+        return None
+    return bundle
+
+
+# Função para gerar o pacote a partir do JSON; devolve o conteúdo e as seções que mudaram
+def compile_bundle(path=CONTENT_PATH, bundle_path=BUNDLE_PATH):
+    bundle = read_bundle(bundle_path)
+    previous = bundle["content"] if bundle is not None else None
+    version = content_version(path)
+    with open(path, encoding="utf-8") as f:
+        content = build_content(json.load(f), previous)
+    old_versions = dict(previous.versions) if previous is not None else {}
+    changed = [name for name, section_version in content.versions if old_versions.get(name) != section_version]
+    data = {"schema": SCHEMA_VERSION, "source": version, "content": content}
+    write_atomic(bundle_path, pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+    return content, changed
+
+
+# Conteúdo de uma versão do arquivo, desserializado uma vez por processo; o pacote só
+# é refeito quando o JSON mudou (ou o formato é outro)
+@st.cache_resource(show_spinner=False)
+def _load_content(path, version, bundle_path):
+    bundle = read_bundle(bundle_path)
+    if bundle is not None and bundle["source"] == version:
+        return bundle["content"]
+    content, changed = compile_bundle(path, bundle_path)
+    logger.info("Pacote de conteúdo atualizado; seções alteradas: %s", ", ".join(changed) or "nenhuma")
+    return content
+
+
+# Função para carregar o conteúdo das páginas
+def load_content(path=CONTENT_PATH, bundle_path=BUNDLE_PATH):
+    return _load_content(path, content_version(path), bundle_path)
+
+
+# Uso: python -m portfolio.content [conteudo.json] (gera .cache/conteudo.pkl)
+if __name__ == "__main__":
+    content, changed = compile_bundle(*sys.argv[1:2])
+    print(f"Seções alteradas: {', '.join(changed) or 'nenhuma'}")
@@ -0,0 +1,179 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from portfolio.data import METRICAS, example_data_version, load_example_data
+from portfolio.periods import PeriodLabels, month_keys, month_label
+from portfolio.settings import CACHE_MAX_ENTRIES
+
+# Granularidades suportadas, da mais fina para a mais grossa
+GRAINS = ('day', 'week', 'month', 'quarter')
+
+# Nome da coluna de período em cada granularidade
+GRAIN_COLUMNS = {
+    'day': 'Dia',
+    'week': 'Semana',
+    'month': 'Mês',
+    'quarter': 'Trimestre',
+}
+
+
+# Função para gerar o rótulo de um trimestre a partir da chave ano*4 + trimestre
+def quarter_label(key, with_year=True):
+    year, quarter = divmod(int(key), 4)
+    return f"T{quarter + 1}/{year}" if with_year else f"T{quarter + 1}"
+
+
+# Função para derivar as chaves de todas as granularidades a partir de dias desde 1970-01-01
+def day_grain_keys(days):
+    days = np.asarray(days, dtype=np.int64)
+    months = days.astype('datetime64[D]').astype('datetime64[M]').astype(np.int64) + 1970 * 12
+    # 1970-01-01 foi uma quinta-feira; semanas começam na segunda-feira
+    return {'day': days, 'week': days - (days + 3) % 7, 'month': months, 'quarter': months // 3}
+
+
+# Função para converter um intervalo de chaves mensais em chaves de outra granularidade
+def month_range_keys(grain, start_month, end_month):
+    if grain == 'month':
+        return start_month, end_month
+    if grain == 'quarter':
+        return start_month // 3, end_month // 3
+    first = np.datetime64(int(start_month) - 1970 * 12, 'M').astype('datetime64[D]').astype(np.int64)
+    last = np.datetime64(int(end_month) + 1 - 1970 * 12, 'M').astype('datetime64[D]').astype(np.int64) - 1
+    if grain == 'week':
+        return first - (first + 3) % 7, last - (last + 3) % 7
+    return first, last
+
+
+# Função para calcular as chaves de período de cada linha em todas as granularidades
+def period_keys(df, date_column='Data'):
+    if date_column in df.columns:
+        days = df[date_column].to_numpy('datetime64[ns]').astype('datetime64[D]').astype(np.int64)
+        return day_grain_keys(days), True
+    months, with_year = month_keys(df, date_column=date_column)
+    return {'month': months, 'quarter': months // 3}, with_year
+
+
+# Função para gerar os rótulos ordenados de uma granularidade
+def grain_labels(grain, keys, with_year):
+    if grain == 'month':
+        return [month_label(key, with_year) for key in keys]
+    if grain == 'quarter':
+        return [quarter_label(key, with_year) for key in keys]
+    dates = pd.to_datetime(np.asarray(keys, dtype='datetime64[D]'))
+    if grain == 'week':
+        return list(dates.strftime('Sem %d/%m/%Y'))
+    return list(dates.strftime('%d/%m/%Y'))
+
+
+# Agregação de uma granularidade: somas por período e somas prefixadas por métrica,
+# de modo que o total de qualquer intervalo contíguo sai em O(1)
+class Rollup(PeriodLabels):
+    def __init__(self, grain, keys, labels, sums):
+        super().__init__(labels)
+        self.grain = grain
+        self.keys = keys
+        self.sums = sums
+        self.prefix = {metric: np.r_[0, np.cumsum(values)] for metric, values in sums.items()}
+
+    @property
+    def column(self):
+        return GRAIN_COLUMNS[self.grain]
+
+    # Total de uma métrica entre dois períodos, inclusive
+    def total(self, metric, start, end):
+        start_pos, end_pos = self.normalize(start, end)
+        prefix = self.prefix[metric]
+        return int(prefix[end_pos + 1] - prefix[start_pos])
+
+    # Totais de todas as métricas entre dois períodos
+    def totals(self, start, end):
+        return {metric: self.total(metric, start, end) for metric in self.sums}
+
+    # Série agregada entre dois períodos, pronta para gráficos
+    def series(self, start, end, metrics=None):
+        start_pos, end_pos = self.normalize(start, end)
+        return self.series_window(slice(start_pos, end_pos + 1), metrics)
+
+    # Série agregada de uma faixa de posições; dias e semanas vêm como datas
+    def series_window(self, window, metrics=None):
+        if self.grain in ('day', 'week'):
+            periods = self.keys[window].astype('datetime64[D]')
+        else:
+            periods = self.labels[window]
+        data = {self.column: periods}
+        for metric in metrics or self.sums:
+            data[metric] = self.sums[metric][window]
+        return pd.DataFrame(data)
+
+    # Série agregada dos períodos que cobrem um intervalo de chaves mensais
+    def month_series(self, start_month, end_month, metrics=None):
+        return self.series_window(self.month_window(start_month, end_month), metrics)
+
+    # Faixa de posições que cobre um intervalo de chaves mensais (busca binária)
+    def month_window(self, start_month, end_month):
+        if start_month > end_month:
+            start_month, end_month = end_month, start_month
+        first, last = month_range_keys(self.grain, start_month, end_month)
+        return slice(
+            int(np.searchsorted(self.keys, first, side='left')),
+            int(np.searchsorted(self.keys, last, side='right')),
+        )
+
+
+# Cubo de agregações: uma Rollup por granularidade disponível nos dados; with_year
+# indica se as chaves mensais têm ano (sem ele não há comparação anual)
+class RollupCube:
+    def __init__(self, rollups, with_year=True):
+        self.rollups = rollups
+        self.with_year = with_year
+
+    @property
+    def grains(self):
+        return [grain for grain in GRAINS if grain in self.rollups]
+
+    def __getitem__(self, grain):
+        try:
+            return self.rollups[grain]
+        except KeyError:
+            raise KeyError(f"Granularidade indisponível: {grain}") from None
+
+
+# Função para agregar as métricas por período em uma única passada vetorizada
+def build_rollup(grain, keys, values, with_year):
+    unique, inverse = np.unique(keys, return_inverse=True)
+    sums = {
+        metric: np.bincount(inverse, weights=column, minlength=len(unique)).round().astype(np.int64)
+        for metric, column in values.items()
+    }
+    return Rollup(grain, unique, grain_labels(grain, unique, with_year), sums)
+
+
+# Função para construir o cubo de agregações a partir das linhas brutas
+def build_cube(df, metrics=METRICAS, date_column='Data'):
+    keys, with_year = period_keys(df, date_column)
+    values = {metric: df[metric].to_numpy(np.float64) for metric in metrics}
+    rollups = {grain: build_rollup(grain, keys[grain], values, with_year) for grain in GRAINS if grain in keys}
+    return RollupCube(rollups, with_year)
+
+
+# Função para construir o cubo a partir de somas já agregadas por dia (todas as
+# granularidades) ou por mês (mês e trimestre)
+def build_cube_from_sums(keys, values, grain='month', with_year=True):
+    keys = np.asarray(keys, dtype=np.int64)
+    grain_keys = day_grain_keys(keys) if grain == 'day' else {'month': keys, 'quarter': keys // 3}
+    values = {metric: np.asarray(column, dtype=np.float64) for metric, column in values.items()}
+    rollups = {g: build_rollup(g, grain_keys[g], values, with_year) for g in GRAINS if g in grain_keys}
+    return RollupCube(rollups, with_year)
+
+
+# Cubo de uma versão dos dados de exemplo; é imutável, então fica num cache de recursos
+# e todas as sessões usam o mesmo objeto, sem desserializar uma cópia a cada rerun
+@st.cache_resource(max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def _example_cube(version):
+    return build_cube(load_example_data())
+
+
+# Função para carregar o cubo dos dados de exemplo (construído uma vez por versão da fonte)
+def load_example_cube():
+    return _example_cube(example_data_version())
@@ -0,0 +1,82 @@
+import os
+import sqlite3
+from contextlib import closing
+
+import pandas as pd
+import streamlit as st
+
+from portfolio.settings import CACHE_MAX_ENTRIES, CACHE_TTL, DATA_DIR
+from portfolio.shared_cache import shared
+
+EXAMPLE_DATA_PATH = os.path.join(DATA_DIR, "vendas_exemplo.csv")
+
+# Esquema dos dados do Dashboard Demo
+MESES = ['Jan', 'Fev', 'Mar', 'Abr', 'Mai', 'Jun', 'Jul', 'Ago', 'Set', 'Out', 'Nov', 'Dez']
+METRICAS = ['Vendas', 'Marketing', 'Custos']
+DTYPES = {
+    'Mês': pd.CategoricalDtype(MESES, ordered=True),
+    'Vendas': 'int32',
+    'Marketing': 'int32',
+    'Custos': 'int32',
+}
+
+# Extensões reconhecidas para cada tipo de fonte
+SOURCE_KINDS = {
+    ".csv": "csv",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".db": "sqlite",
+    ".sqlite": "sqlite",
+    ".sqlite3": "sqlite",
+}
+
+
+# Função para identificar o tipo da fonte pela extensão
+def source_kind(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in SOURCE_KINDS:
+        raise ValueError(f"Tipo de fonte não suportado: {path}")
+    return SOURCE_KINDS[ext]
+
+
+# Função para aplicar os tipos explícitos às colunas conhecidas
+def apply_dtypes(df):
+    dtypes = {col: dtype for col, dtype in DTYPES.items() if col in df.columns}
+    return df.astype(dtypes)
+
+
+# Leitura efetiva da fonte; a versão do arquivo (mtime) faz parte da chave do cache
+# (e do cache compartilhado entre processos, consultado antes de reler o arquivo)
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+@shared("dados")
+def _read_source(path, kind, version, columns=None, table="vendas", query=None):
+    if kind == "csv":
+        dtypes = {col: dtype for col, dtype in DTYPES.items() if columns is None or col in columns}
+        df = pd.read_csv(path, usecols=columns, dtype=dtypes)
+    elif kind == "parquet":
+        df = pd.read_parquet(path, columns=columns)
+    else:
+        with closing(sqlite3.connect(path)) as conn:
+            sql = query or f'SELECT * FROM "{table}"'
+            df = pd.read_sql_query(sql, conn)
+        if columns is not None:
+            df = df[list(columns)]
+    return apply_dtypes(df)
+
+
+# Função para carregar uma fonte CSV, Parquet ou SQLite com cache
+def load_source(path, columns=None, table="vendas", query=None):
+    version = os.stat(path).st_mtime_ns
+    if columns is not None:
+        columns = tuple(columns)
+    return _read_source(path, source_kind(path), version, columns, table, query)
+
+
+# Função para carregar dados de exemplo
+def load_example_data():
+    return load_source(EXAMPLE_DATA_PATH)
+
+
+# Função para obter a versão dos dados de exemplo (mtime do arquivo)
+def example_data_version():
+    return os.stat(EXAMPLE_DATA_PATH).st_mtime_ns
@@ -0,0 +1,362 @@
+import os
+import queue
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from portfolio import profiling
+from portfolio.cube import GRAIN_COLUMNS, GRAINS, day_grain_keys, grain_labels
+from portfolio.data import EXAMPLE_DATA_PATH, METRICAS
+from portfolio.periods import PeriodLabels, month_keys
+from portfolio.settings import CACHE_MAX_ENTRIES
+
+# Conexões mantidas abertas por banco, compartilhadas entre as sessões
+POOL_SIZE = 4
+
+# Segundos esperando uma conexão livre antes de desistir
+POOL_TIMEOUT = 10
+
+# Instruções preparadas guardadas por conexão SQLite (reaproveitadas pelo texto da consulta)
+STATEMENT_CACHE = 128
+
+# Tabela de vendas: dia (dias desde 1970-01-01, nulo sem datas), mês (ano*12 + mês ou
+# código do mês) e uma coluna por métrica
+TABLE = "vendas"
+METRIC_COLUMNS = {metric: metric.lower() for metric in METRICAS}
+
+# Expressão SQL da chave de cada granularidade (aritmética inteira portável); o resto
+# é normalizado porque o % do SQLite e do PostgreSQL trunca (negativo antes de 1970),
+# enquanto as chaves semanais do cubo usam o resto da divisão inteira do numpy
+GRAIN_EXPRESSIONS = {
+    'day': "dia",
+    'week': "dia - ((dia + 3) % 7 + 7) % 7",
+    'month': "mes",
+    'quarter': "mes / 3",
+}
+
+
+# Backend SQLite (padrão): arquivo local, sem serviços externos
+class SqliteBackend:
+    placeholder = "?"
+    version_query = None
+
+    def __init__(self, path):
+        self.path = path
+
+    def connect(self):
+        return sqlite3.connect(self.path, check_same_thread=False, cached_statements=STATEMENT_CACHE)
+
+    # O texto da consulta é a chave do cache de instruções preparadas da conexão
+    def execute(self, connection, sql, params=()):
+        return connection.execute(sql, params).fetchall()
+
+    def executemany(self, connection, sql, rows):
+        connection.executemany(sql, rows)
+        connection.commit()
+
+    # Versão dos dados, para invalidar os caches: mtime do arquivo e, em modo WAL, mtime
+    # e tamanho do -wal, onde ficam as escritas ainda não copiadas para o arquivo
+    # principal (o PRAGMA data_version só vale dentro de uma mesma conexão)
+    def version(self):
+        try:
+            wal = os.stat(f"{self.path}-wal")
+        except FileNotFoundError:
+            wal_version = None
+        else:
+            wal_version = (wal.st_mtime_ns, wal.st_size)
+        return os.stat(self.path).st_mtime_ns, wal_version
+
+
+# Backend PostgreSQL (requer o pacote psycopg); consultas preparadas no servidor
+class PostgresBackend:
+    placeholder = "%s"
+    # Sem mtime no servidor: a versão dos dados vem dos contadores de escrita da tabela
+    # (o relid muda quando a tabela é recriada pela importação)
+    version_query = (
+        "SELECT relid, n_tup_ins, n_tup_upd, n_tup_del FROM pg_stat_user_tables WHERE relname = %s"
+    )
+
+    def __init__(self, url):
+        self.url = url
+
+    def connect(self):
+        try:
+            import psycopg
+        except ImportError as exc:
+            raise ImportError("O backend PostgreSQL requer o pacote psycopg") from exc
+        # Autocommit: as consultas do painel são só leituras e as conexões do pool não
+        # podem ficar paradas dentro de uma transação aberta
+        return psycopg.connect(self.url, autocommit=True)
+
+    def execute(self, connection, sql, params=()):
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params, prepare=True)
+            return cursor.fetchall() if cursor.description else []
+
+    def executemany(self, connection, sql, rows):
+        with connection.cursor() as cursor:
+            cursor.executemany(sql, rows)
+        connection.commit()
+
+
+# Backends disponíveis por esquema da URL
+BACKENDS = {
+    "sqlite": SqliteBackend,
+    "postgres": PostgresBackend,
+    "postgresql": PostgresBackend,
+}
+
+
+# Função para criar o backend de uma URL (sqlite:///caminho, postgresql://...);
+# um caminho sem esquema é um arquivo SQLite
+def backend_from_url(url):
+    scheme, sep, rest = url.partition("://")
+    if not sep:
+        return SqliteBackend(url)
+    if scheme not in BACKENDS:
+        raise ValueError(f"Banco de dados não suportado: {scheme}")
+    if scheme == "sqlite":
+        return SqliteBackend(rest[1:] if rest.startswith("/") else rest)
+    return BACKENDS[scheme](url)
+
+
+# Pool de conexões: reaproveita até `size` conexões abertas entre as sessões
+class ConnectionPool:
+    def __init__(self, connect, size=POOL_SIZE, timeout=POOL_TIMEOUT):
+        self._connect = connect
+        self.size = size
+        self.timeout = timeout
+        self._idle = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def _acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._created < self.size:
+                self._created += 1
+                try:
+                    return self._connect()
+                except Exception:
+                    self._created -= 1
+                    raise
+        try:
+            return self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise TimeoutError("Nenhuma conexão livre no pool") from None
+
+    # Conexão emprestada do pool; em caso de erro ela é descartada em vez de devolvida
+    # (inclusive nas interrupções do rerun do Streamlit, que não são Exception)
+    @contextmanager
+    def connection(self):
+        connection = self._acquire()
+        try:
+            yield connection
+        except BaseException:
+            connection.close()
+            with self._lock:
+                self._created -= 1
+            raise
+        self._idle.put(connection)
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+            with self._lock:
+                self._created -= 1
+
+
+# Fonte de vendas em banco SQL: filtros por intervalo e agregações rodam no banco, e só
+# os totais ou a série agregada voltam para o Python; cada consulta é cronometrada
+class SqlSource:
+    def __init__(self, backend, pool_size=POOL_SIZE):
+        self.backend = backend
+        self.pool = ConnectionPool(backend.connect, pool_size)
+        self.stats = {}
+        self._lock = threading.Lock()
+        p = backend.placeholder
+        sums = ", ".join(f"SUM({column})" for column in METRIC_COLUMNS.values())
+        # Textos fixos por consulta: o banco reaproveita as instruções preparadas
+        self.queries = {
+            "totais": f"SELECT {sums} FROM {TABLE} WHERE mes BETWEEN {p} AND {p}",
+            "tem_dias": f"SELECT 1 FROM {TABLE} WHERE dia IS NOT NULL LIMIT 1",
+            **({"versao": backend.version_query} if backend.version_query else {}),
+            **{
+                f"periodos:{grain}": f"SELECT DISTINCT {expr} AS k FROM {TABLE} ORDER BY k"
+                for grain, expr in GRAIN_EXPRESSIONS.items()
+            },
+            **{
+                f"serie:{grain}": (
+                    f"SELECT {expr} AS k, {sums} FROM {TABLE} WHERE mes BETWEEN {p} AND {p} "
+                    "GROUP BY k ORDER BY k"
+                )
+                for grain, expr in GRAIN_EXPRESSIONS.items()
+            },
+        }
+
+    # Executa uma consulta nomeada, registrando o tempo (também no perfil de renderização)
+    def query(self, name, params=()):
+        start = time.perf_counter()
+        with profiling.section(name, kind="query"), self.pool.connection() as connection:
+            rows = self.backend.execute(connection, self.queries[name], params)
+        seconds = time.perf_counter() - start
+        with self._lock:
+            entry = self.stats.setdefault(name, {"calls": 0, "seconds": 0.0, "max_seconds": 0.0, "rows": 0})
+            entry["calls"] += 1
+            entry["seconds"] += seconds
+            entry["max_seconds"] = max(entry["max_seconds"], seconds)
+            entry["rows"] += len(rows)
+        return rows
+
+    # Cópia das estatísticas das consultas (para o painel de depuração)
+    def query_stats(self):
+        with self._lock:
+            return {name: dict(entry) for name, entry in self.stats.items()}
+
+    # Versão dos dados: arquivos do SQLite ou a consulta de versão do backend
+    def version(self):
+        if self.backend.version_query is None:
+            return self.backend.version()
+        rows = self.query("versao", (TABLE,))
+        return tuple(rows[0]) if rows else None
+
+    # A tabela tem datas? (sem datas só há mês e trimestre, e os meses não têm ano)
+    def has_days(self):
+        return bool(self.query("tem_dias"))
+
+    # Chaves ordenadas de uma granularidade
+    def period_keys(self, grain):
+        return np.array([row[0] for row in self.query(f"periodos:{grain}")], dtype=np.int64)
+
+    # Totais das métricas entre duas chaves mensais, inclusive
+    def totals(self, start_month, end_month):
+        row = self.query("totais", (int(start_month), int(end_month)))[0]
+        return {metric: int(value or 0) for metric, value in zip(METRIC_COLUMNS, row)}
+
+    # Série agregada numa granularidade entre duas chaves mensais, inclusive
+    def series(self, grain, start_month, end_month, with_year=True):
+        rows = self.query(f"serie:{grain}", (int(start_month), int(end_month)))
+        keys = np.array([row[0] for row in rows], dtype=np.int64)
+        if grain in ('day', 'week'):
+            periods = keys.astype('datetime64[D]')
+        else:
+            periods = grain_labels(grain, keys, with_year)
+        data = {GRAIN_COLUMNS[grain]: periods}
+        for i, metric in enumerate(METRIC_COLUMNS, start=1):
+            data[metric] = np.array([row[i] or 0 for row in rows], dtype=np.int64)
+        return pd.DataFrame(data)
+
+
+# Granularidade de uma fonte SQL com a mesma interface usada pelo painel que a Rollup
+# do cubo em memória, mas com totais e séries consultados no banco
+class SqlRollup(PeriodLabels):
+    def __init__(self, source, grain, with_year):
+        self.source = source
+        self.grain = grain
+        self.with_year = with_year
+        self.keys = source.period_keys(grain)
+        super().__init__(grain_labels(grain, self.keys, with_year))
+
+    @property
+    def column(self):
+        return GRAIN_COLUMNS[self.grain]
+
+    # Totais entre dois meses (só na granularidade mensal, que alimenta os filtros)
+    def totals(self, start, end):
+        start_pos, end_pos = self.normalize(start, end)
+        return self.source.totals(self.keys[start_pos], self.keys[end_pos])
+
+    def month_series(self, start_month, end_month, metrics=None):
+        if start_month > end_month:
+            start_month, end_month = end_month, start_month
+        series = self.source.series(self.grain, start_month, end_month, self.with_year)
+        return series[[self.column, *metrics]] if metrics else series
+
+
+# Cubo de uma fonte SQL: as granularidades são montadas sob demanda
+class SqlCube:
+    def __init__(self, source):
+        self.source = source
+        self.with_year = source.has_days()
+        self.grains = list(GRAINS) if self.with_year else ['month', 'quarter']
+        self._rollups = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, grain):
+        if grain not in self.grains:
+            raise KeyError(f"Granularidade indisponível: {grain}")
+        with self._lock:
+            if grain not in self._rollups:
+                self._rollups[grain] = SqlRollup(self.source, grain, self.with_year)
+            return self._rollups[grain]
+
+
+# Fonte SQL por URL, uma por processo (o pool é compartilhado entre as sessões)
+@st.cache_resource(show_spinner=False)
+def get_sql_source(url):
+    return SqlSource(backend_from_url(url))
+
+
+# Cubo de uma versão dos dados; uma nova versão remonta as chaves dos períodos
+@st.cache_resource(max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def _sql_cube(url, version):
+    return SqlCube(get_sql_source(url))
+
+
+# Função para obter o cubo de uma fonte SQL e a versão dos dados
+def load_sql_cube(url):
+    version = get_sql_source(url).version()
+    return _sql_cube(url, version), version
+
+
+# Função para importar uma fonte CSV/Parquet para a tabela de vendas, em blocos
+def import_source(url, path=EXAMPLE_DATA_PATH):
+    from portfolio.ingest import _has_column, iter_chunks
+
+    backend = backend_from_url(url)
+    if isinstance(backend, SqliteBackend):
+        os.makedirs(os.path.dirname(os.path.abspath(backend.path)), exist_ok=True)
+    has_dates = _has_column(path, 'Data')
+    columns = ['Data' if has_dates else 'Mês', *METRICAS]
+    placeholders = ", ".join([backend.placeholder] * (2 + len(METRIC_COLUMNS)))
+    connection = backend.connect()
+    try:
+        backend.execute(connection, f"DROP TABLE IF EXISTS {TABLE}")
+        metric_columns = ", ".join(f"{column} BIGINT" for column in METRIC_COLUMNS.values())
+        backend.execute(connection, f"CREATE TABLE {TABLE} (dia INTEGER, mes INTEGER NOT NULL, {metric_columns})")
+        insert = f"INSERT INTO {TABLE} (dia, mes, {', '.join(METRIC_COLUMNS.values())}) VALUES ({placeholders})"
+        rows = 0
+        for chunk, _ in iter_chunks(path, columns):
+            if has_dates:
+                days = chunk['Data'].to_numpy('datetime64[ns]').astype('datetime64[D]').astype(np.int64)
+                months = day_grain_keys(days)['month']
+                days = days.tolist()
+            else:
+                months = month_keys(chunk)[0]
+                days = [None] * len(chunk)
+            values = [chunk[metric].to_numpy(np.int64).tolist() for metric in METRICAS]
+            backend.executemany(connection, insert, zip(days, months.tolist(), *values))
+            rows += len(chunk)
+        backend.execute(connection, f"CREATE INDEX {TABLE}_mes ON {TABLE} (mes)")
+        connection.commit()
+    finally:
+        connection.close()
+    return rows
+
+
+# Uso: python -m portfolio.database sqlite:///.cache/vendas.sqlite [fonte.csv|fonte.parquet]
+if __name__ == "__main__":
+    url, *source = sys.argv[1:] or ["sqlite:///" + os.path.join(".cache", "vendas.sqlite")]
+    print(f"{import_source(url, *source):,} linhas importadas em {url}".replace(",", "."))
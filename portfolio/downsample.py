@@ -0,0 +1,87 @@
+import numpy as np
+
+# Pontos enviados por gráfico: próximo da largura em pixels do gráfico no layout "wide";
+# mais pontos que isso não aparecem na tela e só aumentam o payload
+CHART_POINTS = 1200
+
+# Métodos de redução disponíveis
+METHODS = ('lttb', 'minmax')
+
+
+# Função para converter o eixo x em números (datas viram inteiros; rótulos, posições)
+def _numeric_x(x):
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        return x.astype('datetime64[ns]').astype(np.int64).astype(np.float64)
+    if np.issubdtype(x.dtype, np.number):
+        return x.astype(np.float64)
+    return np.arange(len(x), dtype=np.float64)
+
+
+# Função para reduzir uma série com Largest-Triangle-Three-Buckets: mantém o primeiro e o
+# último ponto e, em cada balde, o ponto que forma o maior triângulo com o ponto escolhido
+# no balde anterior e a média do balde seguinte; devolve as posições escolhidas
+def lttb(x, y, n_out):
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = _numeric_x(x)
+    # Lacunas (NaN) contam como zero só para escolher os pontos
+    y = np.nan_to_num(np.asarray(y, dtype=np.float64))
+    # Limites dos n_out - 2 baldes internos (o primeiro e o último ponto ficam fora)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    # Médias de cada balde via somas prefixadas (o último "balde seguinte" é o ponto final)
+    prefix_x = np.r_[0.0, np.cumsum(x)]
+    prefix_y = np.r_[0.0, np.cumsum(y)]
+    counts = np.maximum(edges[1:] - edges[:-1], 1)
+    mean_x = np.r_[(prefix_x[edges[1:]] - prefix_x[edges[:-1]]) / counts, x[-1]]
+    mean_y = np.r_[(prefix_y[edges[1:]] - prefix_y[edges[:-1]]) / counts, y[-1]]
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for bucket in range(n_out - 2):
+        start, stop = edges[bucket], max(edges[bucket + 1], edges[bucket] + 1)
+        bx, by = x[start:stop], y[start:stop]
+        cx, cy = mean_x[bucket + 1], mean_y[bucket + 1]
+        # Dobro da área do triângulo (a, b, c) para cada candidato b do balde
+        area = np.abs((x[a] - cx) * (by - y[a]) - (x[a] - bx) * (cy - y[a]))
+        a = start + int(np.argmax(area))
+        selected[bucket + 1] = a
+    return selected
+
+
+# Função para reduzir uma série guardando o mínimo e o máximo de cada balde (totalmente
+# vetorizada: picos e vales nunca somem); devolve as posições escolhidas, em ordem
+def minmax(x, y, n_out):
+    n = len(y)
+    buckets = n_out // 2
+    if n_out >= n or buckets < 1:
+        return np.arange(n)
+    y = np.nan_to_num(np.asarray(y, dtype=np.float64))
+    # Baldes de tamanho igual; o resto da divisão fica com o último balde
+    size = n // buckets
+    body = y[:size * buckets].reshape(buckets, size)
+    offsets = np.arange(buckets) * size
+    picks = [offsets + body.argmin(axis=1), offsets + body.argmax(axis=1), [0, n - 1]]
+    if n > size * buckets:
+        tail = y[size * buckets:]
+        picks.append([size * buckets + int(tail.argmin()), size * buckets + int(tail.argmax())])
+    return np.unique(np.concatenate(picks))
+
+
+# Função para reduzir um DataFrame com várias métricas: o orçamento de pontos é dividido
+# entre as métricas e as posições escolhidas para cada uma são unidas, de modo que todas
+# as linhas do gráfico compartilham o mesmo eixo x
+def downsample_frame(df, x, ys, max_points=CHART_POINTS, method='lttb'):
+    if method not in METHODS:
+        raise ValueError(f"Método de redução desconhecido: {method}")
+    if len(df) <= max_points:
+        return df
+    reduce = lttb if method == 'lttb' else minmax
+    budget = max(max_points // max(len(ys), 1), 3)
+    x_values = df[x].to_numpy()
+    positions = np.unique(np.concatenate([
+        reduce(x_values, df[column].to_numpy(), budget) for column in ys
+    ]))
+    return df.iloc[positions].reset_index(drop=True)
@@ -0,0 +1,346 @@
+import argparse
+import html
+import json
+import math
+import os
+import re
+import sys
+from string import Template
+from urllib.parse import quote
+
+from portfolio.assets import ASSETS_DIR, THEME_SOURCE, minify_css, write_atomic, write_hashed
+from portfolio.pages import PAGES
+from portfolio.settings import ROOT_DIR
+
+# Páginas exportadas (só conteúdo, sem dados do usuário): nome no menu, módulo e arquivo
+STATIC_PAGES = {
+    page: (PAGES[page], filename)
+    for page, filename in (
+        ("Início", "index.html"),
+        ("Sobre Mim", "sobre.html"),
+        ("Habilidades", "habilidades.html"),
+        ("Contato", "contato.html"),
+    )
+}
+
+# Ordem do menu (a mesma do aplicativo); as demais páginas continuam no Streamlit e
+# são ligadas pelo endereço do aplicativo (?pagina=)
+MENU = tuple(PAGES)
+
+# Pasta de saída padrão e subpasta dos arquivos com hash no nome
+EXPORT_DIR = os.path.join(ROOT_DIR, "dist")
+ASSETS_SUBDIR = "assets"
+
+EXPORT_CSS = os.path.join(ASSETS_DIR, "export.css")
+
+# Chave do estado da sessão com as miniaturas usadas no rerun exportado, na ordem
+IMAGES_KEY = "_export_images"
+
+PAGE = Template("""<!DOCTYPE html>
+<html lang="pt-BR">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>$title | Eduardo Machado | Analista de Dados</title>
+<link rel="stylesheet" href="$stylesheet">
+</head>
+<body>
+<div class="stApp">
+<nav class="export-nav">$nav</nav>
+<main class="export-main">$body</main>
+<footer class="export-footer"><small>Eduardo Machado · Analista de Dados</small></footer>
+</div>
+$scripts</body>
+</html>
+""")
+
+CHART_SCRIPT = Template('<script>Plotly.newPlot("$id", $data, $layout, {"displayModeBar": false, "responsive": true});</script>')
+
+# Geometria (unidades do viewBox) do gauge desenhado em SVG: raio externo, fração do
+# raio ocupada pela faixa e marcações do eixo
+GAUGE_RADIUS = 150
+GAUGE_BAND = 0.5
+GAUGE_TICKS = 5
+
+# Markdown usado nas páginas: títulos, negrito e links (inclusive de imagens)
+HEADING = re.compile(r"^(#{1,6})\s+(.*)$")
+BOLD = re.compile(r"\*\*(.+?)\*\*")
+IMAGE_LINK = re.compile(r"\[!\[([^\]]*)\]\(([^)]+)\)\]\(([^)]+)\)")
+IMAGE = re.compile(r"!\[([^\]]*)\]\(([^)]+)\)")
+LINK = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+
+
+# Função para converter o subconjunto de Markdown das páginas em HTML; blocos que já
+# são HTML (unsafe_allow_html) passam sem alteração
+def markdown_html(text):
+    text = text.strip()
+    if text.startswith("<"):
+        return text
+    blocks = []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        heading = HEADING.match(line)
+        if heading:
+            level = len(heading.group(1))
+            blocks.append(f"<h{level}>{_inline(heading.group(2))}</h{level}>")
+        else:
+            blocks.append(f"<p>{_inline(line)}</p>")
+    return "".join(blocks)
+
+
+def _inline(text):
+    text = html.escape(text, quote=False)
+    text = IMAGE_LINK.sub(r'<a href="\3"><img alt="\1" src="\2"></a>', text)
+    text = IMAGE.sub(r'<img alt="\1" src="\2">', text)
+    text = LINK.sub(r'<a href="\2">\1</a>', text)
+    return BOLD.sub(r"<strong>\1</strong>", text)
+
+
+# Conversão da árvore de elementos de um rerun (AppTest) em HTML: colunas viram
+# flexbox, gauges viram SVG estático, os demais gráficos plotly usam o mesmo spec
+# enviado ao navegador e as imagens são copiadas com o hash do conteúdo no nome
+class PageExporter:
+    def __init__(self, assets_dir, assets_url, images):
+        self.assets_dir = assets_dir
+        self.assets_url = assets_url
+        self.images = iter(images)
+        self.charts = []
+
+    def render(self, node):
+        element = getattr(node, "type", None)
+        children = getattr(node, "children", None)
+        if children is not None:
+            inner = "".join(self.render(child) for child in children.values())
+            if element == "column":
+                return f'<div class="export-col" style="flex: {node.proto.weight:.4f};">{inner}</div>'
+            if children and all(getattr(child, "type", None) == "column" for child in children.values()):
+                return f'<div class="export-row">{inner}</div>'
+            return inner
+        method = getattr(self, "_" + str(element), None)
+        return method(node) if method is not None else ""
+
+    def _markdown(self, node):
+        return markdown_html(node.value)
+
+    def _metric(self, node):
+        return (
+            f'<div class="export-metric"><div class="label">{html.escape(node.label)}</div>'
+            f'<div class="value">{html.escape(str(node.value))}</div></div>'
+        )
+
+    def _button(self, node):
+        return f'<div class="stButton"><button type="button">{html.escape(node.label)}</button></div>'
+
+    def _info(self, node):
+        return f'<div class="export-alert">{markdown_html(node.value)}</div>'
+
+    def _progress(self, node):
+        return f'<div class="stProgress"><div><div style="width: {int(node.proto.value)}%;"></div></div></div>'
+
+    # Gauges são desenhados em SVG (sem plotly.js); nos outros gráficos o div fica no
+    # corpo e o script que o desenha vai depois do plotly.js
+    def _plotly_chart(self, node):
+        spec = json.loads(node.proto.spec)
+        traces = spec.get("data", [])
+        if traces and all(trace.get("type") == "indicator" and "gauge" in trace.get("mode", "") for trace in traces):
+            layout = _chart_layout(spec.get("layout", {}))
+            return "".join(f'<div class="export-gauge">{gauge_svg(trace, layout)}</div>' for trace in traces)
+        chart_id = f"grafico-{len(self.charts) + 1}"
+        self.charts.append(CHART_SCRIPT.substitute(
+            id=chart_id,
+            data=json.dumps(spec.get("data", []), separators=(",", ":")),
+            layout=json.dumps(_chart_layout(spec.get("layout", {})), separators=(",", ":")),
+        ))
+        return f'<div class="export-chart" id="{chart_id}"></div>'
+
+    # As imagens da página são as miniaturas pedidas a image_path, na mesma ordem
+    def _image(self, node):
+        parts = []
+        for image in node.proto.imgs:
+            name = self._copy_image(next(self.images))
+            alt = html.escape(image.caption or "", quote=True)
+            parts.append(f'<img class="export-image" src="{self.assets_url}/{name}" alt="{alt}">')
+        return "".join(parts)
+
+    # Copia a miniatura (nome.hash.largura.webp) para a pasta de assets; o nome no site
+    # não muda entre exportações, então a cópia de uma versão anterior é removida
+    def _copy_image(self, path):
+        # O nome da origem pode ter pontos; só as três últimas partes são fixas
+        stem, _, width, suffix = os.path.basename(path).rsplit(".", 3)
+        with open(path, "rb") as f:
+            return write_hashed(self.assets_dir, f"{stem}-{width}", suffix, f.read())
+
+
+# Função para calcular o ponto do arco de um gauge no valor (0 à esquerda, máximo à direita)
+def _gauge_point(value, low, high, radius, cx, cy):
+    angle = math.pi * (1 - (value - low) / (high - low))
+    return cx + radius * math.cos(angle), cy - radius * math.sin(angle)
+
+
+# Função para montar o caminho SVG de um trecho da faixa do gauge, entre dois valores
+def _gauge_band(start, end, low, high, inner, outer, cx, cy):
+    start, end = sorted((min(max(start, low), high), min(max(end, low), high)))
+    x0, y0 = _gauge_point(start, low, high, outer, cx, cy)
+    x1, y1 = _gauge_point(end, low, high, outer, cx, cy)
+    x2, y2 = _gauge_point(end, low, high, inner, cx, cy)
+    x3, y3 = _gauge_point(start, low, high, inner, cx, cy)
+    return (
+        f"M{x0:.1f},{y0:.1f} A{outer},{outer} 0 0 1 {x1:.1f},{y1:.1f} "
+        f"L{x2:.1f},{y2:.1f} A{inner},{inner} 0 0 0 {x3:.1f},{y3:.1f} Z"
+    )
+
+
+# Função para desenhar um indicador plotly (mode "gauge+number") como SVG estático, com
+# a faixa, os intervalos, a barra do valor, o limite, o eixo, o número e o título
+def gauge_svg(trace, layout):
+    gauge = trace.get("gauge", {})
+    axis = gauge.get("axis", {})
+    low, high = [default if bound is None else bound for bound, default in zip(axis.get("range", [0, 100]), (0, 100))]
+    value = trace.get("value", low)
+    margin = layout.get("margin", {})
+    height = layout.get("height", 300)
+    outer = GAUGE_RADIUS
+    inner = outer * (1 - GAUGE_BAND)
+    width = 2 * outer + 2 * max(margin.get("l", 20), margin.get("r", 20), 30)
+    cx, cy = width / 2, height - margin.get("b", 20) - 20
+    text_color = html.escape(layout.get("font", {}).get("color", "#F1F5F9"), quote=True)
+
+    def band(start, end, color, extra=""):
+        path = _gauge_band(start, end, low, high, inner, outer, cx, cy)
+        return f'<path d="{path}" fill="{html.escape(color, quote=True)}"{extra}/>'
+
+    parts = [band(
+        low, high, gauge.get("bgcolor", "rgba(0,0,0,0)"),
+        f' stroke="{html.escape(gauge.get("bordercolor", text_color), quote=True)}" stroke-width="{gauge.get("borderwidth", 1)}"',
+    )]
+    for step in gauge.get("steps", []):
+        parts.append(band(*step["range"], step.get("color", "rgba(0,0,0,0)")))
+    bar = gauge.get("bar", {})
+    bar_inset = (outer - inner) * (1 - bar.get("thickness", 1)) / 2
+    parts.append(f'<path d="{_gauge_band(low, value, low, high, inner + bar_inset, outer - bar_inset, cx, cy)}" '
+                 f'fill="{html.escape(bar.get("color", "#60A5FA"), quote=True)}"/>')
+    threshold = gauge.get("threshold")
+    if threshold:
+        inset = (outer - inner) * (1 - threshold.get("thickness", 0.85)) / 2
+        x0, y0 = _gauge_point(threshold["value"], low, high, inner + inset, cx, cy)
+        x1, y1 = _gauge_point(threshold["value"], low, high, outer - inset, cx, cy)
+        line = threshold.get("line", {})
+        parts.append(f'<line x1="{x0:.1f}" y1="{y0:.1f}" x2="{x1:.1f}" y2="{y1:.1f}" '
+                     f'stroke="{html.escape(line.get("color", text_color), quote=True)}" stroke-width="{line.get("width", 1)}"/>')
+    for i in range(GAUGE_TICKS + 1):
+        tick = low + (high - low) * i / GAUGE_TICKS
+        x0, y0 = _gauge_point(tick, low, high, outer, cx, cy)
+        x1, y1 = _gauge_point(tick, low, high, outer + 6, cx, cy)
+        tx, ty = _gauge_point(tick, low, high, outer + 18, cx, cy)
+        parts.append(f'<line x1="{x0:.1f}" y1="{y0:.1f}" x2="{x1:.1f}" y2="{y1:.1f}" stroke="{text_color}" '
+                     f'stroke-width="{axis.get("tickwidth", 1)}"/>')
+        parts.append(f'<text x="{tx:.1f}" y="{ty + 4:.1f}" text-anchor="middle" font-size="12">{tick:g}</text>')
+    parts.append(f'<text x="{cx:.1f}" y="{cy - 8:.1f}" text-anchor="middle" font-size="{outer * 0.4:.0f}">{value:g}</text>')
+    title = trace.get("title", {}).get("text")
+    if title:
+        parts.append(f'<text x="{cx:.1f}" y="{margin.get("t", 50) / 2 + 6:.1f}" text-anchor="middle" font-size="18">'
+                     f'{html.escape(title)}</text>')
+    return (
+        f'<svg viewBox="0 0 {width:.0f} {height}" role="img" aria-label="{html.escape(title or "", quote=True)}: {value:g}" '
+        f'fill="{text_color}" font-family="Arial, sans-serif">{"".join(parts)}</svg>'
+    )
+
+
+# Layout do gráfico com o fundo transparente e o texto claro do tema do aplicativo
+def _chart_layout(layout):
+    layout = dict(layout)
+    layout.setdefault("paper_bgcolor", "rgba(0,0,0,0)")
+    layout.setdefault("plot_bgcolor", "rgba(0,0,0,0)")
+    layout.setdefault("font", {"color": "#F1F5F9"})
+    layout.pop("template", None)
+    return layout
+
+
+# Função para renderizar uma página sem a barra lateral e o menu; devolve a área
+# principal e as miniaturas que a página usou, na ordem
+def render_page(module_name):
+    from streamlit.testing.v1 import AppTest
+
+    script = (
+        "import importlib\n"
+        "import streamlit as st\n"
+        "from portfolio.export import IMAGES_KEY\n"
+        "from portfolio.images import recording\n"
+        "with recording() as used:\n"
+        f"    importlib.import_module({module_name!r}).render()\n"
+        "st.session_state[IMAGES_KEY] = used\n"
+    )
+    at = AppTest.from_string(script, default_timeout=120)
+    at.run()
+    if at.exception:
+        raise RuntimeError(f"Falha ao renderizar {module_name}: {at.exception[0].message}")
+    return at.main, at.session_state[IMAGES_KEY]
+
+
+# Menu de navegação: páginas estáticas por arquivo, dinâmicas pelo aplicativo
+def navigation(current, app_url):
+    links = ['<a class="brand" href="index.html">Eduardo<span style="color: #60A5FA;">.dev</span></a>']
+    for page in MENU:
+        if page in STATIC_PAGES:
+            href = STATIC_PAGES[page][1]
+        else:
+            href = f"{app_url}?pagina={quote(page)}"
+        selected = " nav-link-selected" if page == current else ""
+        links.append(f'<a class="nav-link{selected}" href="{href}">{html.escape(page)}</a>')
+    return "".join(links)
+
+
+# Função para exportar as páginas de conteúdo como HTML estático: CSS e imagens (e o
+# plotly.js, só se alguma página tiver um gráfico que não seja gauge) vão para assets/
+# com o hash do conteúdo no nome (podem ser servidos com cache longo)
+def export_site(output_dir=EXPORT_DIR, app_url="/"):
+    assets_dir = os.path.join(output_dir, ASSETS_SUBDIR)
+    os.makedirs(assets_dir, exist_ok=True)
+
+    css = ""
+    for source in (THEME_SOURCE, EXPORT_CSS):
+        with open(source, encoding="utf-8") as f:
+            css += minify_css(f.read())
+    stylesheet = write_hashed(assets_dir, "site", "min.css", css.encode("utf-8"))
+    plotly_js = None
+
+    written = []
+    for page, (module_name, filename) in STATIC_PAGES.items():
+        tree, images = render_page(module_name)
+        exporter = PageExporter(assets_dir, ASSETS_SUBDIR, images)
+        body = exporter.render(tree)
+        scripts = ""
+        if exporter.charts:
+            if plotly_js is None:
+                from plotly.offline import get_plotlyjs
+
+                plotly_js = write_hashed(assets_dir, "plotly", "min.js", get_plotlyjs().encode("utf-8"))
+            scripts = f'<script src="{ASSETS_SUBDIR}/{plotly_js}"></script>\n' + "\n".join(exporter.charts) + "\n"
+        document = PAGE.substitute(
+            title=html.escape(page),
+            stylesheet=f"{ASSETS_SUBDIR}/{stylesheet}",
+            nav=navigation(page, app_url),
+            body=body,
+            scripts=scripts,
+        )
+        path = os.path.join(output_dir, filename)
+        write_atomic(path, document.encode("utf-8"))
+        written.append(path)
+    return written
+
+
+# Uso: python -m portfolio.export [pasta] [--app-url https://app.exemplo.com/]
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Exporta as páginas de conteúdo como HTML estático")
+    parser.add_argument("output", nargs="?", default=EXPORT_DIR)
+    parser.add_argument("--app-url", default="/", help="endereço do aplicativo Streamlit (Projetos e Dashboard Demo)")
+    args = parser.parse_args(argv)
+    for path in export_site(args.output, args.app_url):
+        print(path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
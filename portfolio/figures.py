@@ -0,0 +1,218 @@
+import hashlib
+import json
+import sys
+import threading
+from collections import OrderedDict
+
+import streamlit as st
+
+from portfolio.shared_cache import cache_key, get_shared_cache
+
+# Limites padrão do cache de figuras
+FIGURE_CACHE_MAX_ENTRIES = 64
+FIGURE_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+# Acima deste número de pontos por gráfico, as linhas são desenhadas em WebGL
+# (Scattergl) em vez de SVG, que fica lento com dezenas de milhares de nós
+WEBGL_POINTS = 5000
+
+# Modos de renderização dos gráficos de linha
+RENDER_MODES = ("auto", "svg", "webgl")
+
+
+# Função para gerar uma representação estável (hashável) dos parâmetros de um gráfico;
+# pandas e numpy só são consultados se já tiverem sido importados por outra página
+def _digest_value(value):
+    pd = sys.modules.get("pandas")
+    np = sys.modules.get("numpy")
+    if pd is not None and isinstance(value, (pd.DataFrame, pd.Series)):
+        hashed = pd.util.hash_pandas_object(value, index=True).to_numpy()
+        columns = list(value.columns) if isinstance(value, pd.DataFrame) else [value.name]
+        return {"pandas": hashlib.sha256(hashed.tobytes()).hexdigest(), "columns": columns}
+    if np is not None and isinstance(value, np.ndarray):
+        return {"ndarray": hashlib.sha256(value.tobytes()).hexdigest(), "dtype": str(value.dtype), "shape": value.shape}
+    if isinstance(value, dict):
+        return {str(k): _digest_value(v) for k, v in sorted(value.items(), key=lambda item: str(item[0]))}
+    if isinstance(value, (list, tuple)):
+        return [_digest_value(v) for v in value]
+    return value
+
+
+# Função para calcular a chave de cache de um construtor de gráfico com seus parâmetros
+def figure_key(builder, params):
+    payload = json.dumps(
+        [builder.__module__, builder.__qualname__, _digest_value(params)],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# Cache LRU de figuras plotly, limitado por número de entradas e bytes serializados
+class FigureCache:
+    def __init__(self, max_entries=FIGURE_CACHE_MAX_ENTRIES, max_bytes=FIGURE_CACHE_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    # Busca a entrada (figura, JSON) na memória, depois no cache compartilhado entre
+    # processos, ou constrói e armazena na primeira chamada
+    def _entry(self, builder, params):
+        key = figure_key(builder, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        shared = get_shared_cache()
+        entry, found = shared.get(cache_key("figuras", key)) if shared is not None else (None, False)
+        if not found:
+            figure = builder(**params)
+            entry = (figure, figure.to_json())
+            if shared is not None:
+                shared.set(cache_key("figuras", key), entry)
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = entry
+                self._bytes += len(entry[1])
+                self._evict()
+        return entry
+
+    # Remove as entradas menos usadas até respeitar os limites
+    def _evict(self):
+        while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            _, (_, spec) = self._entries.popitem(last=False)
+            self._bytes -= len(spec)
+            self.evictions += 1
+
+    # Figura memoizada (a mesma instância é compartilhada: não deve ser alterada)
+    def figure(self, builder, **params):
+        return self._entry(builder, params)[0]
+
+    # JSON serializado da figura memoizada
+    def figure_json(self, builder, **params):
+        return self._entry(builder, params)[1]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    @property
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+
+# Instância única do cache por processo, compartilhada entre as sessões
+@st.cache_resource(show_spinner=False)
+def get_figure_cache():
+    return FigureCache()
+
+
+# Função para obter uma figura do cache compartilhado
+def cached_figure(builder, **params):
+    return get_figure_cache().figure(builder, **params)
+
+
+# Gráfico de indicador (gauge) da página inicial
+def gauge_figure(value, title):
+    import plotly.graph_objects as go
+
+    fig = go.Figure(go.Indicator(
+        mode = "gauge+number",
+        value = value,
+        domain = {'x': [0, 1], 'y': [0, 1]},
+        title = {'text': title, 'font': {'color': "white"}},
+        gauge = {
+            'axis': {'range': [None, 100], 'tickwidth': 1, 'tickcolor': "white"},
+            'bar': {'color': "#60A5FA"},
+            'bgcolor': "rgba(30, 64, 175, 0.2)",
+            'borderwidth': 2,
+            'bordercolor': "white",
+            'steps': [
+                {'range': [0, 50], 'color': 'rgba(30, 64, 175, 0.2)'},
+                {'range': [50, value], 'color': 'rgba(30, 64, 175, 0.5)'}],
+            'threshold': {
+                'line': {'color': "white", 'width': 4},
+                'thickness': 0.75,
+                'value': value}}))
+
+    fig.update_layout(
+        paper_bgcolor = "rgba(0,0,0,0)",
+        plot_bgcolor = "rgba(0,0,0,0)",
+        font = {'color': "white", 'family': "Arial"},
+        height = 300,
+        margin = dict(l=20, r=20, t=50, b=20)
+    )
+    return fig
+
+
+# Função para preparar os valores de um eixo no formato binário do plotly
+def _binary_values(values):
+    import numpy as np
+
+    # Vetores numéricos do numpy são serializados pelo plotly como typed arrays em
+    # base64 ({"dtype", "bdata"}) em vez de listas JSON; datas viram milissegundos
+    # desde 1970 (o eixo é marcado como data no layout)
+    values = np.asarray(values)
+    if np.issubdtype(values.dtype, np.datetime64):
+        return values.astype("datetime64[ms]").astype(np.int64).astype(np.float64), True
+    if np.issubdtype(values.dtype, np.number):
+        return values.astype(np.float64, copy=False), False
+    return values, False
+
+
+# Gráfico de linhas da evolução das métricas no Dashboard Demo (uma linha por métrica);
+# no modo "auto" troca para WebGL quando o total de pontos passa de WEBGL_POINTS
+def line_figure(series, x, y, markers=True, render_mode="auto"):
+    import plotly.graph_objects as go
+
+    if render_mode not in RENDER_MODES:
+        raise ValueError(f"Modo de renderização desconhecido: {render_mode}")
+    if render_mode == "auto":
+        render_mode = "webgl" if len(series) * len(y) > WEBGL_POINTS else "svg"
+    trace = go.Scattergl if render_mode == "webgl" else go.Scatter
+
+    x_values, x_is_date = _binary_values(series[x].to_numpy())
+    fig = go.Figure([
+        trace(
+            x=x_values,
+            y=_binary_values(series[metric].to_numpy())[0],
+            name=metric,
+            mode="lines+markers" if markers else "lines",
+            hovertemplate=f"{metric}<br>{x}=%{{x}}<br>value=%{{y}}<extra></extra>",
+        )
+        for metric in y
+    ])
+    fig.update_layout(
+        paper_bgcolor = "rgba(0,0,0,0)",
+        plot_bgcolor = "rgba(0,0,0,0)",
+        font = {'color': "white", 'family': "Arial"},
+        legend_title_text = "",
+        xaxis_title_text = x,
+        yaxis_title_text = "value",
+        height = 400,
+        margin = dict(l=20, r=20, t=30, b=20)
+    )
+    if x_is_date:
+        fig.update_xaxes(type="date")
+    return fig
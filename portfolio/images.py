@@ -0,0 +1,121 @@
+import glob
+import hashlib
+import io
+import os
+import threading
+from contextlib import contextmanager
+
+import streamlit as st
+
+from portfolio.assets import write_atomic
+from portfolio.settings import ASSETS_DIR, STATIC_DIR
+
+# Imagens de origem (opcionais) e cache em disco das miniaturas geradas
+IMAGES_DIR = os.path.join(ASSETS_DIR, "img")
+THUMBNAILS_DIR = os.path.join(STATIC_DIR, "img")
+
+# Larguras fixas das miniaturas e qualidade da compressão WebP
+BREAKPOINTS = (160, 320, 480, 640, 960)
+WEBP_QUALITY = 80
+SOURCE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".webp")
+
+# Cores do tema usadas nas imagens geradas localmente
+PLACEHOLDER_BACKGROUND = (30, 64, 175)
+PLACEHOLDER_ACCENT = (96, 165, 250)
+PLACEHOLDER_TEXT = (241, 245, 249)
+
+
+# Função para escolher o menor breakpoint que cobre a largura exibida
+def breakpoint_for(width):
+    for candidate in BREAKPOINTS:
+        if candidate >= width:
+            return candidate
+    return BREAKPOINTS[-1]
+
+
+# Função para gerar uma imagem local com o rótulo centralizado (sem acesso à rede)
+def placeholder_image(label, size):
+    from PIL import Image, ImageDraw, ImageFont
+
+    width, height = size
+    image = Image.new("RGB", size, PLACEHOLDER_BACKGROUND)
+    draw = ImageDraw.Draw(image)
+    border = max(4, min(size) // 60)
+    draw.rectangle([0, 0, width - 1, height - 1], outline=PLACEHOLDER_ACCENT, width=border)
+
+    font_size = max(12, min(height // 4, int(width * 1.6 / max(len(label), 1))))
+    font = ImageFont.load_default(size=font_size)
+    draw.text((width / 2, height / 2), label, fill=PLACEHOLDER_TEXT, font=font, anchor="mm")
+    return image
+
+
+# Função para obter os bytes da imagem de origem: arquivo em assets/img ou imagem gerada
+def source_bytes(name, label, size):
+    for ext in SOURCE_EXTENSIONS:
+        path = os.path.join(IMAGES_DIR, name + ext)
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                return f.read()
+    buffer = io.BytesIO()
+    placeholder_image(label, size).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+# Função para gerar a miniatura WebP de uma largura; o nome leva o hash do conteúdo
+# de origem, então a miniatura em disco só é refeita quando a origem muda
+def build_thumbnail(data, stem, width, thumbnails_dir=THUMBNAILS_DIR):
+    from PIL import Image
+
+    digest = hashlib.sha256(data).hexdigest()[:12]
+    path = os.path.join(thumbnails_dir, f"{stem}.{digest}.{width}w.webp")
+    if os.path.exists(path):
+        return path
+
+    with Image.open(io.BytesIO(data)) as image:
+        image = image.convert("RGB")
+        if image.width > width:
+            height = round(image.height * width / image.width)
+            image = image.resize((width, height), Image.LANCZOS)
+        buffer = io.BytesIO()
+        image.save(buffer, format="WEBP", quality=WEBP_QUALITY, method=6)
+    write_atomic(path, buffer.getvalue())
+
+    # Versões anteriores da mesma miniatura: o nome é escapado e o hash tem tamanho fixo,
+    # para não apagar miniaturas de outra imagem cujo nome comece igual
+    pattern = f"{glob.escape(stem)}.{'[0-9a-f]' * len(digest)}.{width}w.webp"
+    for old_path in glob.glob(os.path.join(thumbnails_dir, pattern)):
+        if old_path != path:
+            os.remove(old_path)
+    return path
+
+
+# Miniaturas usadas pela thread atual, quando registradas (exportação estática)
+_recorder = threading.local()
+
+
+# Caminho da miniatura de uma imagem (resolvido uma vez por processo)
+@st.cache_resource(show_spinner=False)
+def _thumbnail_path(name, width, label, size):
+    stem = name.replace("/", "-")
+    return build_thumbnail(source_bytes(name, label, size), stem, breakpoint_for(width))
+
+
+# Função para obter o caminho da miniatura de uma imagem
+def image_path(name, width, label="", size=(800, 800)):
+    path = _thumbnail_path(name, width, label, size)
+    used = getattr(_recorder, "used", None)
+    if used is not None:
+        used.append(path)
+    return path
+
+
+# Contexto que registra, na ordem, as miniaturas pedidas pela thread atual (a exportação
+# estática lê os arquivos já em disco em vez dos arquivos de mídia do Streamlit)
+@contextmanager
+def recording():
+    used = _recorder.used = []
+    try:
+        yield used
+    finally:
+        _recorder.used = None
+
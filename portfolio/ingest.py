@@ -0,0 +1,196 @@
+import logging
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from portfolio.cube import build_cube_from_sums
+from portfolio.data import DTYPES, METRICAS, source_kind
+from portfolio.periods import month_keys
+from portfolio.shared_cache import cache_key, get_shared_cache
+
+logger = logging.getLogger(__name__)
+
+# Linhas lidas por bloco (CSV) ou por lote (Parquet); limita o pico de memória
+CHUNK_ROWS = 500_000
+
+# Intervalo (segundos) entre as atualizações do progresso na página
+PROGRESS_INTERVAL = 1.0
+
+
+# Função para ler um CSV em blocos; devolve (bloco, fração do arquivo já lida)
+def _iter_csv(path, columns, chunk_rows):
+    total = os.path.getsize(path) or 1
+    dtypes = {col: dtype for col, dtype in DTYPES.items() if col in columns}
+    parse_dates = ['Data'] if 'Data' in columns else None
+    with open(path, "rb") as f:
+        reader = pd.read_csv(f, usecols=columns, dtype=dtypes, parse_dates=parse_dates, chunksize=chunk_rows)
+        for chunk in reader:
+            yield chunk, min(f.tell() / total, 1.0)
+
+
+# Função para ler um Parquet em lotes (grupos de linhas); requer pyarrow
+def _iter_parquet(path, columns, chunk_rows):
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise ImportError("A leitura em streaming de Parquet requer o pacote pyarrow") from exc
+
+    parquet = pq.ParquetFile(path)
+    total = parquet.metadata.num_rows or 1
+    read = 0
+    for batch in parquet.iter_batches(batch_size=chunk_rows, columns=columns):
+        read += batch.num_rows
+        yield batch.to_pandas(), min(read / total, 1.0)
+
+
+# Função para ler uma fonte grande em blocos, sem carregá-la inteira na memória
+def iter_chunks(path, columns, chunk_rows=CHUNK_ROWS):
+    kind = source_kind(path)
+    if kind == "csv":
+        return _iter_csv(path, columns, chunk_rows)
+    if kind == "parquet":
+        return _iter_parquet(path, columns, chunk_rows)
+    raise ValueError(f"Leitura em streaming não suportada para {path}")
+
+
+# Agregação incremental por dia (ou por mês, se a fonte não tiver datas): guarda só um
+# vetor de somas por período, então a memória depende do número de períodos e não do
+# tamanho do arquivo
+class PeriodAccumulator:
+    def __init__(self, metrics=METRICAS):
+        self.metrics = list(metrics)
+        self.sums = {}
+        self.rows = 0
+        self.grain = 'month'
+        self.with_year = True
+
+    # Chaves de período de um bloco: dias desde 1970-01-01 ou chaves mensais
+    def _keys(self, chunk):
+        if 'Data' in chunk.columns:
+            self.grain = 'day'
+            return chunk['Data'].to_numpy('datetime64[ns]').astype('datetime64[D]').astype(np.int64)
+        keys, self.with_year = month_keys(chunk)
+        return keys
+
+    # Soma um bloco de linhas brutas
+    def add(self, chunk):
+        unique, inverse = np.unique(self._keys(chunk), return_inverse=True)
+        for metric in self.metrics:
+            sums = np.bincount(inverse, weights=chunk[metric].to_numpy(np.float64), minlength=len(unique))
+            for key, value in zip(unique.tolist(), sums.round().astype(np.int64).tolist()):
+                self.sums.setdefault(key, dict.fromkeys(self.metrics, 0))[metric] += value
+        self.rows += len(chunk)
+
+    # Cubo com todas as granularidades disponíveis, construído a partir das somas
+    def cube(self):
+        keys = sorted(self.sums)
+        values = {metric: [self.sums[key][metric] for key in keys] for metric in self.metrics}
+        return build_cube_from_sums(keys, values, self.grain, self.with_year)
+
+    # DataFrame no formato usado pelo dashboard (um mês por linha)
+    def frame(self):
+        monthly = self.cube()['month']
+        return monthly.series_window(slice(0, len(monthly)))
+
+
+# Ingestões concluídas, por processo: (caminho, versão) -> acumulador
+@st.cache_resource(show_spinner=False)
+def _ingested():
+    return {}, threading.Lock()
+
+
+# Ingestões em andamento, por processo: (caminho, versão) -> IngestionJob
+@st.cache_resource(show_spinner=False)
+def _jobs():
+    return {}, threading.Lock()
+
+
+# Ingestão de uma versão da fonte numa thread do processo: roda uma única vez, mesmo
+# com várias sessões abertas, e não é interrompida pelos reruns; as sessões consultam
+# o progresso e o resultado parcial enquanto ela avança
+class IngestionJob:
+    def __init__(self, path, key, chunk_rows=CHUNK_ROWS, metrics=METRICAS):
+        self.path = path
+        self.key = key
+        self.chunk_rows = chunk_rows
+        self.accumulator = PeriodAccumulator(metrics)
+        self.progress = 0.0
+        self.error = None
+        self.done = threading.Event()
+        self._lock = threading.Lock()
+        self.thread = threading.Thread(target=self._run, name="ingestao", daemon=True)
+
+    def _run(self):
+        metrics = self.accumulator.metrics
+        try:
+            columns = ['Data', *metrics] if _has_column(self.path, 'Data') else ['Mês', *metrics]
+            for chunk, progress in iter_chunks(self.path, columns, self.chunk_rows):
+                with self._lock:
+                    self.accumulator.add(chunk)
+                    self.progress = progress
+            results, lock = _ingested()
+            _remember(results, lock, self.key, self.accumulator)
+            shared = get_shared_cache()
+            if shared is not None:
+                shared.set(cache_key("ingestao", *self.key, list(metrics)), self.accumulator)
+        except Exception as exc:
+            self.error = exc
+            logger.exception("Falha na ingestão de %s", self.path)
+        finally:
+            self.done.set()
+
+    # Linhas lidas, fração do arquivo e série mensal parcial (None antes do primeiro bloco)
+    def snapshot(self):
+        with self._lock:
+            frame = self.accumulator.frame() if self.accumulator.rows else None
+            return self.accumulator.rows, self.progress, frame
+
+
+# Função para iniciar (ou acompanhar, se já começou) a ingestão em streaming de uma
+# fonte; ingestões de versões anteriores da mesma fonte são descartadas
+def start_ingestion(path, chunk_rows=CHUNK_ROWS, metrics=METRICAS):
+    jobs, lock = _jobs()
+    key = (os.path.abspath(path), os.stat(path).st_mtime_ns)
+    with lock:
+        job = jobs.get(key)
+        if job is None:
+            for old_key in [k for k in jobs if k[0] == key[0]]:
+                del jobs[old_key]
+            job = jobs[key] = IngestionJob(path, key, chunk_rows, metrics)
+            job.thread.start()
+    return job
+
+
+# Função para guardar o acumulador de uma fonte, descartando versões anteriores
+def _remember(results, lock, key, accumulator):
+    with lock:
+        for old_key in [k for k in results if k[0] == key[0]]:
+            del results[old_key]
+        results[key] = accumulator
+
+
+# Função para obter o acumulador de uma ingestão já concluída (ou None); consulta o
+# cache compartilhado, caso outro processo já tenha ingerido a mesma versão da fonte
+def ingested_monthly(path, metrics=METRICAS):
+    results, lock = _ingested()
+    key = (os.path.abspath(path), os.stat(path).st_mtime_ns)
+    with lock:
+        accumulator = results.get(key)
+    shared = get_shared_cache()
+    if accumulator is None and shared is not None:
+        accumulator, found = shared.get(cache_key("ingestao", *key, list(metrics)))
+        if found:
+            _remember(results, lock, key, accumulator)
+    return accumulator
+
+
+# Função para verificar se a fonte tem uma coluna, lendo só o cabeçalho/esquema
+def _has_column(path, column):
+    if source_kind(path) == "parquet":
+        import pyarrow.parquet as pq
+
+        return column in pq.read_schema(path).names
+    return column in pd.read_csv(path, nrows=0).columns
@@ -0,0 +1,168 @@
+import threading
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from portfolio.cube import GRAIN_COLUMNS, month_range_keys
+from portfolio.settings import CACHE_MAX_ENTRIES
+
+# Períodos equivalentes a um ano em cada granularidade (para a comparação anual)
+YEAR_LAGS = {'day': 364, 'week': 364, 'month': 12, 'quarter': 4}
+
+# Períodos da média móvel
+ROLLING_PERIODS = 3
+
+# Indicadores derivados: nome -> formato ("money" em reais, "percent" em %)
+KPIS = {
+    "Lucro": "money",
+    "Margem": "percent",
+    "ROI": "percent",
+    "Variação": "percent",
+    "Média Móvel": "money",
+    "Comparação Anual": "percent",
+}
+
+
+# Divisão elemento a elemento; NaN onde o denominador é zero
+def _ratio(numerator, denominator):
+    numerator = np.asarray(numerator, dtype=np.float64)
+    denominator = np.asarray(denominator, dtype=np.float64)
+    out = np.full(numerator.shape, np.nan)
+    np.divide(numerator, denominator, out=out, where=denominator != 0)
+    return out
+
+
+# Motor de indicadores derivados sobre a série completa de uma granularidade: cada
+# coluna é calculada uma vez, em operações vetorizadas, e memoizada, de modo que
+# incluir um indicador só calcula o que ainda falta (as colunas intermediárias, como o
+# lucro, são reaproveitadas pelos demais). Calcular sobre a série completa garante
+# que a variação e a comparação anual enxerguem os períodos anteriores ao filtro.
+class KpiEngine:
+    def __init__(self, grain, keys, periods, base):
+        self.grain = grain
+        self.keys = np.asarray(keys, dtype=np.int64)
+        self.periods = periods
+        self._columns = {name: np.asarray(values, dtype=np.float64) for name, values in base.items()}
+        self._lock = threading.Lock()
+        self.computed = []
+
+    @property
+    def column_name(self):
+        return GRAIN_COLUMNS[self.grain]
+
+    # Faixa de posições que cobre um intervalo de chaves mensais
+    def month_window(self, start_month, end_month):
+        first, last = month_range_keys(self.grain, *sorted((start_month, end_month)))
+        return slice(
+            int(np.searchsorted(self.keys, first, side='left')),
+            int(np.searchsorted(self.keys, last, side='right')),
+        )
+
+    # Coluna calculada (ou já memoizada)
+    def column(self, name):
+        with self._lock:
+            return self._column(name)
+
+    def _column(self, name):
+        if name not in self._columns:
+            self._columns[name] = getattr(self, "_" + _slug(name))()
+            self.computed.append(name)
+        return self._columns[name]
+
+    def _lucro(self):
+        return self._column("Vendas") - self._column("Custos") - self._column("Marketing")
+
+    def _investimento(self):
+        return self._column("Custos") + self._column("Marketing")
+
+    def _margem(self):
+        return _ratio(self._column("Lucro"), self._column("Vendas")) * 100
+
+    def _roi(self):
+        return _ratio(self._column("Lucro"), self._column("Investimento")) * 100
+
+    def _variacao(self):
+        vendas = self._column("Vendas")
+        previous = np.r_[np.nan, vendas[:-1]]
+        return (_ratio(vendas, previous) - 1) * 100
+
+    def _media_movel(self):
+        vendas = self._column("Vendas")
+        prefix = np.r_[0.0, np.cumsum(vendas)]
+        n = ROLLING_PERIODS
+        out = np.full(vendas.shape, np.nan)
+        out[n - 1:] = (prefix[n:] - prefix[:-n]) / n
+        return out
+
+    # Vendas do mesmo período um ano antes (NaN quando o período não existe nos dados)
+    def _vendas_ano_anterior(self):
+        vendas = self._column("Vendas")
+        lagged = self.keys - YEAR_LAGS[self.grain]
+        positions = np.searchsorted(self.keys, lagged)
+        found = (positions < len(self.keys)) & (self.keys[np.minimum(positions, len(self.keys) - 1)] == lagged)
+        out = np.full(vendas.shape, np.nan)
+        out[found] = vendas[positions[found]]
+        return out
+
+    def _comparacao_anual(self):
+        return (_ratio(self._column("Vendas"), self._column("Vendas Ano Anterior")) - 1) * 100
+
+    # Resumo de um indicador numa faixa de posições, pronto para st.metric: razões são
+    # recalculadas sobre as somas do intervalo (e não pela média das razões)
+    def summary(self, name, window):
+        with self._lock:
+            if name == "Lucro":
+                return float(np.sum(self._column("Lucro")[window]))
+            if name == "Margem":
+                return _scalar_ratio(self._column("Lucro")[window], self._column("Vendas")[window])
+            if name == "ROI":
+                return _scalar_ratio(self._column("Lucro")[window], self._column("Investimento")[window])
+            if name == "Comparação Anual":
+                previous = self._column("Vendas Ano Anterior")[window]
+                found = ~np.isnan(previous)
+                if not found.any():
+                    return None
+                return _scalar_ratio(self._column("Vendas")[window][found], previous[found], offset=-100)
+            # Variação e média móvel: valor do último período do intervalo
+            value = self._column(name)[window]
+            return None if not len(value) or np.isnan(value[-1]) else float(value[-1])
+
+    # DataFrame com o período e os indicadores pedidos numa faixa de posições (para plotly)
+    def frame(self, names, window):
+        data = {self.column_name: self.periods[window]}
+        for name in names:
+            data[name] = self.column(name)[window]
+        return pd.DataFrame(data)
+
+
+# Nome do método de cálculo de uma coluna ("Média Móvel" -> "media_movel")
+def _slug(name):
+    table = str.maketrans("áâãàéêíóôõúç", "aaaaeeiooouc")
+    return name.lower().translate(table).replace(" ", "_")
+
+
+# Razão entre as somas de dois vetores, em %
+def _scalar_ratio(numerator, denominator, offset=0):
+    total = float(np.sum(denominator))
+    return None if total == 0 else float(np.sum(numerator)) / total * 100 + offset
+
+
+# Função para formatar o resumo de um indicador para st.metric
+def format_kpi(name, value):
+    if value is None:
+        return "—"
+    if KPIS[name] == "percent":
+        return f"{value:,.1f}%".replace(",", "X").replace(".", ",").replace("X", ".")
+    return f"R$ {value:,.0f}".replace(",", ".")
+
+
+# Motor de indicadores de uma granularidade, um por versão dos dados e por processo
+# (o cubo não entra no hash; a fonte e a granularidade identificam a série)
+@st.cache_resource(max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def kpi_engine(source, grain, _cube):
+    monthly = _cube['month']
+    rollup = _cube[grain]
+    series = rollup.month_series(monthly.keys[0], monthly.keys[-1])
+    base = {metric: series[metric].to_numpy() for metric in series.columns if metric != rollup.column}
+    return KpiEngine(grain, rollup.keys, series[rollup.column].to_numpy(), base)
@@ -0,0 +1,343 @@
+import argparse
+import collections
+import csv
+import logging
+import os
+import random
+import socket
+import socketserver
+import sys
+import threading
+import time
+
+import numpy as np
+import streamlit as st
+
+from portfolio.cube import GRAINS, Rollup, day_grain_keys, grain_labels
+from portfolio.data import METRICAS
+
+logger = logging.getLogger(__name__)
+
+# Intervalo (segundos) entre leituras do arquivo seguido e entre atualizações do painel
+POLL_INTERVAL = 0.2
+REFRESH_INTERVAL = 1.0
+
+# Janela (segundos) da taxa de atualização e latências guardadas para os percentis
+RATE_WINDOW = 10.0
+LATENCY_SAMPLES = 500
+
+# Tamanho máximo (bytes) de cada leitura do arquivo seguido; um arquivo já grande é
+# consumido em vários lotes, sem carregar tudo na memória de uma vez
+READ_BLOCK = 1 << 20
+
+# Prefixo das fontes por socket local (tcp://127.0.0.1:9009); o resto é um arquivo CSV
+SOCKET_SCHEME = "tcp://"
+
+
+# Agregações incrementais de um feed somente de inclusão: cada lote soma nas chaves já
+# existentes de cada granularidade e insere só as chaves novas, sem reler nem
+# reagregar as linhas anteriores. Guarda também a chegada de cada lote, para medir a
+# taxa de atualização e a latência entre a chegada e a renderização
+class LiveRollups:
+    def __init__(self, metrics=METRICAS):
+        self.metrics = list(metrics)
+        self.keys = {grain: np.empty(0, dtype=np.int64) for grain in GRAINS}
+        self.sums = {grain: {metric: np.empty(0, dtype=np.int64) for metric in self.metrics} for grain in GRAINS}
+        self.labels = {grain: [] for grain in GRAINS}
+        self.rows = 0
+        self.rejected = 0
+        self.version = 0
+        self._arrivals = collections.deque()
+        self._recent = collections.deque()
+        self._latencies = collections.deque(maxlen=LATENCY_SAMPLES)
+        self._rendered = 0
+        self._lock = threading.Lock()
+
+    # Soma um lote: dias desde 1970-01-01 e um vetor por métrica
+    def append(self, days, values):
+        if not len(days):
+            return
+        arrival = time.time()
+        grain_keys = day_grain_keys(days)
+        with self._lock:
+            for grain in GRAINS:
+                self._merge(grain, grain_keys[grain], values)
+            self.rows += len(days)
+            self.version += 1
+            self._arrivals.append((self.version, arrival))
+            self._recent.append((arrival, len(days)))
+
+    # Atualiza uma granularidade só nos períodos presentes no lote
+    def _merge(self, grain, batch_keys, values):
+        unique, inverse = np.unique(batch_keys, return_inverse=True)
+        batch = {
+            metric: np.bincount(inverse, weights=values[metric], minlength=len(unique)).round().astype(np.int64)
+            for metric in self.metrics
+        }
+        keys = self.keys[grain]
+        positions = np.searchsorted(keys, unique)
+        if len(keys):
+            exists = (positions < len(keys)) & (keys[np.minimum(positions, len(keys) - 1)] == unique)
+        else:
+            exists = np.zeros(len(unique), dtype=bool)
+        for metric in self.metrics:
+            np.add.at(self.sums[grain][metric], positions[exists], batch[metric][exists])
+        if exists.all():
+            return
+        # Períodos novos (em geral no fim, já que o feed avança no tempo)
+        new_keys, insert_at = unique[~exists], positions[~exists]
+        self.keys[grain] = np.insert(keys, insert_at, new_keys)
+        for metric in self.metrics:
+            self.sums[grain][metric] = np.insert(self.sums[grain][metric], insert_at, batch[metric][~exists])
+        labels = np.array(self.labels[grain], dtype=object)
+        self.labels[grain] = np.insert(labels, insert_at, grain_labels(grain, new_keys, True)).tolist()
+
+    # Agregação de uma granularidade no estado atual e a versão correspondente
+    def rollup(self, grain):
+        with self._lock:
+            sums = {metric: values.copy() for metric, values in self.sums[grain].items()}
+            return Rollup(grain, self.keys[grain].copy(), list(self.labels[grain]), sums), self.version
+
+    # Últimos períodos de uma granularidade, os totais acumulados e a versão: só a janela
+    # exibida é copiada, então cada atualização do painel não cresce com o histórico
+    def window(self, grain, periods):
+        with self._lock:
+            window = slice(-periods, None)
+            sums = {metric: values[window].copy() for metric, values in self.sums[grain].items()}
+            totals = {metric: int(values.sum()) for metric, values in self.sums[grain].items()}
+            rollup = Rollup(grain, self.keys[grain][window].copy(), list(self.labels[grain][window]), sums)
+            return rollup, totals, self.version
+
+    # Conta linhas descartadas (chamado pelas threads do feed)
+    def reject(self, n=1):
+        with self._lock:
+            self.rejected += n
+
+    # Registra que a versão foi renderizada: a latência de cada lote vai da chegada até
+    # a primeira renderização que o incluiu
+    def rendered(self, version):
+        now = time.time()
+        with self._lock:
+            while self._arrivals and self._arrivals[0][0] <= version:
+                _, arrival = self._arrivals.popleft()
+                self._latencies.append(now - arrival)
+            self._rendered = max(self._rendered, version)
+
+    @property
+    def stats(self):
+        now = time.time()
+        with self._lock:
+            while self._recent and self._recent[0][0] < now - RATE_WINDOW:
+                self._recent.popleft()
+            latencies = np.array(self._latencies) * 1000
+            return {
+                "rows": self.rows,
+                "rejected": self.rejected,
+                "version": self.version,
+                "rendered": self._rendered,
+                "batches_per_s": len(self._recent) / RATE_WINDOW,
+                "rows_per_s": sum(rows for _, rows in self._recent) / RATE_WINDOW,
+                "latency_p50_ms": float(np.percentile(latencies, 50)) if len(latencies) else None,
+                "latency_p95_ms": float(np.percentile(latencies, 95)) if len(latencies) else None,
+            }
+
+
+# Função para converter linhas CSV (Data, Vendas, Marketing, Custos) num lote; linhas
+# malformadas são descartadas e contadas
+def parse_rows(header, lines, store):
+    positions = [header.index(column) for column in ["Data"] + store.metrics]
+    dates, values = [], []
+    for row in csv.reader(lines):
+        # A linha só entra no lote se todos os campos forem válidos
+        try:
+            fields = [row[i] for i in positions]
+            metrics = [float(field) for field in fields[1:]]
+            date = np.datetime64(fields[0].strip()[:10], 'D')
+        except (IndexError, ValueError):
+            store.reject()
+            continue
+        values.append(metrics)
+        dates.append(date)
+    if not dates:
+        return np.empty(0, dtype=np.int64), {}
+    days = np.array(dates, dtype='datetime64[D]').astype(np.int64)
+    matrix = np.array(values, dtype=np.float64)
+    return days, {metric: matrix[:, i] for i, metric in enumerate(store.metrics)}
+
+
+# Função para decodificar as linhas completas recebidas (ignorando as vazias); linhas
+# que não são UTF-8 válido são descartadas e contadas
+def _decode(lines, store):
+    decoded = []
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            decoded.append(line.decode("utf-8").strip())
+        except UnicodeDecodeError:
+            store.reject()
+    return decoded
+
+
+# Função para aplicar um bloco de linhas completas ao armazenamento; um lote com erro
+# inesperado é registrado e descartado, sem interromper o feed
+def _apply(header, lines, store):
+    if not lines:
+        return
+    try:
+        days, values = parse_rows(header, lines, store)
+        store.append(days, values)
+    except Exception:
+        store.reject(len(lines))
+        logger.exception("Lote do feed ao vivo descartado (%d linhas)", len(lines))
+
+
+# Função para seguir um CSV que só cresce (como tail -f): lê o cabeçalho e, a cada
+# intervalo, as linhas completas acrescentadas desde a última leitura
+def tail_file(path, store, stop, from_start=True):
+    # Espera o arquivo e o cabeçalho completo existirem
+    header = None
+    while header is None:
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                line = f.readline()
+            if line.endswith(b"\n"):
+                header = next(csv.reader([line.decode("utf-8", errors="replace").strip()]))
+                continue
+        if stop.wait(POLL_INTERVAL):
+            return
+    with open(path, "rb") as f:
+        f.readline()
+        if not from_start:
+            f.seek(0, os.SEEK_END)
+        pending = b""
+        while not stop.is_set():
+            chunk = f.read(READ_BLOCK)
+            if not chunk:
+                stop.wait(POLL_INTERVAL)
+                continue
+            pending += chunk
+            *lines, pending = pending.split(b"\n")
+            _apply(header, _decode(lines, store), store)
+
+
+# Servidor local que faz as vezes de um feed por socket: cada conexão envia o
+# cabeçalho CSV e depois as linhas; cada leitura do socket vira um lote
+class _FeedHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        store = self.server.store
+        header, pending = None, b""
+        while True:
+            data = self.request.recv(65536)
+            if not data:
+                break
+            pending += data
+            *lines, pending = pending.split(b"\n")
+            lines = _decode(lines, store)
+            if header is None and lines:
+                header = next(csv.reader([lines.pop(0)]))
+            if header is not None:
+                _apply(header, lines, store)
+
+
+class _FeedServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address, store):
+        super().__init__(address, _FeedHandler)
+        self.store = store
+
+
+# Função para receber linhas num socket local até o evento de parada
+def serve_socket(address, store, stop):
+    host, _, port = address.rpartition(":")
+    with _FeedServer((host or "127.0.0.1", int(port)), store) as server:
+        server.timeout = POLL_INTERVAL
+        while not stop.is_set():
+            server.handle_request()
+
+
+# Feed ao vivo em execução: o armazenamento incremental e a thread que o alimenta
+class LiveFeed:
+    def __init__(self, spec):
+        self.spec = spec
+        self.store = LiveRollups()
+        self.stop = threading.Event()
+        if spec.startswith(SOCKET_SCHEME):
+            target, args = serve_socket, (spec[len(SOCKET_SCHEME):], self.store, self.stop)
+        else:
+            target, args = tail_file, (spec, self.store, self.stop)
+        self.thread = threading.Thread(target=self._run, args=(target, args), name="live-feed", daemon=True)
+        self.thread.start()
+
+    def _run(self, target, args):
+        try:
+            target(*args)
+        except Exception:
+            logger.exception("Feed ao vivo %s interrompido", self.spec)
+
+    @property
+    def running(self):
+        return self.thread.is_alive()
+
+
+# Feed ao vivo de uma fonte, iniciado uma única vez por processo e compartilhado entre as sessões
+@st.cache_resource(show_spinner=False)
+def get_live_feed(spec):
+    return LiveFeed(spec)
+
+
+# Gerador de vendas sintéticas para demonstrar o modo ao vivo: acrescenta linhas num
+# CSV ou as envia ao socket local, avançando um dia a cada rows_per_day linhas
+def emit(target, rate, rows_per_day, start, limit=None):
+    day = np.datetime64(start, 'D')
+    header = "Data," + ",".join(METRICAS) + "\n"
+    if target.startswith(SOCKET_SCHEME):
+        host, _, port = target[len(SOCKET_SCHEME):].rpartition(":")
+        sink = socket.create_connection((host or "127.0.0.1", int(port)))
+        write = lambda text: sink.sendall(text.encode("utf-8"))
+        write(header)
+    else:
+        new_file = not os.path.exists(target) or os.path.getsize(target) == 0
+        sink = open(target, "a", encoding="utf-8", newline="")
+        write = lambda text: (sink.write(text), sink.flush())
+        if new_file:
+            write(header)
+    sent = 0
+    try:
+        while limit is None or sent < limit:
+            started = time.monotonic()
+            batch = max(1, int(rate * POLL_INTERVAL))
+            lines = []
+            for _ in range(batch):
+                date = day + sent // rows_per_day
+                vendas = random.randint(50, 150)
+                lines.append(f"{date},{vendas},{random.randint(5, 25)},{vendas // 2 + random.randint(0, 20)}\n")
+                sent += 1
+            write("".join(lines))
+            time.sleep(max(0.0, POLL_INTERVAL - (time.monotonic() - started)))
+    finally:
+        sink.close()
+    return sent
+
+
+# Uso: python -m portfolio.live .cache/ao_vivo.csv [--rate 200] (ou tcp://127.0.0.1:9009)
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gera vendas sintéticas para o modo ao vivo do Dashboard Demo")
+    parser.add_argument("target", help="arquivo CSV acrescentado ou tcp://host:porta")
+    parser.add_argument("--rate", type=float, default=200, help="linhas por segundo")
+    parser.add_argument("--rows-per-day", type=int, default=500, help="linhas por dia simulado")
+    parser.add_argument("--start", default=str(np.datetime64('today', 'D')), help="data inicial (AAAA-MM-DD)")
+    parser.add_argument("--limit", type=int, help="para depois de gerar este número de linhas")
+    args = parser.parse_args(argv)
+    try:
+        sent = emit(args.target, args.rate, args.rows_per_day, args.start, args.limit)
+    except KeyboardInterrupt:
+        return 0
+    print(f"{sent} linhas geradas", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,12 @@
+# Páginas do portfólio; cada módulo expõe render() e é importado sob demanda
+
+# Páginas do menu, na ordem, e os módulos que as renderizam; cada módulo (e suas
+# dependências pesadas, como plotly e pandas) só é importado quando a página é selecionada
+PAGES = {
+    "Início": "portfolio.pages.inicio",
+    "Sobre Mim": "portfolio.pages.sobre",
+    "Habilidades": "portfolio.pages.habilidades",
+    "Projetos": "portfolio.pages.projetos",
+    "Dashboard Demo": "portfolio.pages.dashboard",
+    "Contato": "portfolio.pages.contato",
+}
@@ -0,0 +1,23 @@
+# Página de Contato
+import streamlit as st
+
+from portfolio.components import card
+from portfolio.content import load_content
+from portfolio.ui import create_divider
+
+
+# Renderiza a página
+def render():
+    st.markdown('<h1 class="fade-in">Contato</h1>', unsafe_allow_html=True)
+    st.markdown(create_divider(), unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown(card("Vamos conversar?", load_content().contato, fade=True), unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("### Redes Sociais")
+        st.markdown("[![LinkedIn](https://img.shields.io/badge/LinkedIn-0077B5?style=for-the-badge&logo=linkedin&logoColor=white)](https://linkedin.com)")
+        st.markdown("[![GitHub](https://img.shields.io/badge/GitHub-100000?style=for-the-badge&logo=github&logoColor=white)](https://github.com)")
+        st.markdown("[![Medium](https://img.shields.io/badge/Medium-12100E?style=for-the-badge&logo=medium&logoColor=white)](https://medium.com)")
@@ -0,0 +1,314 @@
+# Página de Dashboard Demo
+import functools
+import os
+
+import streamlit as st
+
+from portfolio import prefetch, profiling
+from portfolio.cube import GRAINS, load_example_cube
+from portfolio.database import load_sql_cube
+from portfolio.figures import cached_figure, line_figure
+from portfolio.ingest import PROGRESS_INTERVAL, ingested_monthly, start_ingestion
+from portfolio.kpis import KPIS, format_kpi, kpi_engine
+from portfolio.live import REFRESH_INTERVAL, get_live_feed
+from portfolio.data import EXAMPLE_DATA_PATH, METRICAS
+from portfolio.downsample import CHART_POINTS, downsample_frame
+from portfolio.periods import load_example_month_index, load_indexed_example_data
+from portfolio.session_cache import prefill, session_cache, session_cached
+from portfolio.settings import LIVE_FEED_ENV, SALES_DB_ENV, SALES_PATH_ENV
+from portfolio.store import session_table, table_slice
+from portfolio.ui import create_divider
+
+# Rótulos das granularidades no seletor do gráfico
+GRAIN_LABELS = {'day': 'Diária', 'week': 'Semanal', 'month': 'Mensal', 'quarter': 'Trimestral'}
+
+# Acima deste número de pontos o gráfico de linha deixa de desenhar marcadores
+MARKER_POINTS = 60
+
+# Indicadores derivados selecionados ao abrir a página; os que dependem do ano dos
+# meses só entram quando os dados têm datas
+DEFAULT_KPIS = ["Margem", "ROI", "Variação"]
+YEAR_KPIS = ["Comparação Anual"]
+
+# Períodos mais recentes exibidos no gráfico do modo ao vivo
+LIVE_PERIODS = 90
+
+
+# Progresso da ingestão em streaming de uma fonte grande: reexecuta sozinho e mostra o
+# resultado parcial da thread de ingestão; ao terminar, reexecuta a página inteira
+@st.fragment(run_every=PROGRESS_INTERVAL)
+def ingestion_panel(job):
+    with profiling.fragment("Progresso da ingestão"):
+        _ingestion_panel(job)
+
+
+def _ingestion_panel(job):
+    if job.error is not None:
+        st.error(f"Falha ao ler {os.path.basename(job.path)}: {job.error}")
+        return
+    if job.done.is_set():
+        st.rerun()
+    rows, fraction, frame = job.snapshot()
+    st.progress(fraction, text=f"Lendo dados... {rows:,} linhas".replace(",", "."))
+    if frame is not None:
+        st.plotly_chart(line_figure(frame, x='Mês', y=job.accumulator.metrics), width="stretch", key="ingest_preview")
+
+
+# Renderiza a página
+def render():
+    st.markdown('<h1 class="fade-in">Dashboard Demo</h1>', unsafe_allow_html=True)
+    st.markdown(create_divider(), unsafe_allow_html=True)
+    
+    st.info("Esta é uma demonstração interativa das minhas habilidades em visualização de dados usando Streamlit.")
+    
+    # Feed ao vivo (PORTFOLIO_LIVE_FEED): as linhas novas são somadas às agregações por
+    # uma thread do processo e o painel se atualiza sozinho
+    live_feed = os.environ.get(LIVE_FEED_ENV)
+    if live_feed:
+        live_panel(get_live_feed(live_feed))
+        return
+    
+    # Banco de vendas (PORTFOLIO_SALES_DB): totais e séries são consultados no banco.
+    # Fonte grande (PORTFOLIO_SALES_PATH): ingerida em streaming uma vez por processo.
+    # Sem nenhuma das duas, usa o cubo dos dados de exemplo e as linhas ordenadas por
+    # mês, publicadas uma única vez no armazenamento Arrow compartilhado entre as sessões
+    sales_db = os.environ.get(SALES_DB_ENV)
+    sales_path = os.environ.get(SALES_PATH_ENV)
+    detail_source = None
+    if sales_db:
+        cube, version = load_sql_cube(sales_db)
+        source = (sales_db, version)
+    elif sales_path:
+        accumulator = ingested_monthly(sales_path)
+        if accumulator is None:
+            ingestion_panel(start_ingestion(sales_path))
+            return
+        cube = accumulator.cube()
+        source = (os.path.abspath(sales_path), os.stat(sales_path).st_mtime_ns)
+    else:
+        cube = load_example_cube()
+        source = (EXAMPLE_DATA_PATH, os.stat(EXAMPLE_DATA_PATH).st_mtime_ns)
+        month_index = load_example_month_index()
+        table = session_table("vendas_exemplo", source[1], lambda: load_indexed_example_data()[0])
+        detail_source = (table, month_index)
+    
+    # Filtros, indicadores e gráficos ficam num fragmento: mover um slider reexecuta só
+    # o painel, sem refazer o CSS, a barra lateral, o menu e a carga dos dados
+    dashboard_panel(cube, detail_source, source)
+
+
+# Painel interativo do Dashboard Demo; detail_source é (tabela Arrow, índice mensal) para
+# os dados de exemplo ou None para o banco e as fontes lidas em streaming, e source
+# identifica a versão dos dados nas chaves do cache da sessão
+@st.fragment
+def dashboard_panel(cube, detail_source, source):
+    with profiling.fragment("Painel do Dashboard"):
+        _panel(cube, detail_source, source)
+
+
+# Painel do modo ao vivo: reexecuta sozinho a cada REFRESH_INTERVAL e lê as agregações
+# que o feed já atualizou incrementalmente (nenhuma linha é relida a cada atualização)
+@st.fragment(run_every=REFRESH_INTERVAL)
+def live_panel(feed):
+    with profiling.fragment("Painel ao vivo"):
+        _live_panel(feed)
+
+
+# Totais acumulados, gráfico dos períodos mais recentes e métricas do feed
+def _live_panel(feed):
+    store = feed.store
+    st.markdown("### Ao Vivo")
+    grain = st.radio("Granularidade", GRAINS, format_func=GRAIN_LABELS.get, horizontal=True, key="live_grain")
+    # Só os últimos períodos vão para o gráfico, então o custo de cada atualização não
+    # cresce com o histórico acumulado
+    rollup, totals, version = store.window(grain, LIVE_PERIODS)
+    if not len(rollup):
+        st.caption("Aguardando dados do feed..." if feed.running else "O feed ao vivo foi interrompido; veja o log do servidor.")
+        return
+    
+    for metric_col, (metric, total) in zip(st.columns(len(totals)), totals.items()):
+        with metric_col:
+            st.metric(label=metric, value=f"R$ {total:,.0f}".replace(",", "."))
+    
+    series = rollup.series_window(slice(None))
+    fig = line_figure(series, x=rollup.column, y=store.metrics, markers=len(series) <= MARKER_POINTS)
+    st.plotly_chart(fig, width="stretch", key="live_chart")
+    store.rendered(version)
+    
+    # Taxa de atualização e latência entre a chegada de um lote e a renderização que o mostrou
+    stats = store.stats
+    latency = " · ".join(
+        f"latência {name} {stats[key]:,.0f} ms".replace(",", ".")
+        for name, key in (("p50", "latency_p50_ms"), ("p95", "latency_p95_ms"))
+        if stats[key] is not None
+    )
+    rate = f"{stats['rows']:,} linhas · {stats['rows_per_s']:,.0f} linhas/s".replace(",", ".")
+    updates = f"{stats['batches_per_s']:.1f} atualizações/s".replace(".", ",")
+    st.caption(" · ".join(part for part in (rate, updates, latency) if part))
+
+
+# Série de uma granularidade no intervalo de meses, já reduzida para o gráfico
+def period_series(cube, grain, start_pos, end_pos, metrics):
+    monthly = cube['month']
+    rollup = cube[grain]
+    series = rollup.month_series(monthly.keys[start_pos], monthly.keys[end_pos], metrics)
+    return series, downsample_frame(series, rollup.column, metrics, max_points=CHART_POINTS)
+
+
+# Figura do gráfico de evolução (compartilhada entre as sessões pelo cache de figuras)
+def chart_figure(rollup, chart_series, metrics):
+    return cached_figure(
+        line_figure,
+        series=chart_series,
+        x=rollup.column,
+        y=list(metrics),
+        markers=len(chart_series) <= MARKER_POINTS,
+    )
+
+
+# Intervalos vizinhos ao selecionado (um mês a mais ou a menos em cada ponta), os
+# próximos movimentos mais prováveis dos sliders
+def neighbour_ranges(start_pos, end_pos, n_months):
+    candidates = [
+        (start_pos + 1, end_pos),
+        (start_pos, end_pos - 1),
+        (start_pos - 1, end_pos),
+        (start_pos, end_pos + 1),
+    ]
+    return [(a, b) for a, b in candidates if 0 <= a <= b < n_months and (a, b) != (start_pos, end_pos)]
+
+
+# Pré-carrega a série e a figura de um intervalo no cache da sessão (em segundo plano)
+def warm_range(cube, cache, source, grain, start_pos, end_pos, metrics, cancel):
+    value = prefill(
+        cache,
+        "dashboard",
+        lambda: period_series(cube, grain, start_pos, end_pos, metrics),
+        source=source,
+        grain=grain,
+        start=start_pos,
+        end=end_pos,
+    )
+    if value is not None and not cancel.is_set():
+        chart_figure(cube[grain], value[1], metrics)
+
+
+# Pré-carrega os dados e o gráfico inicial da página (em segundo plano); o feed ao vivo
+# e a ingestão da fonte em streaming só são iniciados, já que rodam nas próprias threads
+def warm(cancel):
+    live_feed = os.environ.get(LIVE_FEED_ENV)
+    sales_db = os.environ.get(SALES_DB_ENV)
+    if live_feed:
+        get_live_feed(live_feed)
+        return
+    elif sales_db:
+        cube = load_sql_cube(sales_db)[0]
+    elif os.environ.get(SALES_PATH_ENV):
+        if ingested_monthly(os.environ[SALES_PATH_ENV]) is None:
+            start_ingestion(os.environ[SALES_PATH_ENV])
+        return
+    else:
+        cube = load_example_cube()
+        load_example_month_index()
+        load_indexed_example_data()
+    if cancel.is_set():
+        return
+    _, chart_series = period_series(cube, 'month', 0, len(cube['month']) - 1, METRICAS)
+    chart_figure(cube['month'], chart_series, METRICAS)
+
+
+# Filtros, indicadores, gráfico e dados detalhados do painel
+def _panel(cube, detail_source, source):
+    monthly = cube['month']
+    # Os intervalos previstos no rerun anterior do painel ficaram obsoletos
+    prefetch.cancel_pending("dashboard")
+    
+    # Filtros interativos
+    filter_container = st.container()
+    with filter_container:
+        st.markdown("### Filtros")
+        filter_col1, filter_col2 = st.columns(2)
+        
+        with filter_col1:
+            start_month = st.select_slider("Mês Inicial", options=monthly.labels, value=monthly.labels[0])
+        
+        with filter_col2:
+            end_month = st.select_slider("Mês Final", options=monthly.labels, value=monthly.labels[-1])
+    
+    # Totais do período direto das somas prefixadas do cubo (intervalos invertidos são normalizados)
+    st.markdown("### Indicadores do Período")
+    totals = monthly.totals(start_month, end_month)
+    
+    for metric_col, (metric, total) in zip(st.columns(len(totals)), totals.items()):
+        with metric_col:
+            st.metric(label=metric, value=f"R$ {total:,.0f}".replace(",", "."))
+    
+    # Indicadores derivados do intervalo, calculados sobre a série mensal completa (a
+    # variação e a comparação anual enxergam os meses anteriores ao filtro)
+    st.markdown("### Indicadores Derivados")
+    default_kpis = DEFAULT_KPIS + YEAR_KPIS if cube.with_year else DEFAULT_KPIS
+    selected_kpis = st.multiselect("Indicadores", list(KPIS), default=default_kpis)
+    start_pos, end_pos = monthly.normalize(start_month, end_month)
+    monthly_kpis = kpi_engine(source, 'month', cube)
+    
+    if selected_kpis:
+        for kpi_col, name in zip(st.columns(len(selected_kpis)), selected_kpis):
+            with kpi_col:
+                value = monthly_kpis.summary(name, slice(start_pos, end_pos + 1))
+                st.metric(label=name, value=format_kpi(name, value))
+    
+    # Evolução no período, na granularidade escolhida; séries longas (dados diários de
+    # vários anos) são reduzidas para perto da largura do gráfico antes de serializar, e
+    # a redução é refeita sobre a janela filtrada, então estreitar o intervalo de meses
+    # mostra mais detalhe
+    st.markdown("### Evolução no Período")
+    grain = st.radio(
+        "Granularidade",
+        cube.grains,
+        index=cube.grains.index('month'),
+        format_func=GRAIN_LABELS.get,
+        horizontal=True,
+    )
+    rollup = cube[grain]
+    series, chart_series = session_cached(
+        "dashboard",
+        lambda: period_series(cube, grain, start_pos, end_pos, list(totals)),
+        source=source,
+        grain=grain,
+        start=start_pos,
+        end=end_pos,
+    )
+    if len(chart_series) < len(series):
+        st.caption(f"Exibindo {len(chart_series):,} de {len(series):,} pontos".replace(",", "."))
+    
+    fig = chart_figure(rollup, chart_series, totals)
+    
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Indicadores percentuais na granularidade escolhida
+    percent_kpis = [name for name in selected_kpis if KPIS[name] == "percent"]
+    if percent_kpis:
+        st.markdown("### Indicadores no Período")
+        engine = kpi_engine(source, grain, cube)
+        kpi_series = engine.frame(percent_kpis, engine.month_window(monthly.keys[start_pos], monthly.keys[end_pos]))
+        kpi_series = downsample_frame(kpi_series, engine.column_name, percent_kpis, max_points=CHART_POINTS)
+        st.plotly_chart(chart_figure(rollup, kpi_series, percent_kpis), width="stretch")
+    
+    # Pré-carrega em segundo plano os intervalos vizinhos, no cache desta sessão
+    cache = session_cache()
+    for a, b in neighbour_ranges(start_pos, end_pos, len(monthly)):
+        prefetch.schedule(
+            "dashboard",
+            ("dashboard", cache.session_id, source, grain, a, b),
+            functools.partial(warm_range, cube, cache, source, grain, a, b, list(totals)),
+        )
+    
+    # Dados detalhados do período selecionado (agregados na granularidade escolhida quando
+    # a fonte é o banco ou é lida em streaming)
+    with st.expander("Dados detalhados"):
+        if detail_source is None:
+            detail = series
+        else:
+            table, month_index = detail_source
+            detail = table_slice(table, month_index.range_slice(start_month, end_month))
+        st.dataframe(detail, hide_index=True, width="stretch")
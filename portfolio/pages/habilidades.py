@@ -0,0 +1,38 @@
+# Página Habilidades
+import streamlit as st
+
+from portfolio.components import card, skill_area_card
+from portfolio.content import load_content
+from portfolio.ui import create_divider, show_skill_bar
+
+
+# Renderiza a página
+def render():
+    content = load_content()
+    st.markdown('<h1 class="fade-in">Minhas Habilidades</h1>', unsafe_allow_html=True)
+    st.markdown(create_divider(), unsafe_allow_html=True)
+
+    # Habilidades técnicas
+    st.markdown("### Habilidades Técnicas")
+
+    habilidades = content.habilidades
+    half = (len(habilidades) + 1) // 2
+    for col, skills in zip(st.columns(2), (habilidades[:half], habilidades[half:])):
+        with col:
+            for skill in skills:
+                show_skill_bar(skill.nome, skill.percentual)
+
+    # Categorias de habilidades, em linhas de três
+    st.markdown("### Áreas de Especialização")
+
+    for row in range(0, len(content.areas), 3):
+        for col, area in zip(st.columns(3), content.areas[row:row + 3]):
+            with col:
+                st.markdown(skill_area_card(area.titulo, area.tecnologias, area.descricao), unsafe_allow_html=True)
+
+    # Certificações
+    st.markdown("### Certificações")
+
+    for col, certificacao in zip(st.columns(len(content.certificacoes)), content.certificacoes):
+        with col:
+            st.markdown(card(certificacao.titulo, small=certificacao.emissor), unsafe_allow_html=True)
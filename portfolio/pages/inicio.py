@@ -0,0 +1,58 @@
+# Página Inicial
+import streamlit as st
+
+from portfolio.content import load_content
+from portfolio.figures import cached_figure, gauge_figure
+
+
+# Figura do indicador de desempenho (estática: construída uma vez e servida pelo cache de figuras)
+def performance_figure(content):
+    return cached_figure(gauge_figure, value=content.desempenho.valor, title=content.desempenho.titulo)
+
+
+# Pré-carrega a figura do indicador (chamada em segundo plano pelo pré-carregamento)
+def warm(cancel):
+    performance_figure(load_content())
+
+
+# Renderiza a página
+def render():
+    content = load_content()
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        st.markdown('<h1 class="fade-in">Olá, eu sou <span style="color: #60A5FA;">Eduardo Machado</span></h1>', unsafe_allow_html=True)
+        st.markdown('<h3 class="fade-in">Analista de Dados</h3>', unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class="fade-in" style="animation-delay: 0.3s;">
+            <p style="font-size: 1.2rem; margin-top: 20px; margin-bottom: 30px;">
+                Transformando dados em insights valiosos e soluções de negócios.
+                Especialista em SQL, Python, Power BI e visualização de dados.
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        col_btn1, col_btn2, _ = st.columns([1, 1, 2])
+        
+        with col_btn1:
+            st.button("Ver Projetos", key="ver_projetos")
+        
+        with col_btn2:
+            st.button("Contate-me", key="contate_me")
+        
+        # Animação de digitação para estatísticas
+        st.markdown("### Estatísticas Rápidas")
+        
+        for metric_col, item in zip(st.columns(len(content.estatisticas)), content.estatisticas):
+            with metric_col:
+                st.metric(label=item.rotulo, value=item.valor)
+    
+    with col2:
+        # Gráfico animado para demonstrar habilidades
+        fig = performance_figure(content)
+        
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # Informações extras
+        st.info("📌 Disponível para novos projetos e consultorias em análise de dados.")
@@ -0,0 +1,92 @@
+# Página de Projetos
+import math
+
+import streamlit as st
+
+from portfolio.catalog import catalog_version, load_catalog
+from portfolio.components import project_card
+from portfolio.images import image_path
+from portfolio.session_cache import session_cached
+from portfolio.ui import create_divider
+
+# Quantidade de projetos renderizados por página
+PAGE_SIZE = 5
+
+
+# Função para obter a miniatura de um projeto
+def project_image(project):
+    return image_path(f"projetos/{project['slug']}", 400, label=project["titulo"], size=(800, 600))
+
+
+# Pré-carrega o catálogo e as miniaturas da primeira página (em segundo plano)
+def warm(cancel):
+    catalog = load_catalog()
+    for project in catalog.page(catalog.filter(), 1, PAGE_SIZE):
+        if cancel.is_set():
+            return
+        project_image(project)
+
+
+# Função para mostrar um projeto do catálogo
+def show_project(project, expanded=False):
+    with st.expander(project["titulo"], expanded=expanded):
+        proj_col1, proj_col2 = st.columns([1, 2])
+
+        with proj_col1:
+            st.image(project_image(project), width="stretch")
+
+        with proj_col2:
+            st.markdown(project_card(
+                project["titulo"],
+                tuple(project["tecnologias"]),
+                project["descricao"],
+                tuple(project["recursos"]),
+            ), unsafe_allow_html=True)
+
+            st.button("Ver detalhes do projeto", key=f"{project['slug']}_details")
+
+
+# Renderiza a página
+def render():
+    st.markdown('<h1 class="fade-in">Projetos</h1>', unsafe_allow_html=True)
+    st.markdown(create_divider(), unsafe_allow_html=True)
+
+    catalog = load_catalog()
+
+    # Filtros (opções vindas dos índices do catálogo)
+    st.markdown("### Filtrar Projetos")
+
+    col_filter1, col_filter2, col_filter3 = st.columns(3)
+
+    with col_filter1:
+        categoria = st.selectbox("Categoria", ["Todos"] + catalog.options("categoria"))
+
+    with col_filter2:
+        tecnologia = st.selectbox("Tecnologia", ["Todas"] + catalog.options("tecnologias"))
+
+    with col_filter3:
+        ano = st.selectbox("Ano", ["Todos"] + [str(value) for value in catalog.options("ano", reverse=True)])
+
+    # Interseção dos índices invertidos, guardada no cache da sessão por combinação de filtros
+    filters = {
+        "categoria": None if categoria == "Todos" else categoria,
+        "tecnologias": None if tecnologia == "Todas" else tecnologia,
+        "ano": None if ano == "Todos" else int(ano),
+    }
+    project_ids = session_cached("projetos", lambda: catalog.filter(**filters), version=catalog_version(), **filters)
+
+    # Projetos
+    st.markdown("### Projetos Destacados")
+
+    if not project_ids:
+        st.info("Nenhum projeto encontrado com os filtros selecionados.")
+        return
+
+    # Paginação: só os projetos da página atual são renderizados
+    n_pages = math.ceil(len(project_ids) / PAGE_SIZE)
+    page = 1
+    if n_pages > 1:
+        page = st.number_input(f"Página (de {n_pages})", min_value=1, max_value=n_pages, value=1, step=1)
+
+    for i, project in enumerate(catalog.page(project_ids, page, PAGE_SIZE)):
+        show_project(project, expanded=(i == 0))
@@ -0,0 +1,42 @@
+# Página Sobre
+import streamlit as st
+
+from portfolio.components import education_card, experience_card, text_section
+from portfolio.content import load_content
+from portfolio.images import image_path
+from portfolio.ui import create_divider
+
+
+# Renderiza a página
+def render():
+    content = load_content()
+    st.markdown('<h1 class="fade-in">Sobre Mim</h1>', unsafe_allow_html=True)
+    st.markdown(create_divider(), unsafe_allow_html=True)
+    
+    col1, col2 = st.columns([1, 2])
+    
+    with col1:
+        # Foto do perfil (miniatura local gerada pelo pipeline de imagens)
+        st.image(image_path("perfil", 400, label="EM"), width="stretch")
+        
+        st.markdown("### Informações Pessoais")
+        
+        for item in content.informacoes:
+            st.markdown(f"**{item.rotulo}:** {item.valor}")
+    
+    with col2:
+        st.markdown(text_section("Minha Jornada", content.jornada), unsafe_allow_html=True)
+        
+        st.markdown("<h3>Formação Acadêmica</h3>", unsafe_allow_html=True)
+        
+        for col_edu, formacao in zip(st.columns(len(content.formacao)), content.formacao):
+            with col_edu:
+                st.markdown(education_card(formacao.curso, formacao.instituicao, formacao.periodo), unsafe_allow_html=True)
+        
+        st.markdown("<h3>Experiência Profissional</h3>", unsafe_allow_html=True)
+        
+        for experiencia in content.experiencias:
+            st.markdown(
+                experience_card(experiencia.cargo, experiencia.empresa, experiencia.periodo, experiencia.descricao),
+                unsafe_allow_html=True,
+            )
@@ -0,0 +1,114 @@
+import numpy as np
+import streamlit as st
+
+from portfolio.data import MESES, example_data_version, load_example_data
+from portfolio.settings import CACHE_MAX_ENTRIES
+
+
+# Função para gerar o rótulo de um período mensal a partir da chave ano*12 + mês
+def month_label(key, with_year=True):
+    year, month = divmod(int(key), 12)
+    return f"{MESES[month]}/{year}" if with_year else MESES[month]
+
+
+# Função para calcular a chave mensal de cada linha (ano*12 + mês ou código do mês);
+# meses ausentes ou fora de MESES são rejeitados com ValueError
+def month_keys(df, month_column='Mês', date_column='Data'):
+    if date_column in df.columns:
+        dates = df[date_column].dt
+        return (dates.year.to_numpy(np.int64) * 12 + dates.month.to_numpy(np.int64) - 1), True
+    months = df[month_column]
+    lookup = {label: i for i, label in enumerate(MESES)}
+    if hasattr(months, 'cat'):
+        # Posição em MESES de cada categoria; o último item atende o código -1 (valor ausente)
+        positions = np.array([lookup.get(label, -1) for label in months.cat.categories] + [-1], dtype=np.int64)
+        codes = positions[months.cat.codes.to_numpy(np.int64)]
+    else:
+        codes = months.map(lookup).fillna(-1).to_numpy(np.int64)
+    if (codes < 0).any():
+        unknown = sorted({str(label) for label in months[codes < 0]})
+        raise ValueError(f"Meses desconhecidos na coluna {month_column}: {', '.join(unknown)}")
+    return codes, False
+
+
+# Rótulos de períodos em ordem, com busca de posição em O(1)
+class PeriodLabels:
+    def __init__(self, labels):
+        self.labels = labels
+        self._positions = {label: i for i, label in enumerate(labels)}
+
+    def __len__(self):
+        return len(self.labels)
+
+    def __contains__(self, label):
+        return label in self._positions
+
+    # Posição do rótulo na ordem dos períodos
+    def position(self, label):
+        try:
+            return self._positions[label]
+        except KeyError:
+            raise KeyError(f"Período inexistente: {label}") from None
+
+    # Normaliza um intervalo de rótulos; intervalos invertidos são trocados
+    def normalize(self, start, end):
+        start_pos, end_pos = self.position(start), self.position(end)
+        if start_pos > end_pos:
+            start_pos, end_pos = end_pos, start_pos
+        return start_pos, end_pos
+
+
+# Índice ordenado de meses: cada rótulo aponta para a faixa de linhas do período,
+# permitindo recortes por intervalo em O(1) sem varrer o DataFrame
+class MonthIndex(PeriodLabels):
+    def __init__(self, keys, labels, bounds):
+        super().__init__(labels)
+        self.keys = keys
+        self.bounds = bounds
+
+    # Constrói o índice a partir de chaves já ordenadas (uma por linha)
+    @classmethod
+    def from_sorted_keys(cls, keys, with_year=True):
+        keys = np.asarray(keys, dtype=np.int64)
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]]) if len(keys) else np.array([], dtype=np.int64)
+        unique = keys[starts]
+        labels = [month_label(key, with_year) for key in unique]
+        bounds = np.r_[starts, len(keys)].astype(np.int64)
+        return cls(unique, labels, bounds)
+
+    # Faixa de linhas (slice) que cobre os períodos de start até end, inclusive
+    def range_slice(self, start, end):
+        start_pos, end_pos = self.normalize(start, end)
+        return slice(int(self.bounds[start_pos]), int(self.bounds[end_pos + 1]))
+
+    # Recorte do DataFrame ordenado para o intervalo de períodos
+    def slice_frame(self, df, start, end):
+        return df.iloc[self.range_slice(start, end)]
+
+
+# Função para ordenar o DataFrame por mês e construir o índice correspondente
+def index_by_month(df, month_column='Mês', date_column='Data'):
+    keys, with_year = month_keys(df, month_column, date_column)
+    if len(keys) > 1 and np.any(keys[1:] < keys[:-1]):
+        order = np.argsort(keys, kind='stable')
+        df = df.iloc[order].reset_index(drop=True)
+        keys = keys[order]
+    return df, MonthIndex.from_sorted_keys(keys, with_year)
+
+
+# Dados de exemplo ordenados e índice mensal de uma versão da fonte, construídos juntos
+# uma vez; só são lidos, então ficam num cache de recursos (o mesmo objeto para todas as
+# sessões, sem cópia por rerun)
+@st.cache_resource(max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def _indexed_example_data(version):
+    return index_by_month(load_example_data())
+
+
+# Função para carregar os dados de exemplo já ordenados e indexados por mês
+def load_indexed_example_data():
+    return _indexed_example_data(example_data_version())
+
+
+# Função para carregar só o índice mensal dos dados de exemplo (as linhas ficam no armazenamento compartilhado)
+def load_example_month_index():
+    return _indexed_example_data(example_data_version())[1]
@@ -0,0 +1,141 @@
+import functools
+import importlib
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import streamlit as st
+
+from portfolio.settings import PREFETCH_ENV
+
+logger = logging.getLogger(__name__)
+
+# Threads que executam pré-carregamentos ao mesmo tempo (por processo)
+PREFETCH_WORKERS = 2
+
+# Pré-carregamentos na fila ou em execução; acima disso os novos são descartados
+PREFETCH_MAX_PENDING = 8
+
+# Chave dos pré-carregamentos da sessão no estado da sessão
+SESSION_KEY = "_prefetch"
+
+
+# Função para verificar se o pré-carregamento está ligado (padrão; PORTFOLIO_PREFETCH=0 desliga)
+@functools.lru_cache(maxsize=1)
+def enabled():
+    return os.environ.get(PREFETCH_ENV, "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+# Executor compartilhado de pré-carregamentos: as tarefas aquecem caches do processo
+# (dados, figuras, miniaturas, módulos) fora do rerun; tarefas repetidas enquanto a
+# primeira ainda está pendente são ignoradas
+class Prefetcher:
+    def __init__(self, workers=PREFETCH_WORKERS, max_pending=PREFETCH_MAX_PENDING):
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="prefetch")
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._pending = {}
+        self._lock = threading.Lock()
+        self.counts = {"scheduled": 0, "completed": 0, "cancelled": 0, "skipped": 0, "failed": 0}
+
+    # Agenda uma tarefa task(cancel); devolve o future ou None se foi ignorada
+    def submit(self, key, task, cancel):
+        with self._lock:
+            if key in self._pending or not self._slots.acquire(blocking=False):
+                self.counts["skipped"] += 1
+                return None
+            future = self._executor.submit(self._run, task, cancel)
+            self._pending[key] = future
+            self.counts["scheduled"] += 1
+        future.add_done_callback(functools.partial(self._done, key))
+        return future
+
+    # A tarefa confere o evento de cancelamento antes de começar e entre as etapas
+    @staticmethod
+    def _run(task, cancel):
+        if cancel.is_set():
+            return False
+        task(cancel)
+        return not cancel.is_set()
+
+    def _done(self, key, future):
+        with self._lock:
+            self._pending.pop(key, None)
+            self._slots.release()
+            if future.cancelled():
+                self.counts["cancelled"] += 1
+            elif future.exception() is not None:
+                self.counts["failed"] += 1
+                logger.warning("Falha no pré-carregamento %s: %s", key, future.exception())
+            elif future.result():
+                self.counts["completed"] += 1
+            else:
+                self.counts["cancelled"] += 1
+
+    @property
+    def stats(self):
+        with self._lock:
+            return {**self.counts, "pending": len(self._pending)}
+
+
+# Instância única do executor por processo
+@st.cache_resource(show_spinner=False)
+def get_prefetcher():
+    return Prefetcher()
+
+
+# Pré-carregamentos de uma sessão, agrupados por escopo ("pagina", "dashboard"...), com
+# um evento de cancelamento por escopo
+class SessionPrefetch:
+    def __init__(self):
+        self.scopes = {}
+
+    # Cancela os pré-carregamentos de um escopo (ou de todos) que ainda não terminaram
+    def cancel(self, scope=None):
+        for name in [scope] if scope is not None else list(self.scopes):
+            cancel, futures = self.scopes.pop(name, (None, []))
+            if cancel is not None:
+                cancel.set()
+            for future in futures:
+                future.cancel()
+
+    # Evento e futures ativos de um escopo
+    def scope(self, name):
+        if name not in self.scopes:
+            self.scopes[name] = (threading.Event(), [])
+        return self.scopes[name]
+
+
+# Função para obter os pré-carregamentos da sessão atual
+def _session():
+    session = st.session_state.get(SESSION_KEY)
+    if session is None:
+        session = st.session_state[SESSION_KEY] = SessionPrefetch()
+    return session
+
+
+# Função para cancelar os pré-carregamentos pendentes da sessão: no início de cada rerun
+# (o usuário foi para outro lugar) ou de um escopo, quando um fragmento reexecuta
+def cancel_pending(scope=None):
+    if enabled():
+        _session().cancel(scope)
+
+
+# Função para agendar um pré-carregamento task(cancel) no escopo da sessão atual
+def schedule(scope, key, task):
+    if not enabled():
+        return None
+    cancel, futures = _session().scope(scope)
+    futures[:] = [future for future in futures if not future.done()]
+    future = get_prefetcher().submit(key, task, cancel)
+    if future is not None:
+        futures.append(future)
+    return future
+
+
+# Função para aquecer uma página: importa o módulo e chama warm() se ele existir
+def warm_page(module_name, cancel):
+    module = importlib.import_module(module_name)
+    warm = getattr(module, "warm", None)
+    if warm is not None and not cancel.is_set():
+        warm(cancel)
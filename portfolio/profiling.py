@@ -0,0 +1,283 @@
+import functools
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+import streamlit as st
+from streamlit.delta_generator import DeltaGenerator
+
+from portfolio import settings  # noqa: F401 (carrega o .env)
+from portfolio.session_cache import get_registry
+from portfolio.settings import SALES_DB_ENV
+from portfolio.shared_cache import get_shared_cache
+
+# Variável de ambiente (ou entrada no .env) que liga a instrumentação
+ENV_VAR = "PORTFOLIO_PROFILE"
+
+# Chamadas do Streamlit cronometradas quando a instrumentação está ligada (tanto st.x
+# quanto os containers: st.sidebar.x, colunas, expanders)
+INSTRUMENTED_CALLS = ("markdown", "plotly_chart", "image", "dataframe", "metric", "progress")
+
+# Chave no session_state com as medições do último rerun só de fragmento de cada
+# fragmento (executado numa thread própria, fora do rerun do app.py)
+FRAGMENTS_KEY = "_perfil_fragmentos"
+
+# Espera máxima (segundos) pela vez de medir a memória; depois disso a seção só é cronometrada
+MEMORY_LOCK_TIMEOUT = 2.0
+
+# O pico do tracemalloc é do processo todo: as seções externas dos reruns (sessões
+# concorrentes, um fragmento com run_every junto de um rerun completo) medem a memória
+# uma de cada vez, para uma não zerar o pico da outra. Threads em segundo plano (pré-
+# carregamento, ingestão) só são cronometradas, mas suas alocações ainda podem entrar
+# no pico de uma seção medida ao mesmo tempo
+_memory_lock = threading.Lock()
+
+
+# Função para verificar se a instrumentação está ligada (o .env é lido em portfolio.settings)
+@functools.lru_cache(maxsize=1)
+def enabled():
+    return os.environ.get(ENV_VAR, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+# Agregados de tempo e memória por seção, compartilhados entre as sessões do processo
+class Profiler:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.stats = {}
+
+    # Acumula uma medição (duração em segundos, pico de memória em bytes ou None quando
+    # a memória não foi medida)
+    def record(self, kind, name, seconds, peak_bytes):
+        with self._lock:
+            entry = self.stats.setdefault((kind, name), {"calls": 0, "seconds": 0.0, "max_seconds": 0.0, "peak_bytes": None})
+            entry["calls"] += 1
+            entry["seconds"] += seconds
+            entry["max_seconds"] = max(entry["max_seconds"], seconds)
+            if peak_bytes is not None:
+                entry["peak_bytes"] = max(entry["peak_bytes"] or 0, peak_bytes)
+
+    def snapshot(self):
+        with self._lock:
+            return [{"kind": kind, "name": name, **entry} for (kind, name), entry in sorted(self.stats.items())]
+
+    # Exportação em JSON
+    def to_json(self):
+        return json.dumps(self.snapshot(), ensure_ascii=False, indent=2)
+
+    # Exportação no formato texto do Prometheus
+    def to_prometheus(self):
+        metrics = [
+            ("portfolio_render_calls_total", "counter", "Número de execuções", "calls"),
+            ("portfolio_render_seconds_total", "counter", "Tempo total de renderização em segundos", "seconds"),
+            ("portfolio_render_seconds_max", "gauge", "Maior tempo de uma execução em segundos", "max_seconds"),
+            ("portfolio_render_peak_bytes", "gauge", "Pico de memória alocada (tracemalloc) em bytes", "peak_bytes"),
+        ]
+        snapshot = self.snapshot()
+        lines = []
+        for metric, metric_type, description, field in metrics:
+            lines.append(f"# HELP {metric} {description}")
+            lines.append(f"# TYPE {metric} {metric_type}")
+            for entry in snapshot:
+                if entry[field] is None:
+                    continue
+                name = entry["name"].replace("\\", "\\\\").replace('"', '\\"')
+                lines.append(f'{metric}{{kind="{entry["kind"]}",name="{name}"}} {entry[field]}')
+        return "\n".join(lines) + "\n"
+
+
+# Instância única do agregador por processo
+@st.cache_resource(show_spinner=False)
+def get_profiler():
+    return Profiler()
+
+
+# Estado por thread (cada sessão executa o script na sua própria thread)
+_local = threading.local()
+
+
+# Pilha de seções abertas e medições do rerun atual desta thread; rerun_peak é o maior
+# pico das seções externas do rerun e fica None nas threads que não executam reruns
+def _state():
+    if not hasattr(_local, "stack"):
+        _local.stack = []
+        _local.records = []
+        _local.rerun_peak = None
+    return _local
+
+
+# Função para decidir se uma seção externa mede a memória: só nas threads de rerun e
+# depois de obter a vez (com limite de espera, para nunca travar o rerun)
+def _acquire_memory(state):
+    return state.rerun_peak is not None and _memory_lock.acquire(timeout=MEMORY_LOCK_TIMEOUT)
+
+
+# Mede tempo e pico de memória de um trecho; seções aninhadas propagam o pico para as externas
+@contextmanager
+def _measure(kind, name):
+    state = _state()
+    outermost = not state.stack
+    frame = {"peak": 0, "memory": _acquire_memory(state) if outermost else state.stack[-1]["memory"]}
+    if frame["memory"]:
+        if not outermost:
+            parent = state.stack[-1]
+            parent["peak"] = max(parent["peak"], tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+        frame["start_memory"] = tracemalloc.get_traced_memory()[0]
+    state.stack.append(frame)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - start
+        state.stack.pop()
+        peak_bytes = None
+        if frame["memory"]:
+            peak = max(frame["peak"], tracemalloc.get_traced_memory()[1])
+            peak_bytes = max(0, peak - frame["start_memory"])
+            if outermost:
+                _memory_lock.release()
+                state.rerun_peak = max(state.rerun_peak, peak_bytes)
+            else:
+                state.stack[-1]["peak"] = max(state.stack[-1]["peak"], peak)
+        # Só as threads de rerun guardam as medições para o painel (as demais nunca o mostram)
+        if state.rerun_peak is not None:
+            state.records.append({
+                "kind": kind, "name": name, "ms": seconds * 1000,
+                "peak_kb": None if peak_bytes is None else peak_bytes / 1024,
+            })
+        get_profiler().record(kind, name, seconds, peak_bytes)
+
+
+# Seção cronometrada (sem custo quando a instrumentação está desligada)
+def section(name, kind="section"):
+    return _measure(kind, name) if enabled() else nullcontext()
+
+
+# Envolve uma chamada do Streamlit para cronometrá-la como componente
+def _instrument(func, name):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with _measure("component", name):
+            return func(*args, **kwargs)
+    wrapper.__profiled__ = True
+    return wrapper
+
+
+# Função para instrumentar as chamadas do Streamlit (uma vez por processo): os métodos
+# do DeltaGenerator, usados pelos containers, e os atalhos st.x, que já estão ligados
+# ao container principal e não passam pelos métodos da classe
+@st.cache_resource(show_spinner=False)
+def _instrument_streamlit():
+    for call in INSTRUMENTED_CALLS:
+        for owner in (DeltaGenerator, st):
+            func = getattr(owner, call)
+            if not getattr(func, "__profiled__", False):
+                setattr(owner, call, _instrument(func, f"st.{call}"))
+    return True
+
+
+# Função para iniciar a medição de um rerun
+def start_rerun():
+    if not enabled():
+        return
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+    _instrument_streamlit()
+    state = _state()
+    state.stack.clear()
+    state.records = []
+    state.rerun_peak = 0
+    state.rerun_start = time.perf_counter()
+
+
+# Mede a execução de um fragmento: dentro do rerun do app.py é só uma seção; num rerun
+# só do fragmento (outra thread, sem o app.py) é medido como um rerun e as medições são
+# guardadas na sessão, para o painel de depuração mostrá-las no próximo rerun completo
+@contextmanager
+def _fragment_rerun(name):
+    if _state().stack:
+        with _measure("fragment", name):
+            yield
+        return
+    start_rerun()
+    state = _state()
+    try:
+        with _measure("fragment", name):
+            yield
+    finally:
+        seconds = time.perf_counter() - state.rerun_start
+        get_profiler().record("rerun", name, seconds, state.rerun_peak)
+        fragments = st.session_state.setdefault(FRAGMENTS_KEY, {})
+        fragments[name] = {"ms": seconds * 1000, "records": list(state.records)}
+
+
+# Fragmento cronometrado (sem custo quando a instrumentação está desligada)
+def fragment(name):
+    return _fragment_rerun(name) if enabled() else nullcontext()
+
+
+# Linhas da tabela do painel: as medições mais lentas (pico vazio quando a memória não
+# foi medida)
+def _table_rows(records, limit):
+    slowest = sorted(records, key=lambda record: -record["ms"])[:limit]
+    return [
+        {
+            "Tipo": r["kind"], "Nome": r["name"], "ms": round(r["ms"], 2),
+            "Pico (KB)": None if r["peak_kb"] is None else round(r["peak_kb"], 1),
+        }
+        for r in slowest
+    ]
+
+
+# Função para encerrar a medição do rerun e mostrar o painel de depuração na barra lateral
+def finish_rerun():
+    if not enabled():
+        return
+    state = _state()
+    seconds = time.perf_counter() - state.rerun_start
+    get_profiler().record("rerun", "app.py", seconds, state.rerun_peak)
+    records = list(state.records)
+
+    with st.sidebar.expander("⏱️ Perfil de renderização"):
+        st.caption(f"Rerun: {seconds * 1000:.1f} ms")
+        cache = get_registry().stats
+        st.caption(
+            f"Cache das sessões: {cache['hits']} acertos, {cache['misses']} falhas, "
+            f"{cache['evictions']} remoções, {cache['bytes'] / 1024:.0f} KB em {cache['sessions']} sessões"
+        )
+        shared = get_shared_cache()
+        if shared is not None:
+            shared_stats = shared.stats
+            st.caption(
+                f"Cache compartilhado: {shared_stats['hits']} acertos, {shared_stats['misses']} falhas, "
+                f"{shared_stats['writes']} gravações, {shared_stats['errors']} erros, "
+                f"{(shared_stats['bytes'] or 0) / 1024:.0f} KB em {shared_stats['entries']} entradas"
+            )
+        st.table(_table_rows(records, 15))
+        # Consultas ao banco de vendas, se o Dashboard já usou a fonte SQL neste processo
+        # (portfolio.database só é consultado se já tiver sido importado)
+        database = sys.modules.get("portfolio.database")
+        sales_db = os.environ.get(SALES_DB_ENV)
+        if database is not None and sales_db:
+            queries = database.get_sql_source(sales_db).query_stats()
+            if queries:
+                st.caption("Consultas ao banco de vendas")
+                st.table([
+                    {
+                        "Consulta": name, "Chamadas": entry["calls"],
+                        "ms médio": round(entry["seconds"] / entry["calls"] * 1000, 2),
+                        "ms máx": round(entry["max_seconds"] * 1000, 2), "Linhas": entry["rows"],
+                    }
+                    for name, entry in sorted(queries.items(), key=lambda item: -item[1]["seconds"])
+                ])
+        # Últimos reruns só de fragmento desta sessão (não passam pelo app.py)
+        for name, run in st.session_state.get(FRAGMENTS_KEY, {}).items():
+            st.caption(f"Último rerun do fragmento {name}: {run['ms']:.1f} ms")
+            st.table(_table_rows(run["records"], 5))
+        profiler = get_profiler()
+        st.download_button("Exportar JSON", profiler.to_json(), file_name="perfil.json", mime="application/json")
+        st.download_button("Exportar Prometheus", profiler.to_prometheus(), file_name="perfil.prom", mime="text/plain")
@@ -0,0 +1,140 @@
+import math
+import os
+import re
+import unicodedata
+from bisect import bisect_left
+from collections import Counter, defaultdict
+
+import streamlit as st
+
+from portfolio.catalog import CATALOG_PATH, load_catalog
+from portfolio.content import load_content
+from portfolio.settings import CACHE_MAX_ENTRIES
+from portfolio.shared_cache import shared
+
+# Palavras muito frequentes em português que não ajudam na busca
+STOPWORDS = frozenset("""
+a ao aos as com como da das de do dos e em entre na nas no nos o os ou para
+pela pelas pelo pelos por que se sem sou um uma umas uns
+""".split())
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+TAG_PATTERN = re.compile(r"<[^>]+>")
+
+# Parâmetros do ranqueamento BM25
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+# Função para normalizar texto: minúsculas e sem acentos ("Análise" -> "analise")
+def fold(text):
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+# Função para quebrar um texto em termos normalizados, sem HTML e stopwords
+def tokenize(text):
+    text = TAG_PATTERN.sub(" ", text)
+    return [token for token in TOKEN_PATTERN.findall(fold(text)) if token not in STOPWORDS]
+
+
+# Índice invertido com ranqueamento BM25; o último termo da consulta também
+# casa por prefixo, para resultados enquanto se digita
+class SearchIndex:
+    def __init__(self, documents):
+        self.documents = documents
+        self.postings = defaultdict(dict)
+        self.lengths = []
+        for doc_id, document in enumerate(documents):
+            terms = Counter(tokenize(f"{document['titulo']} {document['titulo']} {document['texto']}"))
+            for term, frequency in terms.items():
+                self.postings[term][doc_id] = frequency
+            self.lengths.append(sum(terms.values()))
+        self.postings = dict(self.postings)
+        self.vocabulary = sorted(self.postings)
+        self.average_length = (sum(self.lengths) / len(self.lengths)) if self.lengths else 0.0
+
+    def __len__(self):
+        return len(self.documents)
+
+    # Termos do vocabulário que começam com o prefixo (busca binária no vocabulário ordenado)
+    def expand_prefix(self, prefix):
+        start = bisect_left(self.vocabulary, prefix)
+        terms = []
+        for term in self.vocabulary[start:]:
+            if not term.startswith(prefix):
+                break
+            terms.append(term)
+        return terms
+
+    # Peso BM25 de um termo em todos os documentos que o contêm
+    def _score_term(self, term, scores):
+        postings = self.postings.get(term)
+        if not postings:
+            return
+        idf = math.log(1 + (len(self.documents) - len(postings) + 0.5) / (len(postings) + 0.5))
+        for doc_id, frequency in postings.items():
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * self.lengths[doc_id] / self.average_length)
+            scores[doc_id] += idf * frequency * (BM25_K1 + 1) / (frequency + norm)
+
+    # Documentos mais relevantes para a consulta, como (pontuação, documento)
+    def search(self, query, limit=10):
+        terms = tokenize(query)
+        if not terms:
+            return []
+        scores = defaultdict(float)
+        for term in terms[:-1]:
+            self._score_term(term, scores)
+        last = terms[-1]
+        for term in self.expand_prefix(last) or [last]:
+            self._score_term(term, scores)
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        return [(score, self.documents[doc_id]) for doc_id, score in ranked]
+
+
+# Seções do conteúdo indexadas pela busca (editar as demais não refaz o índice)
+INDEXED_SECTIONS = ("jornada", "formacao", "experiencias", "habilidades", "areas", "certificacoes")
+
+
+# Função para reunir os documentos pesquisáveis das páginas Sobre Mim, Habilidades e Projetos
+def collect_documents():
+    content = load_content()
+
+    documents = [{"pagina": "Sobre Mim", "titulo": "Minha Jornada", "texto": " ".join(content.jornada)}]
+    for formacao in content.formacao:
+        documents.append({"pagina": "Sobre Mim", "titulo": formacao.curso, "texto": f"{formacao.instituicao} {formacao.periodo}"})
+    for experiencia in content.experiencias:
+        documents.append({
+            "pagina": "Sobre Mim",
+            "titulo": experiencia.cargo,
+            "texto": f"{experiencia.empresa} {experiencia.periodo} {experiencia.descricao}",
+        })
+
+    documents.append({
+        "pagina": "Habilidades",
+        "titulo": "Habilidades Técnicas",
+        "texto": " ".join(skill.nome for skill in content.habilidades),
+    })
+    for area in content.areas:
+        documents.append({"pagina": "Habilidades", "titulo": area.titulo, "texto": f"{' '.join(area.tecnologias)} {area.descricao}"})
+    for certificacao in content.certificacoes:
+        documents.append({"pagina": "Habilidades", "titulo": certificacao.titulo, "texto": certificacao.emissor})
+
+    for project in load_catalog().projects:
+        texto = " ".join([project["categoria"], *project["tecnologias"], str(project["ano"]), project["descricao"], *project["recursos"]])
+        documents.append({"pagina": "Projetos", "titulo": project["titulo"], "texto": texto})
+    return documents
+
+
+# Índice construído uma vez por processo (refeito se o catálogo de projetos ou uma das
+# seções indexadas do conteúdo mudar) ou lido do cache compartilhado, se outro processo
+# já o construiu
+@st.cache_resource(max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+@shared("busca")
+def _build_index(catalog_version, content_version):
+    return SearchIndex(collect_documents())
+
+
+# Função para obter o índice de busca
+def get_search_index():
+    return _build_index(os.stat(CATALOG_PATH).st_mtime_ns, load_content().version(*INDEXED_SECTIONS))
@@ -0,0 +1,201 @@
+import itertools
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict
+
+import streamlit as st
+
+from portfolio.settings import SESSION_CACHE_BUDGET, SESSION_CACHE_IDLE, SESSION_CACHE_MAX_ENTRIES
+
+# Chave do cache no estado da sessão
+SESSION_KEY = "_session_cache"
+
+
+# Função para estimar o tamanho em memória de um resultado; pandas, numpy e pyarrow
+# só são consultados se já tiverem sido importados
+def _sizeof(value):
+    pd = sys.modules.get("pandas")
+    if pd is not None and isinstance(value, (pd.DataFrame, pd.Series)):
+        return int(value.memory_usage(deep=True).sum()) if isinstance(value, pd.DataFrame) else int(value.memory_usage(deep=True))
+    if hasattr(value, "nbytes"):
+        return int(value.nbytes)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(_sizeof(k) + _sizeof(v) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(_sizeof(v) for v in value)
+    return sys.getsizeof(value)
+
+
+# Função para normalizar um valor de filtro (listas e conjuntos viram tuplas ordenadas)
+def _normalize(value):
+    if isinstance(value, (list, tuple)):
+        return tuple(_normalize(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(_normalize(v) for v in value))
+    if isinstance(value, dict):
+        return tuple(sorted((k, _normalize(v)) for k, v in value.items()))
+    return value
+
+
+# Função para montar a chave normalizada de um resultado: espaço de nomes e filtros
+# em ordem alfabética, de modo que a ordem dos argumentos não importa
+def cache_key(namespace, **filters):
+    return (namespace, tuple(sorted((name, _normalize(value)) for name, value in filters.items())))
+
+
+# Cache LRU de resultados de uma sessão; a contabilidade de memória fica no registro
+# global, que pode remover entradas de sessões ociosas quando o orçamento estoura
+class SessionCache:
+    def __init__(self, session_id, max_entries=SESSION_CACHE_MAX_ENTRIES):
+        self.session_id = session_id
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.last_access = time.monotonic()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    # Remove a entrada menos usada; devolve os bytes liberados
+    def pop_oldest(self):
+        _, (_, size) = self.entries.popitem(last=False)
+        self.bytes -= size
+        self.evictions += 1
+        return size
+
+    @property
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self.entries),
+            "bytes": self.bytes,
+        }
+
+
+# Registro dos caches de todas as sessões do processo, com orçamento de memória global
+class SessionCacheRegistry:
+    def __init__(self, budget=SESSION_CACHE_BUDGET, idle_seconds=SESSION_CACHE_IDLE):
+        self.budget = budget
+        self.idle_seconds = idle_seconds
+        self._caches = weakref.WeakValueDictionary()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    # Novo cache para uma sessão (o registro só guarda uma referência fraca)
+    def new_cache(self, max_entries=SESSION_CACHE_MAX_ENTRIES):
+        with self._lock:
+            cache = SessionCache(next(self._ids), max_entries)
+            self._caches[cache.session_id] = cache
+            return cache
+
+    @property
+    def total_bytes(self):
+        return sum(cache.bytes for cache in list(self._caches.values()))
+
+    # Busca um resultado; None (com falha contabilizada) se não estiver no cache
+    def get(self, cache, key):
+        with self._lock:
+            cache.last_access = time.monotonic()
+            entry = cache.entries.get(key)
+            if entry is None:
+                cache.misses += 1
+                return None
+            cache.entries.move_to_end(key)
+            cache.hits += 1
+            return entry
+
+    def __contains__(self, item):
+        cache, key = item
+        with self._lock:
+            return key in cache.entries
+
+    # Guarda um resultado, respeitando o limite da sessão e o orçamento global
+    def put(self, cache, key, value):
+        size = _sizeof(value)
+        with self._lock:
+            if key in cache.entries:
+                cache.bytes -= cache.entries.pop(key)[1]
+            cache.entries[key] = (value, size)
+            cache.bytes += size
+            while len(cache.entries) > cache.max_entries:
+                cache.pop_oldest()
+            self._enforce_budget(cache)
+
+    # Sob pressão, esvazia por inteiro as sessões ociosas e, se ainda faltar espaço,
+    # remove as entradas menos usadas das sessões há mais tempo sem acesso (a sessão
+    # atual por último)
+    def _enforce_budget(self, current):
+        total = self.total_bytes
+        if total <= self.budget:
+            return
+        now = time.monotonic()
+        others = sorted(
+            (cache for cache in list(self._caches.values()) if cache is not current and cache.entries),
+            key=lambda cache: cache.last_access,
+        )
+        for cache in others:
+            if now - cache.last_access >= self.idle_seconds:
+                while cache.entries:
+                    total -= cache.pop_oldest()
+        for cache in [*others, current]:
+            # Nunca remove a entrada que acabou de ser guardada
+            while total > self.budget and len(cache.entries) > (1 if cache is current else 0):
+                total -= cache.pop_oldest()
+
+    @property
+    def stats(self):
+        with self._lock:
+            caches = list(self._caches.values())
+            totals = {"sessions": len(caches), "hits": 0, "misses": 0, "evictions": 0, "entries": 0, "bytes": 0}
+            for cache in caches:
+                for field, value in cache.stats.items():
+                    totals[field] += value
+            totals["budget"] = self.budget
+            return totals
+
+
+# Instância única do registro por processo
+@st.cache_resource(show_spinner=False)
+def get_registry():
+    return SessionCacheRegistry()
+
+
+# Função para obter o cache da sessão atual (criado no primeiro uso)
+def session_cache():
+    cache = st.session_state.get(SESSION_KEY)
+    if cache is None:
+        cache = st.session_state[SESSION_KEY] = get_registry().new_cache()
+    return cache
+
+
+# Função para obter um resultado do cache da sessão ou calculá-lo com compute() na
+# primeira vez; os filtros (e a versão dos dados) formam a chave
+def session_cached(namespace, compute, **filters):
+    registry = get_registry()
+    cache = session_cache()
+    key = cache_key(namespace, **filters)
+    entry = registry.get(cache, key)
+    if entry is not None:
+        return entry[0]
+    value = compute()
+    registry.put(cache, key, value)
+    return value
+
+
+# Função para preencher o cache de uma sessão fora do rerun (pré-carregamento em outra
+# thread, sem acesso ao st.session_state); não conta como acerto nem falha
+def prefill(cache, namespace, compute, **filters):
+    registry = get_registry()
+    key = cache_key(namespace, **filters)
+    if (cache, key) in registry:
+        return None
+    value = compute()
+    registry.put(cache, key, value)
+    return value
@@ -0,0 +1,48 @@
+import os
+
+# Diretórios do projeto
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(ROOT_DIR, "data")
+ASSETS_DIR = os.path.join(ROOT_DIR, "assets")
+STATIC_DIR = os.path.join(ROOT_DIR, "static")
+STATIC_URL = "app/static"
+CACHE_DIR = os.path.join(ROOT_DIR, ".cache")
+
+# Política do cache: tempo de vida (segundos) e número máximo de entradas
+CACHE_TTL = 3600
+CACHE_MAX_ENTRIES = 32
+
+# Cache de resultados por sessão: entradas por sessão, orçamento de memória somando
+# todas as sessões (bytes) e tempo sem uso (segundos) para uma sessão ser considerada ociosa
+SESSION_CACHE_MAX_ENTRIES = 32
+SESSION_CACHE_BUDGET = 64 * 1024 * 1024
+SESSION_CACHE_IDLE = 300
+
+# Pré-carregamento em segundo plano da próxima página e dos intervalos vizinhos
+# (ligado por padrão; PORTFOLIO_PREFETCH=0 desliga)
+PREFETCH_ENV = "PORTFOLIO_PREFETCH"
+
+# Fonte de vendas grande (CSV/Parquet) lida em streaming pelo Dashboard Demo
+SALES_PATH_ENV = "PORTFOLIO_SALES_PATH"
+
+# Banco de vendas (URL sqlite:///arquivo ou postgresql://...) consultado pelo Dashboard Demo
+SALES_DB_ENV = "PORTFOLIO_SALES_DB"
+
+# Feed ao vivo do Dashboard Demo: CSV que só cresce (seguido como tail -f) ou um socket
+# local tcp://host:porta que recebe as linhas
+LIVE_FEED_ENV = "PORTFOLIO_LIVE_FEED"
+
+# Cache em disco compartilhado entre os processos (vários workers atrás de um proxy):
+# desligado por padrão; PORTFOLIO_SHARED_CACHE=1 usa .cache/shared.sqlite e outro
+# valor é o caminho do arquivo. Tempo de vida (segundos) e tamanho máximo (bytes)
+SHARED_CACHE_ENV = "PORTFOLIO_SHARED_CACHE"
+SHARED_CACHE_TTL = CACHE_TTL
+SHARED_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Variáveis do arquivo .env (se python-dotenv estiver instalado)
+try:
+    from dotenv import load_dotenv
+except ImportError:
+    pass
+else:
+    load_dotenv(os.path.join(ROOT_DIR, ".env"))
@@ -0,0 +1,206 @@
+import functools
+import hashlib
+import json
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+
+from portfolio.settings import CACHE_DIR, SHARED_CACHE_ENV, SHARED_CACHE_MAX_BYTES, SHARED_CACHE_TTL
+
+logger = logging.getLogger(__name__)
+
+# Arquivo padrão do cache compartilhado (PORTFOLIO_SHARED_CACHE=1)
+DEFAULT_PATH = os.path.join(CACHE_DIR, "shared.sqlite")
+
+# Espera (segundos) por um lock de escrita de outro processo antes de desistir
+BUSY_TIMEOUT = 5.0
+
+# Fração do orçamento que uma única entrada pode ocupar; maiores não são gravadas
+MAX_ENTRY_FRACTION = 0.25
+
+# Precisão (segundos) do último acesso usado na remoção das menos usadas: uma leitura só
+# grava o acesso quando o registrado é mais antigo que isso, então quase todos os
+# acertos são só leitura e não disputam o lock de escrita com os outros workers
+TOUCH_INTERVAL = 60.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires REAL NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+"""
+
+
+# Versão do código do pacote (data de modificação dos módulos): entradas gravadas por
+# outra versão do aplicativo, antes de um deploy, nunca são reaproveitadas
+@functools.lru_cache(maxsize=1)
+def code_version():
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    stamps = []
+    for root, _, files in os.walk(package_dir):
+        for name in sorted(files):
+            if name.endswith(".py"):
+                path = os.path.join(root, name)
+                stamps.append((os.path.relpath(path, package_dir), os.stat(path).st_mtime_ns))
+    return hashlib.sha256(repr(sorted(stamps)).encode("utf-8")).hexdigest()[:16]
+
+
+# Função para montar a chave de uma entrada: espaço de nomes, versão do código e
+# argumentos serializados de forma estável (a versão dos dados deve estar nos argumentos)
+def cache_key(namespace, *parts):
+    encoded = json.dumps([code_version(), parts], sort_keys=True, default=repr, ensure_ascii=False)
+    return f"{namespace}:{hashlib.sha256(encoded.encode('utf-8')).hexdigest()}"
+
+
+# Cache em disco compartilhado entre os processos do Streamlit (um SQLite em modo WAL):
+# cada worker consulta o cache antes de recalcular e grava o que calculou, com tempo de
+# vida por entrada e remoção das menos usadas quando o tamanho total passa do orçamento.
+# Falhas no banco (disco cheio, lock demorado) só viram um recálculo local
+class SharedCache:
+    def __init__(self, path=DEFAULT_PATH, ttl=SHARED_CACHE_TTL, max_bytes=SHARED_CACHE_MAX_BYTES):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.counts = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0, "errors": 0}
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._connect() as connection:
+            connection.executescript(SCHEMA)
+
+    # Uma conexão por thread (conexões SQLite não devem ser compartilhadas entre threads)
+    def _connect(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def _count(self, name, n=1):
+        with self._lock:
+            self.counts[name] += n
+
+    # Valor de uma entrada válida, ou None (com found=False) se não existir ou tiver expirado
+    def get(self, key):
+        try:
+            connection = self._connect()
+            row = connection.execute("SELECT value, expires, accessed FROM entries WHERE key = ?", (key,)).fetchone()
+            now = time.time()
+            if row is None or row[1] < now:
+                self._count("misses")
+                return None, False
+            if row[2] < now - TOUCH_INTERVAL:
+                connection.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+            value = pickle.loads(row[0])
+        except (sqlite3.Error, pickle.UnpicklingError, EOFError, AttributeError, ImportError) as exc:
+            self._count("errors")
+            logger.warning("Falha ao ler o cache compartilhado (%s): %s", key, exc)
+            return None, False
+        self._count("hits")
+        return value, True
+
+    # Grava uma entrada e remove expiradas e, se preciso, as menos usadas
+    def set(self, key, value, ttl=None):
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError) as exc:
+            logger.warning("Valor não serializável para o cache compartilhado (%s): %s", key, exc)
+            return False
+        if len(data) > self.max_bytes * MAX_ENTRY_FRACTION:
+            return False
+        now = time.time()
+        try:
+            connection = self._connect()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.execute(
+                    "INSERT OR REPLACE INTO entries (key, value, size, expires, accessed) VALUES (?, ?, ?, ?, ?)",
+                    (key, data, len(data), now + (self.ttl if ttl is None else ttl), now),
+                )
+                evicted = self._evict(connection, now)
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        except sqlite3.Error as exc:
+            self._count("errors")
+            logger.warning("Falha ao gravar no cache compartilhado (%s): %s", key, exc)
+            return False
+        self._count("writes")
+        self._count("evictions", evicted)
+        return True
+
+    # Remove as expiradas e depois as menos acessadas até caber no orçamento
+    def _evict(self, connection, now):
+        evicted = connection.execute("DELETE FROM entries WHERE expires < ?", (now,)).rowcount
+        total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return evicted
+        for key, size in connection.execute("SELECT key, size FROM entries ORDER BY accessed").fetchall():
+            if total <= self.max_bytes:
+                break
+            connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+            total -= size
+            evicted += 1
+        return evicted
+
+    # Valor do cache ou calculado por compute() (e gravado para os outros processos)
+    def get_or_compute(self, key, compute, ttl=None):
+        value, found = self.get(key)
+        if found:
+            return value
+        value = compute()
+        self.set(key, value, ttl)
+        return value
+
+    def clear(self):
+        self._connect().execute("DELETE FROM entries")
+
+    @property
+    def stats(self):
+        with self._lock:
+            counts = dict(self.counts)
+        try:
+            entries, size = self._connect().execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        except sqlite3.Error:
+            entries, size = None, None
+        return {**counts, "entries": entries, "bytes": size}
+
+
+# Função para obter o cache compartilhado do processo, ou None se estiver desligado
+# (PORTFOLIO_SHARED_CACHE vazio ou 0; 1 usa o arquivo padrão, outro valor é o caminho)
+@functools.lru_cache(maxsize=1)
+def get_shared_cache():
+    value = os.environ.get(SHARED_CACHE_ENV, "").strip()
+    if value.lower() in ("", "0", "false", "no", "off"):
+        return None
+    path = DEFAULT_PATH if value.lower() in ("1", "true", "yes", "on") else value
+    try:
+        return SharedCache(path)
+    except (OSError, sqlite3.Error) as exc:
+        logger.warning("Cache compartilhado desativado (%s): %s", path, exc)
+        return None
+
+
+# Decorador que consulta o cache compartilhado antes de executar a função; a chave
+# inclui o módulo, o nome e os argumentos (que devem identificar a versão dos dados)
+def shared(namespace, ttl=None):
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            cache = get_shared_cache()
+            if cache is None:
+                return func(*args, **kwargs)
+            key = cache_key(namespace, func.__module__, func.__qualname__, args, kwargs)
+            return cache.get_or_compute(key, lambda: func(*args, **kwargs), ttl)
+        return wrapper
+    return decorator
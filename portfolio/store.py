@@ -0,0 +1,138 @@
+import hashlib
+import os
+import threading
+import weakref
+
+import pyarrow as pa
+import streamlit as st
+
+from portfolio.settings import CACHE_DIR
+from portfolio.shared_cache import code_version
+
+# Arquivos Arrow IPC compartilhados por todos os processos do mesmo host
+ARROW_DIR = os.path.join(CACHE_DIR, "arrow")
+
+
+# Tabela publicada no armazenamento: arquivo Arrow mapeado em memória e sessões que a usam
+class SharedTable:
+    def __init__(self, name, version, path):
+        self.name = name
+        self.version = version
+        self.path = path
+        self.source = pa.memory_map(path, "r")
+        self.table = pa.ipc.open_file(self.source).read_all()
+        self.owners = set()
+
+    def close(self):
+        self.table = None
+        self.source.close()
+
+
+# Armazenamento somente leitura de tabelas Arrow mapeadas em memória. Cada conjunto de
+# dados é carregado uma vez por processo e o arquivo mapeado é compartilhado pelo page
+# cache entre processos; as sessões recebem a mesma tabela (fatias sem cópia) e são
+# contadas como referências, para que versões antigas sejam fechadas quando ninguém
+# mais as usa
+class ArrowStore:
+    def __init__(self, directory=ARROW_DIR):
+        self.directory = directory
+        self._tables = {}
+        self._retired = []
+        self._lock = threading.Lock()
+
+    # Arquivo Arrow de uma versão: o nome vem da versão dos dados e do código, então um
+    # arquivo já publicado por outro processo é reaproveitado sem reconstruir a tabela
+    def _path(self, name, version):
+        key = hashlib.sha256(repr((code_version(), version)).encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.directory, f"{name}.{key}.arrow")
+
+    # Grava o arquivo Arrow direto no disco, sem serializar a tabela inteira na memória
+    # (o arquivo temporário só é renomeado depois de completo)
+    def _write(self, path, df):
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with pa.OSFile(tmp_path, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        os.replace(tmp_path, path)
+
+    # Tabela de um conjunto de dados numa versão; build() só roda se nenhum processo
+    # tiver publicado a versão ainda
+    def _load(self, name, version, build):
+        shared = self._tables.get(name)
+        if shared is not None and shared.version == version:
+            return shared
+        path = self._path(name, version)
+        if not os.path.exists(path):
+            self._write(path, build())
+        shared_new = SharedTable(name, version, path)
+        if shared is not None:
+            self._retired.append(shared)
+        self._tables[name] = shared_new
+        self._collect()
+        return shared_new
+
+    # Fecha as versões antigas que nenhuma sessão usa mais e remove seus arquivos
+    # (outros processos que ainda os mapeiam continuam válidos até fecharem)
+    def _collect(self):
+        current_paths = {shared.path for shared in self._tables.values()}
+        for shared in [s for s in self._retired if not s.owners]:
+            shared.close()
+            self._retired.remove(shared)
+            if shared.path not in current_paths and os.path.exists(shared.path):
+                os.remove(shared.path)
+
+    # Tabela compartilhada para uma sessão (registrada como referência)
+    def acquire(self, name, version, build, owner):
+        with self._lock:
+            shared = self._load(name, version, build)
+            shared.owners.add(owner)
+            return shared.table
+
+    # Libera todas as referências de uma sessão
+    def release(self, owner):
+        with self._lock:
+            for shared in [*self._tables.values(), *self._retired]:
+                shared.owners.discard(owner)
+            self._collect()
+
+    @property
+    def stats(self):
+        with self._lock:
+            return {
+                name: {
+                    "version": shared.version,
+                    "path": shared.path,
+                    "rows": shared.table.num_rows,
+                    "bytes": shared.table.nbytes,
+                    "sessions": len(shared.owners),
+                }
+                for name, shared in self._tables.items()
+            }
+
+
+# Instância única do armazenamento por processo
+@st.cache_resource(show_spinner=False)
+def get_store():
+    return ArrowStore()
+
+
+# Marca de presença da sessão: quando o estado da sessão é descartado, a marca é
+# coletada e as referências da sessão são liberadas
+class _SessionToken:
+    pass
+
+
+# Função para obter a tabela compartilhada de um conjunto de dados na sessão atual
+def session_table(name, version, build):
+    store = get_store()
+    token = st.session_state.get("_arrow_store_token")
+    if token is None:
+        token = st.session_state["_arrow_store_token"] = _SessionToken()
+        weakref.finalize(token, store.release, id(token))
+    return store.acquire(name, version, build, id(token))
+
+
+# Função para obter uma fatia de linhas da tabela (sem cópia)
+def table_slice(table, rows):
+    return table.slice(rows.start, rows.stop - rows.start)
@@ -0,0 +1,32 @@
+import os
+
+import streamlit as st
+
+from portfolio.assets import inline_stylesheet, stylesheet_url
+from portfolio.components import badge
+
+# CSS personalizado: a folha de estilos é um arquivo estático com hash no nome,
+# baixado uma vez e mantido em cache pelo navegador; a cada rerun só o <link> é enviado
+def local_css():
+    if os.environ.get("PORTFOLIO_INLINE_CSS"):
+        st.markdown(f"<style>{inline_stylesheet()}</style>", unsafe_allow_html=True)
+    else:
+        st.markdown(f'<link rel="stylesheet" href="{stylesheet_url()}">', unsafe_allow_html=True)
+
+# Função para criar badges de habilidades (template memoizado em portfolio.components)
+def create_badge(text):
+    return badge(text)
+
+# Função para criar divisor
+def create_divider():
+    return '<div class="divider"></div>'
+
+# Função para mostrar barra de habilidades
+def show_skill_bar(label, percentage):
+    st.markdown(f"**{label}**")
+    st.progress(percentage/100)
+
+# Função para criar container com animação
+def animated_container(content, key):
+    with st.container():
+        st.markdown(f'<div class="highlight-container fade-in">{content}</div>', unsafe_allow_html=True)
@@ -0,0 +1,58 @@
+import threading
+
+import numpy as np
+
+from portfolio.live import LiveRollups, parse_rows, tail_file
+
+HEADER = ["Data", "Vendas", "Marketing", "Custos"]
+
+
+# Linha com métricas válidas e data inválida não pode deixar valores sem data no lote
+def test_parse_rows_descarta_linha_com_data_invalida():
+    store = LiveRollups()
+    days, values = parse_rows(HEADER, ["2024-01-01,100,1,1", "2024-13-45,999,9,9", "2024-01-02,200,2,2"], store)
+    assert store.rejected == 1
+    assert len(days) == 2
+    assert all(len(column) == 2 for column in values.values())
+    store.append(days, values)
+    rollup, _ = store.rollup("day")
+    assert rollup.sums["Vendas"].tolist() == [100, 200]
+
+
+# Linhas malformadas ou com bytes que não são UTF-8 não interrompem o arquivo seguido
+def test_tail_file_continua_apos_linhas_invalidas(tmp_path):
+    path = tmp_path / "ao_vivo.csv"
+    path.write_bytes(
+        b"Data,Vendas,Marketing,Custos\n"
+        b"2024-01-01,100,1,1\n"
+        b"2024-13-45,999,9,9\n"
+        b"\xff\xfe,1,1,1\n"
+        b"2024-01-02,200,2,2\n"
+    )
+    store = LiveRollups()
+    stop = threading.Event()
+    reader = threading.Thread(target=tail_file, args=(str(path), store, stop), daemon=True)
+    reader.start()
+    for _ in range(50):
+        if store.rows + store.rejected >= 4:
+            break
+        stop.wait(0.05)
+    stop.set()
+    reader.join(timeout=5)
+    assert store.rows == 2
+    assert store.rejected == 2
+    rollup, _ = store.rollup("day")
+    assert np.array_equal(rollup.sums["Vendas"], [100, 200])
+
+
+# A janela do painel traz só os últimos períodos, mas os totais de todo o histórico
+def test_window_copia_so_os_ultimos_periodos():
+    store = LiveRollups()
+    days = np.datetime64("2024-01-01", "D").astype(np.int64) + np.arange(10)
+    store.append(days, {metric: np.full(10, 10.0) for metric in store.metrics})
+    rollup, totals, version = store.window("day", 3)
+    assert len(rollup) == 3
+    assert rollup.sums["Vendas"].tolist() == [10, 10, 10]
+    assert str(rollup.keys[0].astype("datetime64[D]")) == "2024-01-08"
+    assert totals["Vendas"] == 100
+    assert version == store.version